@@ -28,12 +28,108 @@ API_KEY_MARS_ROVER_PHOTOS = os.getenv("API_KEY_MARS_ROVER_PHOTOS")  # Web Servic
 URL_CLOSEST_APPROACH_ASTEROIDS = "https://api.nasa.gov/neo/rest/v1/feed?"
 API_KEY_CLOSEST_APPROACH_ASTEROIDS = os.getenv("API_KEY_CLOSEST_APPROACH_ASTEROIDS")
 
+# Define constants for the number of days (after today) covered by an approaching-asteroids refresh (NeoWs limit: 7 days per
+# request), and the number of hours after which an already-fetched close-approach date is deemed expired and re-requested:
+APPROACHING_ASTEROIDS_REFRESH_WINDOW_DAYS = 7
+APPROACHING_ASTEROIDS_DAY_EXPIRY_HOURS = 24
+
+# Define constants for fetching a long range of close-approach dates (one API request per 7-day window): the maximum number of
+# concurrent API requests, and the maximum number of requests per range fetch (API key limit: 1,000 requests/hour):
+APPROACHING_ASTEROIDS_MAX_CONCURRENT_REQUESTS = 4
+APPROACHING_ASTEROIDS_MAX_REQUESTS_PER_RANGE = 1000
+
+# Define dictionary of rate limits by upstream API (per the limits documented above), each expressed as token buckets of
+# (requests allowed, period in seconds).  Tokens are acquired (see "get_rate_limit_token") before every request; APIs with
+# no documented limits have no buckets.  (The Mars photos service-wide limit of 1,000 requests/hour is subsumed by the
+# API key's limit of 30 requests/hour.):
+rate_limits = {
+    "approaching_asteroids": [(1000, 3600)],
+    "astronomy_pic_of_the_day": [(1000, 3600)],
+    "confirmed_planets": [],
+    "geocode": [(1, 1), (5000, 86400)],
+    "iss_location": [],
+    "mars_photos": [(30, 3600), (50, 86400)],
+    "people_in_space_now": [],
+    "space_news": []
+}
+
+# Define constant for the number of attempts made to take a token from the shared rate-limit buckets (each attempt failing only
+# if another process updated the buckets concurrently) before the request is allowed to proceed:
+RATE_LIMIT_TOKEN_MAX_ATTEMPTS = 10
+
+# Define dictionary of inbound rate limits by route (endpoint), each expressed as token buckets of (requests allowed, period in
+# seconds) per client address.  Submissions (POST requests) to these routes are throttled before any form validation, password
+# hashing, or e-mailing occurs:
+inbound_rate_limits = {
+    "admin_login": [(5, 60), (20, 3600)],
+    "contact": [(3, 60), (10, 3600)]
+}
+
+# Define constant for whether the inbound rate-limit buckets are shared across processes (stored, like the upstream buckets, in the
+# "rate_limit_buckets" database table) rather than kept in-process, and the number of client buckets kept in-process before
+# those which have refilled are discarded:
+INBOUND_RATE_LIMITS_SHARED = os.getenv("INBOUND_RATE_LIMITS_SHARED", "false").lower() == "true"
+INBOUND_RATE_LIMITS_MAX_CLIENTS = 10000
+
+# Create dictionary to store (in-process) the inbound rate-limit buckets (each a dictionary of tokens held and date/time updated),
+# by (client route key, period in seconds):
+rate_limit_buckets = {}
+
+# Define constant for the timeout (in seconds) applied to every request made of an upstream API, so that an unresponsive
+# upstream cannot tie up the thread serving a page:
+UPSTREAM_REQUEST_TIMEOUT_SECONDS = 10
+
+# Define constants for the circuit breakers guarding the upstream APIs serving live data (see "get_upstream_payload"): the number
+# of consecutive failed (or slow) requests after which an upstream's circuit opens, the number of seconds beyond which a request
+# is deemed slow, and the number of seconds between background probes of an upstream whose circuit is open:
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_SLOW_CALL_SECONDS = 5
+CIRCUIT_BREAKER_PROBE_INTERVAL_SECONDS = 30
+
+# Create dictionary to store (in-process) the state of the circuit breaker for each upstream API:
+circuit_breakers = {}
+
+# Define constant for coalescing concurrent identical requests of an upstream API (see "get_upstream_payload_single_flight"): the
+# number of seconds after which the wait for another process's lock file for a request in flight is abandoned:
+UPSTREAM_FLIGHT_LOCK_WAIT_SECONDS = 2 * UPSTREAM_REQUEST_TIMEOUT_SECONDS
+
+# Create dictionary to store (in-process) the upstream requests in flight, by flight key (the upstream's name plus any parameters):
+upstream_flights = {}
+
 # Define constants for the URL and API key to use in API requests to yield the astronomy picture of the day:
 URL_ASTRONOMY_PIC_OF_THE_DAY = "https://api.nasa.gov/planetary/apod"
 API_KEY_ASTRONOMY_PIC_OF_THE_DAY = os.getenv("API_KEY_ASTRONOMY_PIC_OF_THE_DAY")
 
-# Define constant for the URL to use in API requests to yield a listing of confirmed planets:
-URL_CONFIRMED_PLANETS = "https://exoplanetarchive.ipac.caltech.edu/TAP/sync?query=select+distinct+hostname+,+sy_snum+,+sy_pnum+,+pl_name+,+disc_year+,+discoverymethod+,+disc_facility+,+disc_telescope+from+ps+where+soltype+=+'Published Confirmed'+order+by+hostname+,+pl_name+&format=json"
+# Define constants for the URL (TAP service) and the query parts to use in API requests to yield a listing of confirmed planets
+# (the query is assembled, with any optional filters pushed down into its "where" clause, by "build_confirmed_planets_query"):
+URL_CONFIRMED_PLANETS = "https://exoplanetarchive.ipac.caltech.edu/TAP/sync"
+CONFIRMED_PLANETS_QUERY_SELECT = "select distinct hostname, sy_snum, sy_pnum, pl_name, disc_year, discoverymethod, disc_facility, disc_telescope from ps"
+CONFIRMED_PLANETS_QUERY_WHERE = "soltype = 'Published Confirmed'"
+CONFIRMED_PLANETS_QUERY_ORDER_BY = "order by hostname, pl_name"
+
+# Define constant for the number of hours after which a discovery year's confirmed planets are re-requested on demand (i.e.,
+# when a user selects that year on the "Confirmed Planets" page):
+CONFIRMED_PLANETS_ON_DEMAND_REFRESH_HOURS = 24
+
+# Define constants for on-demand refreshes of a discovery year's confirmed planets (run in the background): the number of
+# seconds for which a refresh in progress is claimed, and the delay before a failed refresh is retried (doubling with each
+# consecutive failure, up to the maximum):
+CONFIRMED_PLANETS_ON_DEMAND_CLAIM_SECONDS = 300
+CONFIRMED_PLANETS_ON_DEMAND_RETRY_BASE_SECONDS = 300
+CONFIRMED_PLANETS_ON_DEMAND_RETRY_MAX_SECONDS = 21600
+
+# Define constant for the number of confirmed-planet rows to be parsed (from the streamed API response) and inserted into
+# the database per chunk, to keep memory use bounded regardless of the size of the archive:
+CONFIRMED_PLANETS_CHUNK_SIZE = 1000
+
+# Define constant for the number of Mars photo detail rows copied per chunk when migrating the "mars_photo_details" database
+# table from its original (denormalized, string-typed) structure:
+MARS_PHOTO_DETAILS_MIGRATION_CHUNK_SIZE = 10000
+
+# Define constants for the Mars photos sync queue: the maximum number of attempts made for a rover / earth date combo before it is
+# deemed failed, and the number of seconds for which combos are deferred after the API reports its quota as exhausted (HTTP 429):
+MARS_PHOTOS_SYNC_MAX_ATTEMPTS = 5
+MARS_PHOTOS_SYNC_QUOTA_WINDOW_SECONDS = 3600
 
 # Define constants for URLs pertaining to the websites which offer maps and other details for constellations:
 URL_CONSTELLATION_MAP_SITE = "https://www.go-astronomy.com/constellations.htm"
@@ -50,9 +146,70 @@ SENDER_PASSWORD_GMAIL = os.getenv("SENDER_PASSWORD_GMAIL") # App password (for t
 SENDER_HOST = os.getenv("SENDER_HOST")
 SENDER_PORT = str(os.getenv("SENDER_PORT"))
 
+# Define constant for whether the connection to the e-mail server is secured via STARTTLS (disable only when sending via a local
+# SMTP stand-in for testing, e.g., "python -m aiosmtpd -n -l localhost:8025"; login is likewise skipped if no password is set):
+SENDER_USE_STARTTLS = os.getenv("SENDER_USE_STARTTLS", "true").lower() != "false"
+
+# Define constants for the contact outbox (messages submitted via the "Contact Us" web page, e-mailed by a background sender):
+# the maximum number of messages sent per batch, the number of seconds for which a message being sent is claimed (so that only
+# one process serving this website sends it; if its sending does not complete, it is retried thereafter), the maximum number
+# of attempts made to send a message before it is deemed failed, the interval (in seconds) at which the outbox is checked if
+# the sender is not woken by a new message, the initial and maximum retry delays (in seconds; doubled with each failed attempt),
+# and the number of seconds after which an idle connection to the e-mail server is closed:
+CONTACT_OUTBOX_BATCH_SIZE = 20
+CONTACT_OUTBOX_CLAIM_SECONDS = 300
+CONTACT_OUTBOX_MAX_ATTEMPTS = 8
+CONTACT_OUTBOX_POLL_SECONDS = 30
+CONTACT_OUTBOX_RETRY_BASE_SECONDS = 30
+CONTACT_OUTBOX_RETRY_MAX_SECONDS = 3600
+CONTACT_OUTBOX_SMTP_IDLE_SECONDS = 120
+
+# Define constant for whether this website runs headless (e.g., under a WSGI server such as gunicorn), i.e., without showing
+# desktop dialogs (progress and prompts during administrative updates) or opening spreadsheet files on the desktop:
+HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+
+# Create dictionary to store the desktop GUI toolkit's app. object (created when the first desktop dialog is shown, and kept
+# for as long as this website runs):
+dialogs = {}
+
 # Define constant for web page loading-time allowance (in seconds) for the web-scrapers:
 WEB_LOADING_TIME_ALLOWANCE = 5
 
+# Define constants for the database connection: the database URI (by default, a SQLite database file relative to the app's
+# instance folder; e.g., a PostgreSQL URI for deployments with multiple workers or hosts sharing one database), and the sizing
+# and health-checking of the connection pool (pool size and overflow apply to databases other than SQLite):
+DATABASE_URI = os.getenv("DATABASE_URI", "sqlite:///space.db")
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+DATABASE_POOL_MAX_OVERFLOW = int(os.getenv("DATABASE_POOL_MAX_OVERFLOW", "10"))
+DATABASE_POOL_PRE_PING = os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"
+DATABASE_POOL_RECYCLE_SECONDS = int(os.getenv("DATABASE_POOL_RECYCLE_SECONDS", "1800"))
+
+# Create a dictionary to store the SQLite settings (pragmas) applied to every database connection: write-ahead logging (so that
+# web requests can read while an administrative update is writing), relaxed syncing (safe with write-ahead logging), a larger
+# page cache (in KiB, when negative), memory-mapped I/O (in bytes), and a busy timeout (in milliseconds) for writers:
+sqlite_pragmas = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -65536,
+    "mmap_size": 268435456,
+    "busy_timeout": 10000,
+    "temp_store": "MEMORY"
+}
+
+# Define constant for the number of seconds between checkpoints of the SQLite write-ahead log into the database file (0 = no
+# periodic checkpoints, i.e., SQLite's automatic checkpoints only):
+DATABASE_CHECKPOINT_INTERVAL_SECONDS = int(os.getenv("DATABASE_CHECKPOINT_INTERVAL_SECONDS", "0"))
+
+# Define constant for the number of seconds after which the wait for another process's lock file for configuring the database
+# at startup (which may include migrating a table) is abandoned, and the interval (in seconds) at which a process waiting on
+# another process's lock file checks whether it has been released:
+DATABASE_SETUP_LOCK_WAIT_SECONDS = 600
+LOCK_FILE_POLL_SECONDS = 0.1
+
+# Define constant for the minimum number of rows loaded by a database update for the database's statistics (used by the
+# query planner) to be refreshed afterwards:
+DATABASE_ANALYZE_MIN_ROWS = 1000
+
 # Create a dictionary to store spreadsheet-related attributes by content type:
 spreadsheet_attributes = {
     "approaching_asteroids": {
@@ -84,6 +241,62 @@ spreadsheet_attributes = {
     }
 }
 
+# Create a dictionary to store full-text search index attributes by content type (each index is an SQLite FTS5 virtual table
+# mirroring the listed text columns of its source table; on databases other than SQLite, the listed columns are searched directly):
+search_index_attributes = {
+    "confirmed_planets": {
+        "category": "Confirmed Planet",
+        "fts_table": "confirmed_planets_fts",
+        "source_table": "confirmed_planets",
+        "title_column": "planet_name",
+        "columns": ("planet_name", "host_name", "discovery_method", "discovery_facility", "discovery_telescope")
+    },
+    "constellations": {
+        "category": "Constellation",
+        "fts_table": "constellations_fts",
+        "source_table": "constellations",
+        "title_column": "name",
+        "columns": ("name", "nickname", "myth_assoc", "brightest_star_name")
+    },
+    "space_news": {
+        "category": "Space News",
+        "fts_table": "space_news_fts",
+        "source_table": "space_news",
+        "title_column": "title",
+        "columns": ("title", "summary", "news_site")
+    }
+}
+
+# Define constant for the maximum number of results returned (per content type) by a full-text search:
+SEARCH_RESULTS_LIMIT = 25
+
+# Define constant for the maximum number of suggestions returned by the autocomplete endpoint:
+AUTOCOMPLETE_RESULTS_LIMIT = 10
+
+# Define constants for the default and maximum number of photos returned per page when filtering Mars photos:
+MARS_PHOTOS_FILTER_PER_PAGE = 50
+MARS_PHOTOS_FILTER_MAX_PER_PAGE = 500
+
+# Create a dictionary to store the in-memory autocomplete index (sorted lowercase keys and their corresponding suggestions),
+# which is rebuilt from the database only after the versions of its source datasets (confirmed planets, constellations) change:
+autocomplete_index = {
+    "keys": [],
+    "suggestions": [],
+    "dataset_versions": None
+}
+
+# Create a list of the database tables whose versions (row count, content hash, and date/time of latest change) are tracked in
+# the "dataset_versions" database table.  Caches (HTTP, listbox, autocomplete, spreadsheets) key on these versions:
+versioned_datasets = ["approaching_asteroids", "confirmed_planets", "constellations", "mars_photo_details", "mars_photos_available", "mars_rovers", "space_news"]
+
+# Define constant for the number of seconds for which a dataset's version is cached in-process before being re-read from the database:
+DATASET_VERSION_CACHE_SECONDS = 5
+
+# Create dictionaries to store (in-process) the cached dataset versions and the cached listbox choices (by listbox, along
+# with the version of the dataset from which the choices were drawn):
+dataset_versions = {}
+listbox_choices = {}
+
 # Create a dictionary to store recognition merit by content type:
 recognition = {
     "approaching_asteroids":
@@ -110,8 +323,9 @@ recognition = {
         "Data courtesy of Nathan Bergey (@natronics)"
 }
 
-# Define list variable for storing names of Mars rovers that are currently active for the purpose of data production:
-mars_rovers = []
+# Define dictionary variable for storing (in-process) the names of Mars rovers that are currently active for the purpose of
+# data production, along with the version of the "mars_rovers" dataset from which the names were drawn:
+mars_rovers = {"rover_names": [], "dataset_version": None}
 
 # Define variable to represent the Flask application object to be used for this website:
 app = None
@@ -121,23 +335,35 @@ db = None
 
 # Initialize class variables for database tables:
 ApproachingAsteroids = None
+ApproachingAsteroidsDays = None
 ConfirmedPlanets = None
+ConfirmedPlanetsChanges = None
+ConfirmedPlanetsYearRefreshes = None
 Constellations = None
+ContactOutbox = None
+DatasetVersions = None
+MarsPhotoCounts = None
 MarsPhotoDetails = None
 MarsPhotosAvailable = None
+MarsPhotosSyncQueue = None
 MarsRoverCameras = None
+MarsRoverManifests = None
 MarsRovers = None
+RateLimitBuckets = None
 SpaceNews = None
+UpstreamPayloads = None
 Users = None
 
 # Initialize class variables for web forms:
 AdminLoginForm = None
 AdminUpdateForm = None
 ContactForm = None
+SearchForm = None
 DisplayApproachingAsteroidsSheetForm = None
 DisplayConfirmedPlanetsSheetForm = None
 DisplayConstellationSheetForm = None
 DisplayMarsPhotosSheetForm = None
+FilterMarsPhotosForm = None
 ViewApproachingAsteroidsForm = None
 ViewConfirmedPlanetsForm = None
 ViewConstellationForm = None
@@ -4,50 +4,93 @@
 
 # Import necessary library(ies):
 import requests
-from data import app, db, mars_rovers, recognition, spreadsheet_attributes, API_KEY_ASTRONOMY_PIC_OF_THE_DAY, API_KEY_CLOSEST_APPROACH_ASTEROIDS, API_KEY_GET_LOC_FROM_LAT_AND_LON, API_KEY_MARS_ROVER_PHOTOS,  SENDER_EMAIL_GMAIL, SENDER_HOST, SENDER_PASSWORD_GMAIL, SENDER_PORT, URL_ASTRONOMY_PIC_OF_THE_DAY, URL_CLOSEST_APPROACH_ASTEROIDS, URL_CONFIRMED_PLANETS, URL_CONSTELLATION_ADD_DETAILS_1, URL_CONSTELLATION_ADD_DETAILS_2A, URL_CONSTELLATION_ADD_DETAILS_2B, URL_CONSTELLATION_MAP_SITE, URL_GET_LOC_FROM_LAT_AND_LON, URL_ISS_LOCATION, URL_MARS_ROVER_PHOTOS_BY_ROVER, URL_MARS_ROVER_PHOTOS_BY_ROVER_AND_OTHER_CRITERIA, URL_PEOPLE_IN_SPACE_NOW, URL_SPACE_NEWS, WEB_LOADING_TIME_ALLOWANCE
-from data import ApproachingAsteroids, ConfirmedPlanets, Constellations, MarsPhotoDetails, MarsPhotosAvailable, MarsRoverCameras, MarsRovers, SpaceNews, Users
-from data import AdminLoginForm, AdminUpdateForm, ContactForm, DisplayApproachingAsteroidsSheetForm, DisplayConfirmedPlanetsSheetForm, DisplayConstellationSheetForm, DisplayMarsPhotosSheetForm, ViewApproachingAsteroidsForm, ViewConfirmedPlanetsForm, ViewConstellationForm, ViewMarsPhotosForm
-from datetime import datetime, timedelta
+from data import app, db, autocomplete_index, circuit_breakers, dataset_versions, dialogs, inbound_rate_limits, listbox_choices, mars_rovers, rate_limit_buckets, rate_limits, recognition, search_index_attributes, spreadsheet_attributes, sqlite_pragmas, upstream_flights, versioned_datasets, APPROACHING_ASTEROIDS_DAY_EXPIRY_HOURS, APPROACHING_ASTEROIDS_MAX_CONCURRENT_REQUESTS, APPROACHING_ASTEROIDS_MAX_REQUESTS_PER_RANGE, APPROACHING_ASTEROIDS_REFRESH_WINDOW_DAYS, AUTOCOMPLETE_RESULTS_LIMIT, API_KEY_ASTRONOMY_PIC_OF_THE_DAY, API_KEY_CLOSEST_APPROACH_ASTEROIDS, API_KEY_GET_LOC_FROM_LAT_AND_LON, API_KEY_MARS_ROVER_PHOTOS, CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_PROBE_INTERVAL_SECONDS, CIRCUIT_BREAKER_SLOW_CALL_SECONDS, CONFIRMED_PLANETS_CHUNK_SIZE, CONFIRMED_PLANETS_ON_DEMAND_CLAIM_SECONDS, CONFIRMED_PLANETS_ON_DEMAND_REFRESH_HOURS, CONFIRMED_PLANETS_ON_DEMAND_RETRY_BASE_SECONDS, CONFIRMED_PLANETS_ON_DEMAND_RETRY_MAX_SECONDS, CONFIRMED_PLANETS_QUERY_ORDER_BY, CONFIRMED_PLANETS_QUERY_SELECT, CONFIRMED_PLANETS_QUERY_WHERE, CONTACT_OUTBOX_BATCH_SIZE, CONTACT_OUTBOX_CLAIM_SECONDS, CONTACT_OUTBOX_MAX_ATTEMPTS, CONTACT_OUTBOX_POLL_SECONDS, CONTACT_OUTBOX_RETRY_BASE_SECONDS, CONTACT_OUTBOX_RETRY_MAX_SECONDS, CONTACT_OUTBOX_SMTP_IDLE_SECONDS, DATABASE_ANALYZE_MIN_ROWS, DATABASE_CHECKPOINT_INTERVAL_SECONDS, DATABASE_POOL_MAX_OVERFLOW, DATABASE_POOL_PRE_PING, DATABASE_POOL_RECYCLE_SECONDS, DATABASE_POOL_SIZE, DATABASE_SETUP_LOCK_WAIT_SECONDS, DATABASE_URI, DATASET_VERSION_CACHE_SECONDS, HEADLESS, INBOUND_RATE_LIMITS_MAX_CLIENTS, INBOUND_RATE_LIMITS_SHARED, LOCK_FILE_POLL_SECONDS, MARS_PHOTO_DETAILS_MIGRATION_CHUNK_SIZE, MARS_PHOTOS_FILTER_MAX_PER_PAGE, MARS_PHOTOS_FILTER_PER_PAGE, MARS_PHOTOS_SYNC_MAX_ATTEMPTS, MARS_PHOTOS_SYNC_QUOTA_WINDOW_SECONDS, RATE_LIMIT_TOKEN_MAX_ATTEMPTS, SEARCH_RESULTS_LIMIT, SENDER_EMAIL_GMAIL, SENDER_HOST, SENDER_PASSWORD_GMAIL, SENDER_PORT, SENDER_USE_STARTTLS, UPSTREAM_FLIGHT_LOCK_WAIT_SECONDS, UPSTREAM_REQUEST_TIMEOUT_SECONDS, URL_ASTRONOMY_PIC_OF_THE_DAY, URL_CLOSEST_APPROACH_ASTEROIDS, URL_CONFIRMED_PLANETS, URL_CONSTELLATION_ADD_DETAILS_1, URL_CONSTELLATION_ADD_DETAILS_2A, URL_CONSTELLATION_ADD_DETAILS_2B, URL_CONSTELLATION_MAP_SITE, URL_GET_LOC_FROM_LAT_AND_LON, URL_ISS_LOCATION, URL_MARS_ROVER_PHOTOS_BY_ROVER, URL_MARS_ROVER_PHOTOS_BY_ROVER_AND_OTHER_CRITERIA, URL_PEOPLE_IN_SPACE_NOW, URL_SPACE_NEWS, WEB_LOADING_TIME_ALLOWANCE
+from data import ApproachingAsteroids, ApproachingAsteroidsDays, ConfirmedPlanets, ConfirmedPlanetsChanges, ConfirmedPlanetsYearRefreshes, Constellations, ContactOutbox, DatasetVersions, MarsPhotoCounts, MarsPhotoDetails, MarsPhotosAvailable, MarsPhotosSyncQueue, MarsRoverCameras, MarsRoverManifests, MarsRovers, RateLimitBuckets, SpaceNews, UpstreamPayloads, Users
+from data import AdminLoginForm, AdminUpdateForm, ContactForm, DisplayApproachingAsteroidsSheetForm, DisplayConfirmedPlanetsSheetForm, DisplayConstellationSheetForm, DisplayMarsPhotosSheetForm, FilterMarsPhotosForm, SearchForm, ViewApproachingAsteroidsForm, ViewConfirmedPlanetsForm, ViewConstellationForm, ViewMarsPhotosForm
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from dotenv import load_dotenv
-from flask import Flask, abort, render_template, redirect, url_for
+from email.message import EmailMessage
+from flask import Flask, Response, abort, jsonify, render_template, redirect, request, send_from_directory, url_for
 from flask_bootstrap import Bootstrap5
 from flask_login import UserMixin, login_user, LoginManager, current_user, logout_user
 from flask_sqlalchemy import SQLAlchemy
 from functools import wraps  # Used in 'admin_only" decorator function
+from markupsafe import Markup, escape
 from flask_wtf import FlaskForm
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from skyfield.api import load_constellation_names
-from sqlalchemy import Integer, String, Boolean, Float, DateTime, func, distinct
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Integer, String, Boolean, Float, Date, DateTime, ForeignKey, Index, JSON, MetaData, Text, Table, event, extract, func, inspect, or_, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from werkzeug.security import check_password_hash
-from wtforms import EmailField, SelectField, StringField, SubmitField, TextAreaField, BooleanField, PasswordField
-from wtforms.validators import InputRequired, Length, Email
+from wtforms import DateField, EmailField, IntegerField, SelectField, StringField, SubmitField, TextAreaField, BooleanField, PasswordField
+from wtforms.validators import InputRequired, Length, Email, Optional
+import bisect  # Used for prefix lookups in the autocomplete index
 import collections  # Used for sorting items in the constellations dictionary
+import csv
 import email_validator
 import glob
+import hashlib
+import itertools
 import math
 import os
+import re
 import smtplib
+import threading
 import time
 import traceback
 import unidecode
-import wx
-import wx.lib.agw.pybusyinfo as PBI
+import sys
 import xlsxwriter
-
-# Define variable to be used for showing user dialog and message boxes:
-dlg = wx.App()
+if os.name == "nt":
+    import msvcrt  # Used for locking lock files (Windows)
+else:
+    import fcntl  # Used for locking lock files (other platforms)
+
+# Import the desktop GUI toolkit (used for showing progress and prompts during administrative updates), unless running headless
+# (e.g., under a WSGI server) or the toolkit is not installed, in which case such dialogs are logged instead (see "show_dialog_message"):
+wx = None
+PBI = None
+if not HEADLESS:
+    try:
+        import wx
+        import wx.lib.agw.pybusyinfo as PBI
+    except ImportError:
+        pass
 
 # Initialize the Flask app. object:
 app = Flask(__name__)
 
+# Define variable to track whether the Flask app. object has been fully configured (along with its database and web forms)
+# by the "create_app" function:
+is_app_configured = False
+
 # Create needed class "Base":
 class Base(DeclarativeBase):
   pass
 
-# NOTE: Additional configurations are launched via the "run_app" function defined below.
+# NOTE: Additional configurations are launched via the "create_app" function defined below.
+
+
+# Define lock to ensure that the in-memory autocomplete index is rebuilt by only one thread at a time:
+autocomplete_index_lock = threading.Lock()
+
+# Define event used to wake the background sender of the contact outbox (see "run_contact_outbox_sender") as soon as a message is queued:
+contact_outbox_event = threading.Event()
+
+# Define lock to ensure that the circuit breakers guarding upstream APIs (see "get_upstream_payload") are updated by only one thread at a time:
+circuit_breakers_lock = threading.Lock()
+
+# Define lock to ensure that the in-memory registry of upstream requests in flight (see "get_upstream_payload_single_flight") is updated by only one thread at a time:
+upstream_flights_lock = threading.Lock()
 
+# Define lock to ensure that the in-memory registry of active Mars rovers is reloaded by only one thread at a time:
+mars_rovers_lock = threading.Lock()
+
+# Define lock to ensure that the rate-limit buckets (see "get_rate_limit_token") are updated by only one thread at a time:
+rate_limit_buckets_lock = threading.Lock()
 
 # Configure the Flask login manager:
 login_manager = LoginManager()
@@ -75,6 +118,19 @@ def admin_only(f):
     return decorated_function
 
 
+# Implement a hook to throttle, per client address, submissions to routes which are costly to serve (e.g., which send e-mail or
+# verify passwords).  Throttled clients receive "429 Too Many Requests" before the route itself runs.  Buckets are keyed by
+# route and a digest of the client address (so that the key fits the bucket key column, whatever the address's length):
+@app.before_request
+def throttle_inbound_requests():
+    if request.method == "POST" and request.endpoint in inbound_rate_limits:
+        wait_seconds = get_rate_limit_token(f"{request.endpoint[:13]}:{hashlib.sha256(str(request.remote_addr).encode()).hexdigest()[:16]}", limits=inbound_rate_limits[request.endpoint], shared=INBOUND_RATE_LIMITS_SHARED)
+        if wait_seconds > 0:
+            response = Response(f"Too many requests. Please retry in about {math.ceil(wait_seconds)} seconds.", status=429, mimetype="text/plain")
+            response.retry_after = math.ceil(wait_seconds)
+            return response
+
+
 # CONFIGURE ROUTES FOR WEB PAGES (LISTED IN HIERARCHICAL ORDER STARTING WITH HOME PAGE, THEN ALPHABETICALLY):
 # ***********************************************************************************************************
 # Configure route for home page:
@@ -187,14 +243,11 @@ def admin_update():
             update_status_constellations = ""
             update_status_mars_photos = ""
 
-            # Initiate a variable to support dialog for keeping user informed on update status:
-            app_wx = wx.App(redirect=False)
-
             # Execute selected updates:
             if form.chk_approaching_asteroids.data:  # Update to "approaching asteroids" is desired.
                 # Get results of obtaining and processing the desired information (use window dialog to keep user informed):
-                dlg = PBI.PyBusyInfo("Approaching Asteroids: Update in progress...", title="Administrative Update")
-                error_msg_approaching_asteroids, success_approaching_asteroids = get_approaching_asteroids()
+                dlg = show_dialog_busy_info("Approaching Asteroids: Update in progress...")
+                error_msg_approaching_asteroids, success_approaching_asteroids = get_approaching_asteroids(form.date_approaching_asteroids_start.data, form.date_approaching_asteroids_end.data)
                 dlg = None
                 if success_approaching_asteroids:
                     update_status_approaching_asteroids = "Approaching Asteroids: Successfully updated."
@@ -203,7 +256,7 @@ def admin_update():
 
             if form.chk_confirmed_planets.data:  # Update to "confirmed planets" is desired.
                 # Get results of obtaining and processing the desired information (use window dialog to keep user informed):
-                dlg = PBI.PyBusyInfo("Confirmed Planets: Update in progress...", title="Administrative Update")
+                dlg = show_dialog_busy_info("Confirmed Planets: Update in progress...")
                 error_msg_confirmed_planets, success_confirmed_planets = get_confirmed_planets()
                 dlg = None
                 if success_confirmed_planets:
@@ -213,7 +266,7 @@ def admin_update():
 
             if form.chk_constellations.data:
                 # Get results of obtaining and processing the desired information (use window dialog to keep user informed):
-                dlg = PBI.PyBusyInfo("Constellations: Update in progress...", title="Administrative Update")
+                dlg = show_dialog_busy_info("Constellations: Update in progress...")
                 error_msg_constellations, success_constellations = get_constellation_data()
                 dlg = None
                 if success_constellations:
@@ -222,8 +275,8 @@ def admin_update():
                     update_status_constellations = f"Constellations: Update failed ({error_msg_constellations})."
 
             if form.chk_mars_photos.data:
-                dlg = PBI.PyBusyInfo("Photos from Mars: Update in progress...", title="Administrative Update")
-                error_msg_mars_photos, success_mars_photos = get_mars_photos()
+                dlg = show_dialog_busy_info("Photos from Mars: Update in progress...")
+                error_msg_mars_photos, success_mars_photos = get_mars_photos(retry_failed=form.chk_mars_photos_retry_failed.data)
                 dlg = None
                 if success_mars_photos:
                     update_status_mars_photos = "Photos from Mars: Successfully updated."
@@ -235,9 +288,7 @@ def admin_update():
 
             # Check if the user has selected at least one of the items to update.  If not, prompt user to select one:
             if not (update_status_approaching_asteroids != "" or update_status_confirmed_planets != "" or update_status_constellations != "" or update_status_mars_photos != ""):
-                dlg = wx.App()
-                dlg = wx.MessageBox(f"Please select at least one of the items to update.", 'Administrative Update', wx.OK | wx.ICON_INFORMATION)
-                dlg = None
+                show_dialog_message("Please select at least one of the items to update.", 'Administrative Update')
 
             else:  # User has selected at least one item to update.  Perform selected update(s):
                 if update_status_approaching_asteroids != "":
@@ -249,9 +300,6 @@ def admin_update():
                 if update_status_mars_photos != "":
                     update_status += update_status_mars_photos + "\n"
 
-                # Destroy dialog app:
-                app_wx.MainLoop()
-
                 # Go to the "Administrative Update" page and display the results of update execution:
                 return render_template("admin_update.html", update_status=update_status, recognition_web_template=recognition["web_template"])
 
@@ -266,6 +314,201 @@ def admin_update():
         return render_template("error.html", activity="route: '/admin_update'", details=traceback.format_exc())
 
 
+# Configure REST API route for approaching asteroids (optionally filtered by close-approach date):
+@app.route('/api/v1/approaching_asteroids')
+def api_v1_approaching_asteroids():
+    global db, app
+
+    try:
+        # Return the approaching asteroids (all, or those for the requested close-approach date) as JSON:
+        if request.args.get("close_approach_date") == None:
+            return get_api_response("approaching_asteroids", "approaching_asteroids")
+        else:
+            return get_api_response("approaching_asteroids", "approaching_asteroids_by_close_approach_date", close_approach_date=request.args.get("close_approach_date"))
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/approaching_asteroids'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for the astronomy picture of the day:
+@app.route('/api/v1/astronomy_pic_of_day')
+def api_v1_astronomy_pic_of_day():
+    global db, app
+
+    try:
+        # Get details re: the astronomy picture of the day.  If details could not be obtained, return error details as JSON:
+        json, copyright_details, error_msg, date_time_fetched = get_astronomy_pic_of_the_day()
+        if error_msg != "":
+            return jsonify({"error": error_msg}), 503
+
+        # Return the details as JSON, tagged with an ETag derived from the content (this dataset is not stored in the database).
+        # If the last known good details are being provided (upstream API unavailable), indicate their age:
+        response = jsonify(json)
+        response.add_etag()
+        if date_time_fetched != None:
+            response.age = datetime.now() - date_time_fetched
+        return response.make_conditional(request)
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/astronomy_pic_of_day'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for confirmed planets (optionally filtered by discovery year):
+@app.route('/api/v1/confirmed_planets')
+def api_v1_confirmed_planets():
+    global db, app
+
+    try:
+        # Return the confirmed planets (all, or those discovered in the requested year) as JSON:
+        if request.args.get("disc_year", type=int) == None:
+            return get_api_response("confirmed_planets", "confirmed_planets")
+        else:
+            return get_api_response("confirmed_planets", "confirmed_planets_by_disc_year", disc_year=request.args.get("disc_year", type=int))
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/confirmed_planets'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for constellations:
+@app.route('/api/v1/constellations')
+def api_v1_constellations():
+    global db, app
+
+    try:
+        # Return the constellations as JSON:
+        return get_api_response("constellations", "constellations")
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/constellations'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for Mars photo details (for a specified rover / earth date combo):
+@app.route('/api/v1/mars_photo_details')
+def api_v1_mars_photo_details():
+    global db, app
+
+    try:
+        # If the rover / earth date combo was not specified, return error details as JSON:
+        if request.args.get("rover_earth_date_combo") == None:
+            return jsonify({"error": "The 'rover_earth_date_combo' parameter is required."}), 400
+
+        # Return the photo details for the requested rover / earth date combo as JSON:
+        return get_api_response("mars_photo_details", "mars_photos_by_rover_earth_date_combo", rover_earth_date_combo=request.args.get("rover_earth_date_combo"))
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/mars_photo_details'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for Mars photos filtered by rover, camera, sol range, and earth date range (paginated, with facet counts by camera):
+@app.route('/api/v1/mars_photos')
+def api_v1_mars_photos():
+    global db, app
+
+    try:
+        # Capture the filters and the page of results requested.  If any numeric or date parameter is invalid, return error details as JSON:
+        filters = {"rover_name": request.args.get("rover"), "camera_name": request.args.get("camera")}
+        try:
+            for arg in ["sol_min", "sol_max", "page", "per_page"]:
+                if request.args.get(arg) != None:
+                    filters[arg] = int(request.args.get(arg))
+            for arg in ["earth_date_min", "earth_date_max"]:
+                if request.args.get(arg) != None:
+                    filters[arg] = date.fromisoformat(request.args.get(arg))
+        except:
+            return jsonify({"error": "The 'sol_min', 'sol_max', 'page', and 'per_page' parameters must be integers, and the 'earth_date_min' and 'earth_date_max' parameters must be dates (YYYY-MM-DD)."}), 400
+
+        # Return the requested page of filtered photos (with pagination details and facet counts) as JSON:
+        return get_api_response("mars_photo_details", "mars_photos_filtered", **filters)
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/mars_photos'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for Mars photos available (summary by rover / earth date combo):
+@app.route('/api/v1/mars_photos_available')
+def api_v1_mars_photos_available():
+    global db, app
+
+    try:
+        # Return the summary of Mars photos available as JSON:
+        return get_api_response("mars_photos_available", "mars_photos_available")
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/mars_photos_available'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for people currently in space:
+@app.route('/api/v1/people_in_space_now')
+def api_v1_people_in_space_now():
+    global db, app
+
+    try:
+        # Get the list of people currently in space.  If the list could not be obtained, return error details as JSON:
+        json, has_json, date_time_fetched = get_people_in_space_now()
+        if not has_json:
+            return jsonify({"error": json}), 503
+
+        # Return the list as JSON, tagged with an ETag derived from the content (this dataset is not stored in the database).
+        # If the last known good list is being provided (upstream API unavailable), indicate its age:
+        response = jsonify(json)
+        response.add_etag()
+        if date_time_fetched != None:
+            response.age = datetime.now() - date_time_fetched
+        return response.make_conditional(request)
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/people_in_space_now'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
+# Configure REST API route for space news (articles as of the latest refresh via the "Space News" web page):
+@app.route('/api/v1/space_news')
+def api_v1_space_news():
+    global db, app
+
+    try:
+        # Return the space news articles as JSON:
+        return get_api_response("space_news", "space_news")
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/api/v1/space_news'", traceback.format_exc())
+
+        # Return error details as JSON:
+        return jsonify({"error": "An error has occurred. Data cannot be obtained at this time."}), 500
+
+
 # Configure route for "Approaching Asteroids" web page:
 @app.route('/approaching_asteroids',methods=["GET", "POST"])
 def approaching_asteroids():
@@ -279,11 +522,7 @@ def approaching_asteroids():
         form_ss = DisplayApproachingAsteroidsSheetForm()
 
         # Populate the close approach date listbox with an ordered list of close approach dates represented in the database:
-        list_close_approach_dates = []
-        close_approach_dates = db.session.query(distinct(ApproachingAsteroids.close_approach_date)).order_by(ApproachingAsteroids.close_approach_date).all()
-        for close_approach_date in close_approach_dates:
-            list_close_approach_dates.append(str(close_approach_date)[2:12])
-        form.list_close_approach_date.choices = list_close_approach_dates
+        form.list_close_approach_date.choices = get_listbox_choices("approaching_asteroids", "approaching_asteroids_close_approach_dates")
 
         # Populate the approaching-asteroids sheet file listbox with the sole sheet viewable in this scope:
         form_ss.list_approaching_asteroids_sheet_name.choices = ["ApproachingAsteroids.xlsx"]
@@ -304,8 +543,13 @@ def approaching_asteroids():
                 return render_template('show_approaching_asteroids_details.html', approaching_asteroids_details=approaching_asteroids_details, close_approach_date=form.list_close_approach_date.data, error_msg=error_msg, recognition_scope_specific=recognition["approaching_asteroids"], recognition_web_template=recognition["web_template"])
 
             else:
-                # Open the selected spreadsheet file:
-                os.startfile(str(form_ss.list_approaching_asteroids_sheet_name.data))
+                # Open the selected spreadsheet file (on the desktop if available; otherwise, by sending it to the browser), provided
+                # it is one of the files listed for this scope.  Otherwise, display error details (with "400 Bad Request"):
+                if not form_ss.validate():
+                    return render_template("error.html", activity="route: '/approaching_asteroids'", details="The selected spreadsheet file is not available."), 400
+                response = open_spreadsheet(form_ss.list_approaching_asteroids_sheet_name.data)
+                if response != None:
+                    return response
 
         # Go to the web page to render the results:
         return render_template('approaching_asteroids.html', form=form, form_ss=form_ss, recognition_scope_specific=recognition["approaching_asteroids"], recognition_web_template=recognition["web_template"])
@@ -325,10 +569,10 @@ def astronomy_pic_of_day():
 
     try:
         # Get details re: the astronomy picture of the day:
-        json, copyright_details, error_msg = get_astronomy_pic_of_the_day()
+        json, copyright_details, error_msg, date_time_fetched = get_astronomy_pic_of_the_day()
 
         # Go to the web page to render the results:
-        return render_template("astronomy_pic_of_day.html", json=json, copyright_details=copyright_details, error_msg=error_msg, recognition_scope_specific=recognition["astronomy_pic_of_day"], recognition_web_template=recognition["web_template"])
+        return render_template("astronomy_pic_of_day.html", json=json, copyright_details=copyright_details, error_msg=error_msg, data_age_note=get_data_age_note(date_time_fetched), recognition_scope_specific=recognition["astronomy_pic_of_day"], recognition_web_template=recognition["web_template"])
 
     except:  # An error has occurred.
         # Log error into system log file:
@@ -338,6 +582,23 @@ def astronomy_pic_of_day():
         return render_template("error.html", activity="route: '/astronomy_pic_of_day'", details=traceback.format_exc())
 
 
+# Configure route for autocompleting planet, host star, and constellation names (returns JSON; used as the user types):
+@app.route('/autocomplete')
+def autocomplete():
+    global db, app
+
+    try:
+        # Get the suggestions (optionally, of one type only) matching the prefix typed by the user, and return them as JSON:
+        return jsonify(get_autocomplete_suggestions(request.args.get("q", ""), request.args.get("limit", AUTOCOMPLETE_RESULTS_LIMIT, type=int), request.args.get("type")))
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/autocomplete'", traceback.format_exc())
+
+        # Return an empty list of suggestions:
+        return jsonify([])
+
+
 # Configure route for "Confirmed Planets" web page:
 @app.route('/confirmed_planets',methods=["GET", "POST"])
 def confirmed_planets():
@@ -351,11 +612,7 @@ def confirmed_planets():
         form_ss = DisplayConfirmedPlanetsSheetForm()
 
         # Populate the discovery year listbox with an ordered (descending) list of discovery years represented in the database:
-        list_discovery_years = []
-        discovery_years = db.session.query(distinct(ConfirmedPlanets.discovery_year)).order_by(ConfirmedPlanets.discovery_year.desc()).all()
-        for year in discovery_years:
-            list_discovery_years.append(int(str(year)[1:5]))
-        form.list_discovery_year.choices = list_discovery_years
+        form.list_discovery_year.choices = get_listbox_choices("confirmed_planets", "confirmed_planets_discovery_years")
 
         # Populate the confirmed planets sheet file listbox with the sole sheet viewable in this scope:
         form_ss.list_confirmed_planets_sheet_name.choices = ["ConfirmedPlanets.xlsx"]
@@ -364,6 +621,13 @@ def confirmed_planets():
         if form.validate_on_submit():
             if form.list_discovery_year.data != None:
                 error_msg = ""
+                # If the selected year's confirmed planets are due to be refreshed (i.e., not refreshed recently, not being refreshed,
+                # and not awaiting the retry of a failed refresh), claim the refresh of that year only and run it in the background.
+                # The data already in the database is shown meanwhile:
+                if retrieve_from_database(trans_type="confirmed_planets_year_refresh_due", disc_year=int(form.list_discovery_year.data)) == True:
+                    if update_database("update_confirmed_planets_year_refresh_claim", int(form.list_discovery_year.data)):
+                        threading.Thread(target=run_confirmed_planets_year_refresh, args=(int(form.list_discovery_year.data),), daemon=True).start()
+
                 # Retrieve the record from the database which pertains to confirmed planets discovered in the selected year:
                 confirmed_planets_details = retrieve_from_database(trans_type="confirmed_planets_by_disc_year", disc_year=form.list_discovery_year.data)
 
@@ -376,8 +640,13 @@ def confirmed_planets():
                 return render_template('show_confirmed_planets_details.html', confirmed_planets_details=confirmed_planets_details, disc_year=form.list_discovery_year.data, error_msg=error_msg, recognition_scope_specific=recognition["confirmed_planets"], recognition_web_template=recognition["web_template"])
 
             else:
-                # Open the selected spreadsheet file:
-                os.startfile(str(form_ss.list_confirmed_planets_sheet_name.data))
+                # Open the selected spreadsheet file (on the desktop if available; otherwise, by sending it to the browser), provided
+                # it is one of the files listed for this scope.  Otherwise, display error details (with "400 Bad Request"):
+                if not form_ss.validate():
+                    return render_template("error.html", activity="route: '/confirmed_planets'", details="The selected spreadsheet file is not available."), 400
+                response = open_spreadsheet(form_ss.list_confirmed_planets_sheet_name.data)
+                if response != None:
+                    return response
 
         # Go to the web page to render the results:
         return render_template('confirmed_planets.html', form=form, form_ss=form_ss, recognition_scope_specific=recognition["confirmed_planets"], recognition_web_template=recognition["web_template"])
@@ -390,6 +659,32 @@ def confirmed_planets():
         return render_template("error.html", activity="route: '/confirmed_planets'", details=traceback.format_exc())
 
 
+# Configure route for "Newly Confirmed Planets" web page (planets added by the most recent full refresh of confirmed planets):
+@app.route('/confirmed_planets_newly_confirmed')
+def confirmed_planets_newly_confirmed():
+    global db, app
+
+    try:
+        error_msg = ""
+        # Retrieve the records from the database which pertain to planets newly confirmed as of the most recent full refresh:
+        confirmed_planets_details = retrieve_from_database(trans_type="confirmed_planets_newly_confirmed")
+
+        if confirmed_planets_details == {}:
+            error_msg = "Error: Data could not be obtained at this time."
+        elif confirmed_planets_details == []:
+            error_msg = "No newly confirmed planets were added by the most recent full refresh."
+
+        # Show web page with retrieved confirmed-planet details:
+        return render_template('show_confirmed_planets_details.html', confirmed_planets_details=confirmed_planets_details, disc_year=None, error_msg=error_msg, recognition_scope_specific=recognition["confirmed_planets"], recognition_web_template=recognition["web_template"])
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/confirmed_planets_newly_confirmed'", traceback.format_exc())
+
+        # Go to the web page which displays error details to the user:
+        return render_template("error.html", activity="route: '/confirmed_planets_newly_confirmed'", details=traceback.format_exc())
+
+
 # Configure route for "Constellations" web page:
 @app.route('/constellations',methods=["GET", "POST"])
 def constellations():
@@ -403,7 +698,7 @@ def constellations():
         form_ss = DisplayConstellationSheetForm()
 
         # Populate the constellation name listbox with an ordered list of constellation names from the database:
-        form.list_constellation_name.choices = db.session.execute(db.select(Constellations.name + " (" + Constellations.nickname + ")").order_by(Constellations.name)).scalars().all()
+        form.list_constellation_name.choices = get_listbox_choices("constellations", "constellations_names_and_nicknames")
 
         # Populate the constellation sheet file listbox with the sole sheet viewable in this scope:
         form_ss.list_constellation_sheet_name.choices = ["Constellations.xlsx"]
@@ -422,8 +717,13 @@ def constellations():
                 return render_template('show_constellation_details.html', constellation_details=constellation_details, recognition_scope_specific=recognition["constellations"], recognition_web_template=recognition["web_template"])
 
             else:
-                # Open the selected spreadsheet file:
-                os.startfile(str(form_ss.list_constellation_sheet_name.data))
+                # Open the selected spreadsheet file (on the desktop if available; otherwise, by sending it to the browser), provided
+                # it is one of the files listed for this scope.  Otherwise, display error details (with "400 Bad Request"):
+                if not form_ss.validate():
+                    return render_template("error.html", activity="route: '/constellations'", details="The selected spreadsheet file is not available."), 400
+                response = open_spreadsheet(form_ss.list_constellation_sheet_name.data)
+                if response != None:
+                    return response
 
         # Go to the web page to render the results:
         return render_template('constellations.html', form=form, form_ss=form_ss, recognition_scope_specific=recognition["constellations"], recognition_web_template=recognition["web_template"])
@@ -447,7 +747,7 @@ def contact():
 
         # Validate form entries upon submittal. If validated, send message:
         if form.validate_on_submit():
-            # Send message via e-mail:
+            # Queue message to be sent via e-mail:
             msg_status = email_from_contact_page(form)
 
             # Go to the "Contact Us" page and display the results of e-mail execution attempt:
@@ -477,11 +777,7 @@ def mars_photos():
         form_ss = DisplayMarsPhotosSheetForm()
 
         # Populate the rover name / earth date combo listbox with an ordered list of such combinations:
-        list_rover_earth_date_combos = []
-        rover_earth_date_combos = db.session.query(distinct(MarsPhotosAvailable.rover_earth_date_combo)).order_by(MarsPhotosAvailable.rover_name, MarsPhotosAvailable.earth_date.desc()).all()
-        for rover_earth_date_combo in rover_earth_date_combos:
-            list_rover_earth_date_combos.append(str(rover_earth_date_combo).split("'")[1])
-        form.list_rover_earth_date_combo.choices = list_rover_earth_date_combos
+        form.list_rover_earth_date_combo.choices = get_listbox_choices("mars_photos_available", "mars_photos_available_rover_earth_date_combos")
 
         # Populate the Mars photos sheet file listbox with all filenames of spreadsheets pertinent to this scope:
         form_ss.list_mars_photos_sheet_name.choices = glob.glob("Mars Photos*.xlsx")
@@ -502,8 +798,13 @@ def mars_photos():
                 return render_template('show_mars_photos_details.html', mars_photos_details=mars_photos_details, rover_earth_date_combo=form.list_rover_earth_date_combo.data, error_msg=error_msg, recognition_scope_specific=recognition["mars_photos"], recognition_web_template=recognition["web_template"])
 
             else:
-                # Open the selected spreadsheet file:
-                os.startfile(str(form_ss.list_mars_photos_sheet_name.data))
+                # Open the selected spreadsheet file (on the desktop if available; otherwise, by sending it to the browser), provided
+                # it is one of the files listed for this scope.  Otherwise, display error details (with "400 Bad Request"):
+                if not form_ss.validate():
+                    return render_template("error.html", activity="route: '/mars_photos'", details="The selected spreadsheet file is not available."), 400
+                response = open_spreadsheet(form_ss.list_mars_photos_sheet_name.data)
+                if response != None:
+                    return response
 
         # Go to the web page to render the results:
         return render_template('mars_photos.html', form=form, form_ss=form_ss, recognition_scope_specific=recognition["mars_photos"], recognition_web_template=recognition["web_template"])
@@ -516,6 +817,113 @@ def mars_photos():
         return render_template("error.html", activity="route: '/mars_photos'", details=traceback.format_exc())
 
 
+# Configure route for "Photos from Mars - Filter" web page (photos by rover, camera, sol range, and earth date range):
+@app.route('/mars_photos_filter')
+def mars_photos_filter():
+    global db, app
+
+    try:
+        # Instantiate an instance of the "FilterMarsPhotosForm" class (populated from the query string, as the form is submitted via GET):
+        form = FilterMarsPhotosForm(formdata=request.args, meta={"csrf": False})
+
+        # Populate the rover name and camera name listboxes with ordered lists of such names:
+        form.list_rover_name.choices = get_listbox_choices("mars_rovers", "mars_rover_names")
+        form.list_camera_name.choices = [("", "(All Cameras)")] + [(camera_name, camera_name) for camera_name in get_listbox_choices("mars_photo_details", "mars_rover_camera_names")]
+
+        # Validate form entries upon submittal.  If valid, retrieve the requested page of filtered photos (with facet counts by camera):
+        error_msg = ""
+        mars_photos_filtered = None
+        page_urls = {}
+        facet_urls = {}
+        if request.args.get("list_rover_name") != None and form.validate():
+            page = request.args.get("page", 1, type=int)
+            mars_photos_filtered = retrieve_from_database(trans_type="mars_photos_filtered", rover_name=form.list_rover_name.data, camera_name=form.list_camera_name.data or None, sol_min=form.int_sol_min.data, sol_max=form.int_sol_max.data, earth_date_min=form.date_earth_date_min.data, earth_date_max=form.date_earth_date_max.data, page=page)
+
+            if mars_photos_filtered == {}:
+                error_msg = "Error: Data could not be obtained at this time."
+            elif mars_photos_filtered["total"] == 0:
+                error_msg = "No matching records were retrieved."
+            else:
+                # Prepare links to the adjacent pages of results, and to the results for each camera (retaining all other filters):
+                args = request.args.to_dict()
+                if mars_photos_filtered["page"] > 1:
+                    page_urls["previous"] = url_for('mars_photos_filter', **{**args, "page": mars_photos_filtered["page"] - 1})
+                if mars_photos_filtered["page"] < mars_photos_filtered["pages"]:
+                    page_urls["next"] = url_for('mars_photos_filter', **{**args, "page": mars_photos_filtered["page"] + 1})
+                for camera_name in mars_photos_filtered["facets"]:
+                    facet_urls[camera_name] = url_for('mars_photos_filter', **{**args, "list_camera_name": camera_name, "page": 1})
+
+        # Go to the web page to render the results:
+        return render_template('show_mars_photos_filter.html', form=form, mars_photos_filtered=mars_photos_filtered, page_urls=page_urls, facet_urls=facet_urls, error_msg=error_msg, recognition_scope_specific=recognition["mars_photos"], recognition_web_template=recognition["web_template"])
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/mars_photos_filter'", traceback.format_exc())
+
+        # Go to the web page which displays error details to the user:
+        return render_template("error.html", activity="route: '/mars_photos_filter'", details=traceback.format_exc())
+
+
+# Configure route for "Photos from Mars - Statistics" web page (photo counts by rover, earth year, and camera):
+@app.route('/mars_photos_statistics')
+def mars_photos_statistics():
+    global db, app
+
+    try:
+        error_msg = ""
+        # Retrieve the photo counts (by rover, earth year, and camera) from the database:
+        mars_photo_counts = retrieve_from_database(trans_type="mars_photo_counts")
+
+        if mars_photo_counts == {}:
+            error_msg = "Error: Data could not be obtained at this time."
+        elif mars_photo_counts == []:
+            error_msg = "No matching records were retrieved."
+
+        # Show web page with retrieved photo counts:
+        return render_template('show_mars_photos_statistics.html', mars_photo_counts=mars_photo_counts, error_msg=error_msg, recognition_scope_specific=recognition["mars_photos"], recognition_web_template=recognition["web_template"])
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/mars_photos_statistics'", traceback.format_exc())
+
+        # Go to the web page which displays error details to the user:
+        return render_template("error.html", activity="route: '/mars_photos_statistics'", details=traceback.format_exc())
+
+
+# Configure route for "Search" web page (full-text search across planets, constellations, and space news):
+@app.route('/search',methods=["GET", "POST"])
+def search():
+    global db, app
+
+    try:
+        # Instantiate an instance of the "SearchForm" class:
+        form = SearchForm()
+
+        # Validate form entries upon submittal. If validated, perform the search:
+        if form.validate_on_submit():
+            error_msg = ""
+            # Retrieve the ranked search results (with snippets) from the database:
+            search_results = retrieve_from_database(trans_type="search", query=form.txt_query.data)
+
+            if search_results == {}:
+                error_msg = "Error: Data could not be obtained at this time."
+            elif search_results == []:
+                error_msg = "No matching records were retrieved."
+
+            # Show web page with the search results:
+            return render_template("search.html", form=form, search_results=search_results, error_msg=error_msg, recognition_web_template=recognition["web_template"])
+
+        # Go to the "Search" page:
+        return render_template("search.html", form=form, search_results=None, error_msg="", recognition_web_template=recognition["web_template"])
+
+    except:  # An error has occurred.
+        # Log error into system log file:
+        update_system_log("route: '/search'", traceback.format_exc())
+
+        # Go to the web page which displays error details to the user:
+        return render_template("error.html", activity="route: '/search'", details=traceback.format_exc())
+
+
 # Configure route for "Space News" web page:
 @app.route('/space_news')
 def space_news():
@@ -523,7 +931,7 @@ def space_news():
 
     try:
         # Get results of obtaining and processing the desired information:
-        success, error_msg = get_space_news()
+        success, error_msg, date_time_fetched = get_space_news()
 
         if success:
             # Query the table for space news articles:
@@ -537,7 +945,7 @@ def space_news():
             articles = None
 
         # Go to the web page to render the results:
-        return render_template("space_news.html", articles=articles, success=success, error_msg=error_msg, recognition_scope_specific=recognition["space_news"], recognition_web_template=recognition["web_template"])
+        return render_template("space_news.html", articles=articles, success=success, error_msg=error_msg, data_age_note=get_data_age_note(date_time_fetched), recognition_scope_specific=recognition["space_news"], recognition_web_template=recognition["web_template"])
 
     except:  # An error has occurred.
         # Log error into system log file:
@@ -554,10 +962,10 @@ def where_is_iss():
 
     try:
         # Get ISS's current location along with a URL to get a map plotting said location:
-        location_address, location_url = get_iss_location()
+        location_address, location_url, date_time_fetched = get_iss_location()
 
         # Go to the web page to render the results:
-        return render_template("where_is_iss.html", location_address=location_address, location_url=location_url, has_url=not(location_url == ""), recognition_scope_specific=recognition["where_is_iss"], recognition_web_template=recognition["web_template"])
+        return render_template("where_is_iss.html", location_address=location_address, location_url=location_url, has_url=not(location_url == ""), data_age_note=get_data_age_note(date_time_fetched), recognition_scope_specific=recognition["where_is_iss"], recognition_web_template=recognition["web_template"])
 
     except:  # An error has occurred.
         # Log error into system log file:
@@ -574,10 +982,10 @@ def who_is_in_space_now():
 
     try:
         # Get results of obtaining a JSON with the desired information:
-        json, has_json = get_people_in_space_now()
+        json, has_json, date_time_fetched = get_people_in_space_now()
 
         # Go to the web page to render the results:
-        return render_template("who_is_in_space_now.html", json=json, has_json=has_json, recognition_scope_specific=recognition["who_is_in_space_now"], recognition_web_template=recognition["web_template"])
+        return render_template("who_is_in_space_now.html", json=json, has_json=has_json, data_age_note=get_data_age_note(date_time_fetched), recognition_scope_specific=recognition["who_is_in_space_now"], recognition_web_template=recognition["web_template"])
 
     except:  # An error has occurred.
         # Log error into system log file:
@@ -589,6 +997,63 @@ def who_is_in_space_now():
 
 # DEFINE FUNCTIONS TO BE USED FOR THIS APPLICATION (LISTED IN ALPHABETICAL ORDER BY FUNCTION NAME):
 # *************************************************************************************************
+def build_confirmed_planets_query(disc_year=None, host_name=None, modified_since=None):
+    """Function for building the TAP query parameters used to request confirmed planets, optionally filtered by discovery year, host name, and/or modification date"""
+    # Initialize the list of criteria for the query's "where" clause:
+    criteria = [CONFIRMED_PLANETS_QUERY_WHERE]
+
+    # Push any requested filters down into the query (single quotes within values are escaped per ADQL):
+    if disc_year != None:
+        criteria.append(f"disc_year = {int(disc_year)}")
+    if host_name != None:
+        criteria.append(f"hostname = '{str(host_name).replace("'", "''")}'")
+    if modified_since != None:
+        criteria.append(f"rowupdate >= '{modified_since.strftime("%Y-%m-%d")}'")
+
+    # Return the query parameters (requesting CSV format, which can be parsed incrementally) to the calling function:
+    return {"query": f"{CONFIRMED_PLANETS_QUERY_SELECT} where {" and ".join(criteria)} {CONFIRMED_PLANETS_QUERY_ORDER_BY}", "format": "csv"}
+
+
+def claim_lock_file(lock_file_path, wait_seconds):
+    """Function to claim a lock file (in the app. instance folder, shared by all processes serving this website), waiting while another process holds it, returning the claim's token (or None, if not claimed) and whether it was waited for"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Open (creating, if needed) the lock file, and lock it via the operating system, which releases the lock when the holding
+    # process ends (so no lock is ever left stale).  While another process holds it, wait for its release, unless the wait
+    # exceeds the allowance, in which case proceed without claiming it.  The claim's token is the locked file's descriptor:
+    os.makedirs(os.path.dirname(lock_file_path), exist_ok=True)
+    file_descriptor = os.open(lock_file_path, os.O_CREAT | os.O_RDWR)
+    time_started = time.monotonic()
+    has_waited = False
+    try:
+        while True:
+            try:
+                if os.name == "nt":
+                    msvcrt.locking(file_descriptor, msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return file_descriptor, has_waited
+            except OSError:  # Lock file is held by another process (or thread).
+                if time.monotonic() - time_started > wait_seconds:
+                    os.close(file_descriptor)
+                    return None, has_waited
+                has_waited = True
+                time.sleep(LOCK_FILE_POLL_SECONDS)
+    except:
+        os.close(file_descriptor)
+        raise
+
+
+def close_smtp_connection(connection):
+    """Function to close a connection to the e-mail server, disregarding any error (e.g., if the server already dropped it)"""
+    try:
+        connection.quit()
+    except:
+        try:
+            connection.close()
+        except:
+            pass
+
+
 def close_workbook(workbook):
     """Function to close a spreadsheet workbook, checking if the file is open"""
     try:
@@ -603,9 +1068,9 @@ def close_workbook(workbook):
             except xlsxwriter.exceptions.FileCreateError as e:
                 # Inform user that exception has occurred and prompt for confirmation
                 # to re-attempt file creation/closure:
-                user_answer = wx.MessageBox(f"Spreadsheet file '{workbook.filename}' could not be created.\nPlease close the file if it is open in Excel.\nWould you like to try to write the file again?", 'Administrative Update', wx.YES_NO | wx.ICON_QUESTION)
+                user_answer = show_dialog_message(f"Spreadsheet file '{workbook.filename}' could not be created.\nPlease close the file if it is open in Excel.\nWould you like to try to write the file again?", 'Administrative Update', ask_yes_no=True)
 
-                if user_answer == 2:  # User wishes to re-attempt file creation/closure:
+                if user_answer:  # User wishes to re-attempt file creation/closure:
                     user_answer = None
                     continue
                 else:  # User has elected to not re-attempt file creation/closure.
@@ -622,7 +1087,7 @@ def close_workbook(workbook):
 
 def config_database():
     """Function for configuring the database tables supporting this website"""
-    global db, app, ApproachingAsteroids, ConfirmedPlanets, Constellations, MarsPhotoDetails, MarsPhotosAvailable, MarsRoverCameras, MarsRovers, SpaceNews, Users
+    global db, app, ApproachingAsteroids, ApproachingAsteroidsDays, ConfirmedPlanets, ConfirmedPlanetsChanges, ConfirmedPlanetsYearRefreshes, Constellations, ContactOutbox, DatasetVersions, MarsPhotoCounts, MarsPhotoDetails, MarsPhotosAvailable, MarsPhotosSyncQueue, MarsRoverCameras, MarsRoverManifests, MarsRovers, RateLimitBuckets, SpaceNews, UpstreamPayloads, Users
 
     try:
         # Create the database object using the SQLAlchemy constructor:
@@ -633,19 +1098,24 @@ def config_database():
 
         # Configure database tables (listed in alphabetical order; class names are sufficiently descriptive):
         class ApproachingAsteroids(db.Model):
-            id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
             name: Mapped[str] = mapped_column(String(50), nullable=False)
             absolute_magnitude_h: Mapped[float] = mapped_column(Float, nullable=False)
             estimated_diameter_km_min: Mapped[float] = mapped_column(Float, nullable=False)
             estimated_diameter_km_max: Mapped[float] = mapped_column(Float, nullable=False)
             is_potentially_hazardous: Mapped[bool] = mapped_column(Boolean, nullable=False)
-            close_approach_date: Mapped[str] = mapped_column(String(10), nullable=False)
+            close_approach_date: Mapped[str] = mapped_column(String(10), primary_key=True, index=True)
             relative_velocity_km_per_s: Mapped[float] = mapped_column(Float, nullable=False)
             miss_distance_km: Mapped[float] = mapped_column(Float, nullable=False)
             orbiting_body: Mapped[str] = mapped_column(String(20), nullable=False)
             is_sentry_object: Mapped[bool] = mapped_column(Boolean, nullable=False)
             url: Mapped[str] = mapped_column(String(500), nullable=False)
 
+        class ApproachingAsteroidsDays(db.Model):
+            close_approach_date: Mapped[str] = mapped_column(String(10), primary_key=True)
+            asteroid_count: Mapped[int] = mapped_column(Integer, nullable=False)
+            date_time_fetched: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
         class ConfirmedPlanets(db.Model):
             row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
             host_name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -658,6 +1128,20 @@ def config_database():
             discovery_telescope: Mapped[str] = mapped_column(String(50), nullable=False)
             url: Mapped[str] = mapped_column(String(500), nullable=False)
 
+        class ConfirmedPlanetsChanges(db.Model):
+            row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            planet_name: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+            change_type: Mapped[str] = mapped_column(String(10), nullable=False)
+            changed_columns: Mapped[str] = mapped_column(String(250), nullable=False)
+            date_time_refreshed: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+            is_full_refresh: Mapped[bool] = mapped_column(Boolean, nullable=False)
+
+        class ConfirmedPlanetsYearRefreshes(db.Model):
+            discovery_year: Mapped[int] = mapped_column(Integer, primary_key=True)
+            date_time_refreshed: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+            failed_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+            not_before: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
         class Constellations(db.Model):
             row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
             name: Mapped[int] = mapped_column(String(20), unique=True, nullable=False)
@@ -670,16 +1154,70 @@ def config_database():
             brightest_star_name: Mapped[str] = mapped_column(String(40), unique=False, nullable=False)
             brightest_star_url: Mapped[str] = mapped_column(String(40), unique=False, nullable=False)
 
-        class MarsPhotoDetails(db.Model):
+        class ContactOutbox(db.Model):
+            row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            name: Mapped[str] = mapped_column(String(50), nullable=False)
+            email: Mapped[str] = mapped_column(String(250), nullable=False)
+            message: Mapped[str] = mapped_column(Text, nullable=False)
+            status: Mapped[str] = mapped_column(String(10), nullable=False)
+            attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+            not_before: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+            last_error: Mapped[str] = mapped_column(String(250), nullable=True)
+            date_time_queued: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+            date_time_sent: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+        class DatasetVersions(db.Model):
+            dataset_name: Mapped[str] = mapped_column(String(30), primary_key=True)
+            version: Mapped[int] = mapped_column(Integer, nullable=False)
+            row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+            content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+            date_time_refreshed: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+            date_time_changed: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+            spreadsheet_version: Mapped[int] = mapped_column(Integer, nullable=True)
+
+        class MarsPhotoCounts(db.Model):
             row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-            rover_earth_date_combo = mapped_column(String(32), nullable=False)
             rover_name: Mapped[str] = mapped_column(String(15), nullable=False)
-            sol: Mapped[str] = mapped_column(String(15), unique=False, nullable=False)
-            pic_id: Mapped[int] = mapped_column(Integer, nullable=False)
-            earth_date: Mapped[str] = mapped_column(String(15), nullable=False)
+            earth_year: Mapped[int] = mapped_column(Integer, nullable=False)
             camera_name: Mapped[str] = mapped_column(String(20), nullable=False)
-            camera_full_name: Mapped[str] = mapped_column(String(50), nullable=False)
+            total_photos: Mapped[int] = mapped_column(Integer, nullable=False)
+            min_sol: Mapped[int] = mapped_column(Integer, nullable=False)
+            max_sol: Mapped[int] = mapped_column(Integer, nullable=False)
+            __table_args__ = (Index("ix_mars_photo_counts_rover_name_earth_year", "rover_name", "earth_year"),)
+
+        class MarsPhotoDetails(db.Model):
+            row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            rover_id: Mapped[int] = mapped_column(Integer, ForeignKey("mars_rovers.row_id"), nullable=False)
+            sol: Mapped[int] = mapped_column(Integer, nullable=False)
+            pic_id: Mapped[int] = mapped_column(Integer, nullable=False)
+            earth_date: Mapped[date] = mapped_column(Date, nullable=False)
+            camera_id: Mapped[int] = mapped_column(Integer, ForeignKey("mars_rover_cameras.row_id"), nullable=False)
             url: Mapped[str] = mapped_column(String(500), nullable=False)
+            rover = relationship("MarsRovers", lazy="joined")
+            camera = relationship("MarsRoverCameras", lazy="joined")
+            __table_args__ = (Index("ix_mars_photo_details_rover_id_earth_date_sol", "rover_id", "earth_date", "sol"),
+                              Index("ix_mars_photo_details_rover_id_camera_id_sol", "rover_id", "camera_id", "sol"),
+                              Index("ix_mars_photo_details_rover_id_sol", "rover_id", "sol"))
+
+            # Derive the rover name, camera names, and rover name / earth date combo from the related records (rather than
+            # storing them on every row).  These are also included when records are serialized (see "serialize_database_records"):
+            derived_attributes = ["rover_name", "rover_earth_date_combo", "camera_name", "camera_full_name"]
+
+            @property
+            def rover_name(self):
+                return self.rover.rover_name
+
+            @property
+            def rover_earth_date_combo(self):
+                return self.rover.rover_name + "_" + self.earth_date.isoformat()
+
+            @property
+            def camera_name(self):
+                return self.camera.camera_name
+
+            @property
+            def camera_full_name(self):
+                return self.camera.camera_full_name
 
         class MarsPhotosAvailable(db.Model):
             row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -690,17 +1228,45 @@ def config_database():
             cameras: Mapped[str] = mapped_column(String(250), nullable=False)
             total_photos: Mapped[int] = mapped_column(Integer, nullable=False)
 
+        class MarsPhotosSyncQueue(db.Model):
+            rover_earth_date_combo: Mapped[str] = mapped_column(String(32), primary_key=True)
+            rover_name: Mapped[str] = mapped_column(String(15), nullable=False)
+            earth_date: Mapped[str] = mapped_column(String(15), nullable=False)
+            action: Mapped[str] = mapped_column(String(10), nullable=False)
+            total_photos_expected: Mapped[int] = mapped_column(Integer, nullable=False)
+            status: Mapped[str] = mapped_column(String(10), nullable=False)
+            attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+            not_before: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+            last_error: Mapped[str] = mapped_column(String(250), nullable=True)
+            date_time_queued: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+            date_time_updated: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
         class MarsRoverCameras(db.Model):
             row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
             rover_name: Mapped[str] = mapped_column(String(15), nullable=False)
             camera_name: Mapped[str] = mapped_column(String(20), nullable=False)
             camera_full_name: Mapped[str] = mapped_column(String(50), nullable=False)
 
+        class MarsRoverManifests(db.Model):
+            rover_name: Mapped[str] = mapped_column(String(15), primary_key=True)
+            status: Mapped[str] = mapped_column(String(15), nullable=True)
+            max_sol: Mapped[int] = mapped_column(Integer, nullable=False)
+            total_photos: Mapped[int] = mapped_column(Integer, nullable=False)
+            etag: Mapped[str] = mapped_column(String(100), nullable=True)
+            last_modified: Mapped[str] = mapped_column(String(50), nullable=True)
+            date_time_checked: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
         class MarsRovers(db.Model):
             row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
             rover_name: Mapped[str] = mapped_column(String(15), nullable=False)
             active: Mapped[bool] = mapped_column(Boolean, nullable=False)
 
+        class RateLimitBuckets(db.Model):
+            api_name: Mapped[str] = mapped_column(String(30), primary_key=True)
+            period_seconds: Mapped[int] = mapped_column(Integer, primary_key=True)
+            tokens: Mapped[float] = mapped_column(Float, nullable=False)
+            date_time_updated: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
         class SpaceNews(db.Model):
             row_id: Mapped[int] = mapped_column(Integer, primary_key=True)
             article_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -711,15 +1277,68 @@ def config_database():
             date_time_updated: Mapped[datetime] = mapped_column(DateTime, nullable=True)
             url: Mapped[str] = mapped_column(String(500), nullable=False)
 
+        class UpstreamPayloads(db.Model):
+            upstream_name: Mapped[str] = mapped_column(String(30), primary_key=True)
+            payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+            date_time_fetched: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
         class Users(UserMixin, db.Model):
             __tablename__ = "users"
             id: Mapped[int] = mapped_column(Integer, primary_key=True)
             username: Mapped[str] = mapped_column(String(100), unique=True)
             password: Mapped[str] = mapped_column(String(100))
 
-        # Configure the database per the above.  If needed tables do not already exist in the DB, create them:
-        with app.app_context():
-            db.create_all()
+        # Configure the database per the above.  If needed tables do not already exist in the DB, create them.  The configuration
+        # is made by one process at a time (e.g., when several worker processes serving this website start together), as
+        # concurrent schema changes would conflict:
+        lock_file_path = os.path.join(app.instance_path, "database_setup.lock")
+        lock_token, has_waited = claim_lock_file(lock_file_path, DATABASE_SETUP_LOCK_WAIT_SECONDS)
+        try:
+            with app.app_context():
+                # Apply the SQLite settings to every connection, and have SQLite transactions begin explicitly (the SQLite driver
+                # otherwise commits DDL statements, such as those used in swapping in a refreshed table, immediately rather than as
+                # part of the transaction in progress).  If configured, start periodic checkpoints of the write-ahead log:
+                if db.engine.dialect.name == "sqlite":
+                    event.listen(db.engine, "connect", config_database_sqlite_connection)
+                    event.listen(db.engine, "begin", lambda connection: connection.exec_driver_sql("BEGIN"))
+                    if DATABASE_CHECKPOINT_INTERVAL_SECONDS > 0:
+                        threading.Thread(target=run_database_checkpoints, daemon=True).start()
+
+                # Migrate any database table still having its original structure, then create any needed tables which do not exist:
+                config_database_migrate_approaching_asteroids()
+                config_database_migrate_confirmed_planets_changes()
+                config_database_migrate_mars_photo_details()
+                db.create_all()
+
+                # Create any needed indexes which do not exist (i.e., indexes added to tables which already existed):
+                for table in db.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(db.session.connection(), checkfirst=True)
+
+                # For SQLite: Create the full-text search indexes (FTS5 virtual tables) if they do not already exist.  If an index is
+                # empty while its source table is populated (e.g., index newly created), populate the index from its source table.
+                # Also, normalize any rover activity flags stored as text ("Yes"/"No") to boolean values:
+                if db.engine.dialect.name == "sqlite":
+                    for scope in search_index_attributes:
+                        db.session.execute(text(f"CREATE VIRTUAL TABLE IF NOT EXISTS {search_index_attributes[scope]["fts_table"]} USING fts5(source_row_id UNINDEXED, url UNINDEXED, {", ".join(search_index_attributes[scope]["columns"])})"))
+                        if db.session.execute(text(f"SELECT COUNT(*) FROM {search_index_attributes[scope]["fts_table"]}")).scalar() == 0:
+                            update_database_search_index(scope)
+
+                    db.session.execute(text("UPDATE mars_rovers SET active = CASE WHEN active = 'Yes' THEN 1 ELSE 0 END WHERE active IN ('Yes', 'No')"))
+
+                # If the photo counts aggregate is empty while photo details exist (e.g., aggregate newly created), populate it:
+                if db.session.execute(db.select(func.count(MarsPhotoCounts.row_id))).scalar() == 0 and db.session.execute(db.select(func.count(MarsPhotoDetails.row_id))).scalar() > 0:
+                    update_database_mars_photo_counts(None)
+
+                # Record the initial version of any versioned dataset which does not yet have one.  Also, refresh the version of the
+                # "mars_rovers" dataset (so that any changes made to that table outside of this application are detected):
+                for scope in versioned_datasets:
+                    if db.session.get(DatasetVersions, scope) == None or scope == "mars_rovers":
+                        update_dataset_version(scope)
+                db.session.commit()
+        finally:
+            if lock_token != None:
+                release_lock_file(lock_token)
 
         # At this point, function is presumed to have executed successfully.  Return\
         # successful-execution indication to the calling function:
@@ -732,9 +1351,108 @@ def config_database():
         return False
 
 
+def config_database_migrate_approaching_asteroids():
+    """Function for migrating the "approaching_asteroids" database table from its original structure (keyed by asteroid ID alone, so only one close approach per asteroid could be kept) to its structure keyed by asteroid ID and close-approach date"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the table does not yet exist, or has already been migrated, no migration is needed:
+    if not inspect(db.engine).has_table("approaching_asteroids") or "close_approach_date" in inspect(db.engine).get_pk_constraint("approaching_asteroids")["constrained_columns"]:
+        return
+
+    # Set aside the table in its original structure (dropping its index, whose name the new structure re-uses), and create
+    # the table in its new structure (including its index):
+    db.session.execute(text("DROP INDEX IF EXISTS ix_approaching_asteroids_close_approach_date"))
+    db.session.execute(text("ALTER TABLE approaching_asteroids RENAME TO approaching_asteroids_legacy"))
+    db.metadata.tables["approaching_asteroids"].create(db.session.connection())
+
+    # Copy the original records into the table in its new structure:
+    columns = ", ".join(column.name for column in db.metadata.tables["approaching_asteroids"].columns)
+    db.session.execute(text(f"INSERT INTO approaching_asteroids ({columns}) SELECT {columns} FROM approaching_asteroids_legacy"))
+
+    # Drop the table in its original structure, and commit all of the above as a single transaction:
+    db.session.execute(text("DROP TABLE approaching_asteroids_legacy"))
+    db.session.commit()
+
+    # Update system log to record the migration:
+    update_system_log("config_database_migrate_approaching_asteroids", "Successfully migrated.")
+
+
+def config_database_migrate_confirmed_planets_changes():
+    """Function for migrating the "confirmed_planets_changes" database table from its original structure (no record of whether each changeset came from a full or a partial refresh) to its current structure"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the table does not yet exist, or has already been migrated, no migration is needed:
+    if not inspect(db.engine).has_table("confirmed_planets_changes") or "is_full_refresh" in [column["name"] for column in inspect(db.engine).get_columns("confirmed_planets_changes")]:
+        return
+
+    # Add the column, deeming existing changesets to be from full refreshes (the scope of those refreshes was not recorded),
+    # and commit:
+    db.session.execute(text("ALTER TABLE confirmed_planets_changes ADD COLUMN is_full_refresh BOOLEAN NOT NULL DEFAULT TRUE"))
+    db.session.commit()
+
+    # Update system log to record the migration:
+    update_system_log("config_database_migrate_confirmed_planets_changes", "Successfully migrated.")
+
+
+def config_database_migrate_mars_photo_details():
+    """Function for migrating the "mars_photo_details" database table from its original structure (repeated rover/camera names, string-typed sol and earth date) to its normalized, typed structure"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the table does not yet exist, or has already been migrated, no migration is needed:
+    if not inspect(db.engine).has_table("mars_photo_details") or not ("rover_earth_date_combo" in [column["name"] for column in inspect(db.engine).get_columns("mars_photo_details")]):
+        return
+
+    # Set aside the table in its original structure, and create the table in its new structure (including its index):
+    db.session.execute(text("ALTER TABLE mars_photo_details RENAME TO mars_photo_details_legacy"))
+    db.metadata.tables["mars_rovers"].create(db.session.connection(), checkfirst=True)
+    db.metadata.tables["mars_rover_cameras"].create(db.session.connection(), checkfirst=True)
+    db.metadata.tables["mars_photo_details"].create(db.session.connection())
+    legacy_table = Table("mars_photo_details_legacy", MetaData(), autoload_with=db.session.connection())
+
+    # Look up (creating any missing) the IDs of the rovers and cameras referenced in the original table:
+    rover_ids, camera_ids = update_database_mars_rover_and_camera_ids([record._mapping for record in db.session.execute(db.select(legacy_table.c.rover_name, legacy_table.c.camera_name, legacy_table.c.camera_full_name).distinct()).all()])
+
+    # Copy the original records, in chunks, into the table in its new structure:
+    legacy_records = db.session.execute(db.select(legacy_table).order_by(legacy_table.c.row_id).execution_options(yield_per=MARS_PHOTO_DETAILS_MIGRATION_CHUNK_SIZE))
+    for chunk in legacy_records.partitions():
+        db.session.execute(db.insert(MarsPhotoDetails), [{
+            "rover_id": rover_ids[record.rover_name],
+            "sol": int(record.sol),
+            "pic_id": record.pic_id,
+            "earth_date": date.fromisoformat(record.earth_date),
+            "camera_id": camera_ids[(record.rover_name, record.camera_name)],
+            "url": record.url
+        } for record in chunk])
+
+    # Drop the table in its original structure, and commit all of the above as a single transaction:
+    db.session.execute(text("DROP TABLE mars_photo_details_legacy"))
+    db.session.commit()
+
+    # For SQLite: Reclaim the space freed by the migration (on a connection outside of any transaction):
+    if db.engine.dialect.name == "sqlite":
+        connection = db.engine.raw_connection()
+        try:
+            connection.cursor().execute("VACUUM")
+        finally:
+            connection.close()
+
+    # Update system log to record the migration:
+    update_system_log("config_database_migrate_mars_photo_details", "Successfully migrated.")
+
+
+def config_database_sqlite_connection(dbapi_connection, connection_record):
+    """Function for applying this application's SQLite settings to a new database connection"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Disable the SQLite driver's own transaction handling (transactions are begun explicitly instead; see "config_database"):
+    dbapi_connection.isolation_level = None
+
+    # Apply each of the SQLite settings (pragmas):
+    cursor = dbapi_connection.cursor()
+    for pragma in sqlite_pragmas:
+        cursor.execute(f"PRAGMA {pragma} = {sqlite_pragmas[pragma]}")
+    cursor.close()
+
+
 def config_web_forms():
     """Function for configuring the web forms supporting this website"""
-    global AdminLoginForm, AdminUpdateForm, ContactForm, DisplayApproachingAsteroidsSheetForm, DisplayConfirmedPlanetsSheetForm, DisplayConstellationSheetForm, DisplayMarsPhotosSheetForm, ViewApproachingAsteroidsForm, ViewConfirmedPlanetsForm, ViewConstellationForm, ViewMarsPhotosForm
+    global AdminLoginForm, AdminUpdateForm, ContactForm, DisplayApproachingAsteroidsSheetForm, DisplayConfirmedPlanetsSheetForm, DisplayConstellationSheetForm, DisplayMarsPhotosSheetForm, FilterMarsPhotosForm, SearchForm, ViewApproachingAsteroidsForm, ViewConfirmedPlanetsForm, ViewConstellationForm, ViewMarsPhotosForm
 
     try:
         # CONFIGURE WEB FORMS (LISTED IN ALPHABETICAL ORDER):
@@ -747,9 +1465,12 @@ def config_web_forms():
         # Configure "admin_update" form:
         class AdminUpdateForm(FlaskForm):
             chk_approaching_asteroids = BooleanField(label="Approaching Asteroids", default=True)
+            date_approaching_asteroids_start = DateField(label="Approaching Asteroids - Range Start (Optional):", validators=[Optional()])
+            date_approaching_asteroids_end = DateField(label="Approaching Asteroids - Range End (Optional):", validators=[Optional()])
             chk_confirmed_planets = BooleanField(label="Confirmed Planets", default=True)
             chk_constellations = BooleanField(label="Constellations", default=True)
             chk_mars_photos = BooleanField(label="Photos from Mars", default=True)
+            chk_mars_photos_retry_failed = BooleanField(label="Photos from Mars - Re-attempt Rover/Earth Dates Which Failed", default=False)
             button_submit = SubmitField(label="Begin Update")
 
         # Configure 'contact us' form:
@@ -761,26 +1482,40 @@ def config_web_forms():
 
         # Configure form for viewing "approaching asteroids" spreadsheet:
         class DisplayApproachingAsteroidsSheetForm(FlaskForm):
-            list_approaching_asteroids_sheet_name = SelectField("Approaching Asteroids Sheet:", choices=[],
-                                                                validate_choice=False)
+            list_approaching_asteroids_sheet_name = SelectField("Approaching Asteroids Sheet:", choices=[])
             button_submit = SubmitField(label="View Approaching Asteroids Spreadsheet")
 
         # Configure form for viewing "confirmed planets" spreadsheet:
         class DisplayConfirmedPlanetsSheetForm(FlaskForm):
-            list_confirmed_planets_sheet_name = SelectField("Confirmed Planets Sheet:", choices=[],
-                                                            validate_choice=False)
+            list_confirmed_planets_sheet_name = SelectField("Confirmed Planets Sheet:", choices=[])
             button_submit = SubmitField(label="View Confirmed Planets Spreadsheet")
 
         # Configure form for viewing "constellations" spreadsheet:
         class DisplayConstellationSheetForm(FlaskForm):
-            list_constellation_sheet_name = SelectField("Constellation Sheet:", choices=[], validate_choice=False)
+            list_constellation_sheet_name = SelectField("Constellation Sheet:", choices=[])
             button_submit = SubmitField(label="View Constellations Spreadsheet")
 
         # Configure form for viewing "Mars photos" spreadsheet (summary or detailed):
         class DisplayMarsPhotosSheetForm(FlaskForm):
-            list_mars_photos_sheet_name = SelectField("Mars Photos Sheet:", choices=[], validate_choice=False)
+            list_mars_photos_sheet_name = SelectField("Mars Photos Sheet:", choices=[])
             button_submit = SubmitField(label="View Mars Photos Spreadsheet")
 
+        # Configure form for filtering "Mars photos" by rover, camera, sol range, and earth date range (submitted via GET, so
+        # that filtered results can be paged and bookmarked):
+        class FilterMarsPhotosForm(FlaskForm):
+            list_rover_name = SelectField("Rover Name:", choices=[], validate_choice=False)
+            list_camera_name = SelectField("Camera Name (Optional):", choices=[], validate_choice=False)
+            int_sol_min = IntegerField(label="SOL - Range Start (Optional):", validators=[Optional()])
+            int_sol_max = IntegerField(label="SOL - Range End (Optional):", validators=[Optional()])
+            date_earth_date_min = DateField(label="Earth Date - Range Start (Optional):", validators=[Optional()])
+            date_earth_date_max = DateField(label="Earth Date - Range End (Optional):", validators=[Optional()])
+            button_submit = SubmitField(label="View Filtered Photos")
+
+        # Configure form for searching (full-text) across planets, constellations, and space news:
+        class SearchForm(FlaskForm):
+            txt_query = StringField(label="Search Planets, Constellations, and Space News:", validators=[InputRequired(), Length(max=100)])
+            button_submit = SubmitField(label="Search")
+
         # Configure form for viewing "approaching asteroids" data online (on dedicated web page):
         class ViewApproachingAsteroidsForm(FlaskForm):
             list_close_approach_date = SelectField("Select Close Approach Date:", choices=[], validate_choice=False)
@@ -813,6 +1548,54 @@ def config_web_forms():
         return False
 
 
+def create_app():
+    """Function to create (configure) the Flask app. object for this website, along with its database and web forms, returning the app. object (or None if configuration failed)"""
+    global app, is_app_configured
+
+    try:
+        # If the app. has already been fully configured (e.g., by another entry point in this process), return it as is:
+        if is_app_configured:
+            return app
+
+        # Load environmental variables from the ".env" file:
+        load_dotenv()
+
+        # Configure the database (by default, a SQLite database relative to the app instance folder) and its connection pool:
+        app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"pool_pre_ping": DATABASE_POOL_PRE_PING, "pool_recycle": DATABASE_POOL_RECYCLE_SECONDS}
+        if not DATABASE_URI.startswith("sqlite"):
+            app.config["SQLALCHEMY_ENGINE_OPTIONS"].update({"pool_size": DATABASE_POOL_SIZE, "max_overflow": DATABASE_POOL_MAX_OVERFLOW})
+
+        # Initialize an instance of Bootstrap5, using the "app" object defined above as a parameter:
+        Bootstrap5(app)
+
+        # Retrieve the secret key to be used for CSRF protection:
+        app.secret_key = os.getenv("SECRET_KEY_FOR_CSRF_PROTECTION")
+
+        # Configure database tables.  If function failed, update system log and return
+        # failed-execution indication to the calling function::
+        if not config_database():
+            update_system_log("create_app", "Error: Database configuration failed.")
+            return None
+
+        # Configure web forms.  If function failed, update system log and return
+        # failed-execution indication to the calling function::
+        if not config_web_forms():
+            update_system_log("create_app", "Error: Web forms configuration failed.")
+            return None
+
+        # Start the background sender of messages queued in the contact outbox:
+        threading.Thread(target=run_contact_outbox_sender, daemon=True).start()
+
+        # All of the above succeeded.  Record the app. as fully configured, and return it to the calling function:
+        is_app_configured = True
+        return app
+
+    except:  # An error has occurred.
+        update_system_log("create_app", traceback.format_exc())
+        return None
+
+
 def create_workbook(workbook_name):
     """Function for creating and returning a spreadsheet workbook for subsequent population/formatting"""
     try:
@@ -854,9 +1637,9 @@ def delete_mars_photos_workbooks():
             except PermissionError:
                 # Inform user that exception has occurred and prompt for confirmation
                 # to re-attempt file deletion:
-                user_answer = wx.MessageBox(f"File 'Mars Photos - Summary.xlsx' could not be deleted prior to the upcoming update.\nPlease close the file if open in Excel.\nWould you like to try to delete the file again?", 'Administrative Update', wx.YES_NO | wx.ICON_QUESTION)
+                user_answer = show_dialog_message(f"File 'Mars Photos - Summary.xlsx' could not be deleted prior to the upcoming update.\nPlease close the file if open in Excel.\nWould you like to try to delete the file again?", 'Administrative Update', ask_yes_no=True)
 
-                if user_answer == 2:  # User wishes to re-attempt file deletion:
+                if user_answer:  # User wishes to re-attempt file deletion:
                     user_answer = None
                     continue
                 else:  # User has elected to not re-attempt file deletion.
@@ -880,11 +1663,11 @@ def delete_mars_photos_workbooks():
             except PermissionError:
                 # Inform user that exception has occurred and prompt for confirmation
                 # to re-attempt file deletion:
-                user_answer = wx.MessageBox(
+                user_answer = show_dialog_message(
                     f"One or more Mars photo details workbooks could not be deleted prior to the upcoming update.\nPlease close the file(s) if open in Excel.\nWould you like to try to delete the file(s) again?",
-                    'Administrative Update', wx.YES_NO | wx.ICON_QUESTION)
+                    'Administrative Update', ask_yes_no=True)
 
-                if user_answer == 2:  # User wishes to re-attempt file deletion:
+                if user_answer:  # User wishes to re-attempt file deletion:
                     user_answer = None
                     continue
                 else:  # User has elected to not re-attempt file deletion.
@@ -907,31 +1690,19 @@ def delete_mars_photos_workbooks():
 
 
 def email_from_contact_page(form):
-    """Function to process a message that user wishes to e-mail from this website to the website administrator."""
+    """Function to queue, in the contact outbox, a message that user wishes to e-mail from this website to the website administrator (the message is sent by a background sender)"""
     try:
-        # E-mail the message using the contents of the "Contact Us" web page form as input:
-        with smtplib.SMTP(SENDER_HOST, port=SENDER_PORT) as connection:
-            try:
-                # Make connection secure, including encrypting e-mail.
-                connection.starttls()
-            except:
-                # Return failed-execution message to the calling function:
-                return "Error: Could not make connection to send e-mails. Your message was not sent."
-            try:
-                # Login to sender's e-mail server.
-                connection.login(SENDER_EMAIL_GMAIL, SENDER_PASSWORD_GMAIL)
-            except:
-                # Return failed-execution message to the calling function:
-                return "Error: Could not log into e-mail server to send e-mails. Your message was not sent."
-            else:
-                # Send e-mail.
-                connection.sendmail(
-                    from_addr=SENDER_EMAIL_GMAIL,
-                    to_addrs=SENDER_EMAIL_GMAIL,
-                    msg=f"Subject: Eye for Space - E-mail from 'Contact Us' page\n\nName: {form.txt_name.data}\nE-mail address: {form.txt_email.data}\n\nMessage:\n{form.txt_message.data}"
-                )
-                # Return successful-execution message to the calling function::
-                return "Your message has been successfully sent."
+        # Add the message, using the contents of the "Contact Us" web page form as input, to the "contact_outbox" database table.
+        # If function failed, update system log and return failed-execution message to the calling function:
+        if not update_database("update_contact_outbox", {"name": form.txt_name.data, "email": form.txt_email.data, "message": form.txt_message.data}):
+            update_system_log("email_from_contact_page", "Error: Message could not be queued.")
+            return "Error: Your message could not be received at this time. Your message was not sent."
+
+        # Wake the background sender, so that the message is sent promptly:
+        contact_outbox_event.set()
+
+        # Return successful-execution message to the calling function::
+        return "Your message has been received and will be sent shortly."
 
     except:  # An error has occurred.
         update_system_log("email_from_contact_page", traceback.format_exc())
@@ -943,6 +1714,11 @@ def email_from_contact_page(form):
 def export_data_to_spreadsheet_standard(data_scope, data_to_export):
     """Function to export data to a spreadsheet, with all appropriate formatting applied"""
     try:
+        # If the spreadsheet was already exported from the dataset's current version (and still exists), skip its regeneration:
+        dataset_version = get_dataset_version(data_scope)
+        if dataset_version["spreadsheet_version"] == dataset_version["version"] and os.path.exists(spreadsheet_attributes[data_scope]["wrkbk_name"]):
+            return True
+
         # Capture current date/time:
         current_date_time = datetime.now()
         current_date_time_spreadsheet = current_date_time.strftime("%d-%b-%Y @ %I:%M %p")
@@ -992,6 +1768,9 @@ def export_data_to_spreadsheet_standard(data_scope, data_to_export):
             update_system_log("export_data_to_spreadsheet_standard (" + data_scope + ")", "Error: Spreadsheet file creation failed.")
             return False
 
+        # Record the dataset version from which the spreadsheet was exported:
+        update_database("update_dataset_spreadsheet_version", data_scope, version=dataset_version["version"])
+
         # Return successful-execution indication to the calling function:
         return True
 
@@ -1006,7 +1785,7 @@ def export_mars_photos_to_spreadsheet(photos_available, photo_details):
     """Function to export data on available Mars rover photos to a spreadsheet, with all appropriate formatting applied"""
     try:
         # Inform user that export-to-spreadsheet execution will begin:
-        dlg = PBI.PyBusyInfo("Photos from Mars: Exporting results to spreadsheet file...", title="Administrative Update")
+        dlg = show_dialog_busy_info("Photos from Mars: Exporting results to spreadsheet file...")
 
         # Capture current date/time:
         current_date_time = datetime.now()
@@ -1046,11 +1825,11 @@ def export_mars_photos_to_spreadsheet(photos_available, photo_details):
         # Complete file creation/closure of the photos available summary workbook, checking if the file is open.
         # If an error occurred or if file is open and user elected to not re-attempt file creation/closure, update
         # system log and return failed-execution indication to the calling function:
-        dlg = PBI.PyBusyInfo("Photos from Mars: Spreadsheet file 'Mars Photos - Summary.xlsx': Saving in progress...", title="Administrative Update")
+        dlg = show_dialog_busy_info("Photos from Mars: Spreadsheet file 'Mars Photos - Summary.xlsx': Saving in progress...")
         if not close_workbook(photos_available_workbook):
             update_system_log("export_mars_photos_to_spreadsheet", "Error: Spreadsheet file creation (photos available summary) failed.")
             return False
-        dlg = PBI.PyBusyInfo("Photos from Mars: Spreadsheet file 'Mars Photos - Summary.xlsx': Saving completed...", title="Administrative Update")
+        dlg = show_dialog_busy_info("Photos from Mars: Spreadsheet file 'Mars Photos - Summary.xlsx': Saving completed...")
 
         # For each rover, create and format a worksheet to contain details for available photos taken by that rover
         # each earth year.  If function failed, update system log and return failed-execution indication to the calling function:
@@ -1128,12 +1907,10 @@ def export_mars_photos_to_spreadsheet(photos_available, photo_details):
 
             # Complete file creation/closure of the workbook, checking if the file is open.  If an error occurred or if file is open and user elected to not
             # re-attempt file creation/closure, update system log and return failed-execution indication to the calling function:
-            dlg = PBI.PyBusyInfo(
-                f"Photos from Mars: Spreadsheet file 'Mars Photos - Details - {worksheets_needed[i][0]}.xlsx': Saving in progress...",title="Administrative Update")
+            dlg = show_dialog_busy_info(f"Photos from Mars: Spreadsheet file 'Mars Photos - Details - {worksheets_needed[i][0]}.xlsx': Saving in progress...")
             if not close_workbook(photo_details_workbook):
                 return False
-            dlg = PBI.PyBusyInfo(
-                f"Photos from Mars: Spreadsheet file 'Mars Photos - Details - {worksheets_needed[i][0]}.xlsx': Saving completed...",title="Administrative Update")
+            dlg = show_dialog_busy_info(f"Photos from Mars: Spreadsheet file 'Mars Photos - Details - {worksheets_needed[i][0]}.xlsx': Saving completed...")
 
         # Return successful-execution indication to the calling function:
         return True
@@ -1152,27 +1929,184 @@ def find_element(driver, find_type, find_details):
         return driver.find_element(By.XPATH, find_details)
 
 
-def get_approaching_asteroids():
+def get_api_response(scope, trans_type, **kwargs):
+    """Function to build a REST API response for a database-backed dataset, answering conditional requests from the dataset's version (i.e., without querying the database)"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Derive the ETag and Last-Modified values from the dataset's current version:
+    dataset_version = get_dataset_version(scope)
+    etag = f"{scope}-{dataset_version["version"]}-{dataset_version["content_hash"][:16]}"
+    last_modified = dataset_version["date_time_changed"].astimezone(timezone.utc).replace(microsecond=0)
+
+    # If the client's cached copy is current, return "304 Not Modified" (with no body).  Otherwise, retrieve the requested
+    # records from the database and return them as JSON:
+    if request.if_none_match.contains(etag) or (not request.if_none_match and request.if_modified_since != None and last_modified <= request.if_modified_since):
+        response = Response(status=304)
+    else:
+        records = retrieve_from_database(trans_type, **kwargs)
+        if records == {} and scope != "constellations":
+            return jsonify({"error": "Data could not be obtained at this time."}), 503
+        response = jsonify(serialize_database_records(records))
+
+    # Tag the response with the ETag and Last-Modified values, and require clients to revalidate their cached copies:
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+
+    # Return the response to the calling function:
+    return response
+
+
+def get_approaching_asteroids(start_date=None, end_date=None):
     """Function that retrieves and processes a list of asteroids based on closest approach to Earth"""
-    # Capture the current date:
-    current_date = datetime.now()
+    # If no range has been requested, capture the current date + an added window (delta) of the following 7 days.
+    # Otherwise, convert the requested range (start and end dates) to date/time values:
+    if start_date == None or end_date == None:
+        start_date = datetime.now()
+        end_date = start_date + timedelta(days=APPROACHING_ASTEROIDS_REFRESH_WINDOW_DAYS)
+    else:
+        start_date = datetime.combine(start_date, datetime.min.time())
+        end_date = datetime.combine(end_date, datetime.min.time())
+
+    try:
+        # If the requested range is invalid, update system log and return a failed-execution indication to the calling function:
+        if end_date < start_date:
+            update_system_log("get_approaching_asteroids", "Error: Range end date precedes range start date.")
+            return "Error: Range end date precedes range start date.", False
+
+        # Identify the close-approach dates (within the requested range) which have either never been fetched or whose
+        # data has expired.  If the function called returns an empty dictionary, update system log and return a
+        # failed-execution indication to the calling function:
+        days_to_fetch = retrieve_from_database("approaching_asteroids_days_to_fetch", start_date=start_date, end_date=end_date)
+        if days_to_fetch == {}:
+            update_system_log("get_approaching_asteroids", "Error: Data (days to fetch) cannot be obtained at this time.")
+            return "Error: Data (days to fetch) cannot be obtained at this time.", False
+
+        # If an empty list was returned, all close-approach dates in the requested range are up to date.  Therefore, no API
+        # request is needed.  Update system log and return successful-execution indication to the calling function:
+        elif days_to_fetch == []:
+            update_system_log("get_approaching_asteroids", "Data is already up to date. No update was needed.")
+            return "", True
+
+        # Execute the API requests (one per 7-day window of missing/expired dates, executed concurrently) and capture the
+        # merged results. If no window could be fetched, update system log and return failed-execution indication to the
+        # calling function:
+        approaching_asteroids, days_fetched, windows_failed = get_approaching_asteroids_from_api(days_to_fetch)
+        if days_fetched == []:
+            update_system_log("get_approaching_asteroids", "Error: API request failed. Data cannot be obtained at this time.")
+            return "Error: API request failed. Data cannot be obtained at this time.", False
+
+        # If only some of the windows could be fetched, log the windows that failed (their dates remain missing and will
+        # be requested again upon the next update):
+        if windows_failed != []:
+            update_system_log("get_approaching_asteroids", f"Warning: API request failed for the following date windows (to be re-attempted upon next update): {windows_failed}")
 
-    # Capture the current date + an added window (delta) of the following 7 days:
-    current_date_with_delta = current_date + timedelta(days=7)
+        # Upsert the fetched close-approach dates into the "approaching_asteroids" database table (records for all
+        # other dates are retained as history), and record the fetch date/time for each such date.  If an error
+        # occurred, update system log and return a failed-execution indication to the calling function:
+        if not update_database("update_approaching_asteroids", approaching_asteroids, days_fetched=days_fetched):
+            update_system_log("get_approaching_asteroids", "Error: Database could not be updated. Data cannot be obtained at this time.")
+            return "Error: Database could not be updated. Data cannot be obtained at this time.", False
+
+        # Retrieve all existing records in the "approaching_asteroids" database table. If the function
+        # called returns an empty directory, update system log and return a failed-execution indication
+        # to the calling function:
+        asteroids_data = retrieve_from_database("approaching_asteroids")
+        if asteroids_data == {}:
+            update_system_log("get_approaching_asteroids", "Error: Data cannot be obtained at this time.")
+            return "Error: Data cannot be obtained at this time.", False
+
+        # If an empty list was returned, no records satisfied the query.  Therefore, update system log and
+        # return a failed-execution indication to the calling function:
+        elif asteroids_data == []:
+            update_system_log("get_approaching_asteroids", "No matching records were retrieved.")
+            return "No matching records were retrieved.", False
+
+        # Create and format a spreadsheet file (workbook) to contain all asteroids data. If execution failed,
+        # update system log and return failed-execution indication to the calling function:
+        if not export_data_to_spreadsheet_standard("approaching_asteroids", asteroids_data):
+            update_system_log("get_approaching_asteroids", "Error: Spreadsheet creation could not be completed at this time.")
+            return "Error: Spreadsheet creation could not be completed at this time.", False
+
+        # At this point, function is deemed to have executed successfully.  Update system log and
+        # return successful-execution indication to the calling function:
+        update_system_log("get_approaching_asteroids", "Successfully updated.")
+        return "", True
+
+    except:  # An error has occurred.
+        update_system_log("get_approaching_asteroids", traceback.format_exc())
+
+        # Return failed-execution indication to the calling function:
+        return "An error has occurred. Data cannot be obtained at this time.", False
+
+
+def get_approaching_asteroids_from_api(days_to_fetch):
+    """Function that retrieves, via concurrent API requests (one per 7-day window), asteroids approaching Earth on the specified dates"""
+    # Initialize variables to be used for returning values to the calling function:
+    approaching_asteroids = []
+    days_fetched = []
+    windows_failed = []
 
     try:
-        # Execute the API request (limit: closest approach <= 7 days from today):
-        response = requests.get(URL_CLOSEST_APPROACH_ASTEROIDS + "?start_date=" + current_date.strftime("%Y-%m-%d") + "&end_date=" + current_date_with_delta.strftime("%Y-%m-%d") + "&api_key=" + API_KEY_CLOSEST_APPROACH_ASTEROIDS)
+        # Split the (ascending) dates to fetch into windows of at most 7 days, skipping over dates that do not need fetching:
+        windows = []
+        for day in days_to_fetch:
+            if windows != [] and datetime.strptime(day, "%Y-%m-%d") <= datetime.strptime(windows[len(windows) - 1][0], "%Y-%m-%d") + timedelta(days=APPROACHING_ASTEROIDS_REFRESH_WINDOW_DAYS):
+                windows[len(windows) - 1][1] = day
+            else:
+                windows.append([day, day])
+
+        # Limit the number of windows (i.e., API requests) to what the API key's hourly limit allows.  Dates in windows
+        # beyond the limit remain missing and will be requested upon a subsequent update:
+        if len(windows) > APPROACHING_ASTEROIDS_MAX_REQUESTS_PER_RANGE:
+            windows_failed = windows[APPROACHING_ASTEROIDS_MAX_REQUESTS_PER_RANGE:]
+            windows = windows[:APPROACHING_ASTEROIDS_MAX_REQUESTS_PER_RANGE]
+
+        # Execute the API requests concurrently (with a bounded number of requests in flight at any given time):
+        with ThreadPoolExecutor(max_workers=APPROACHING_ASTEROIDS_MAX_CONCURRENT_REQUESTS) as executor:
+            results = list(executor.map(lambda window: get_approaching_asteroids_from_api_by_window(window[0], window[1]), windows))
+
+        # Merge the results from all windows:
+        for i in range(0, len(windows)):
+            if results[i] == {}:  # API request for this window failed.
+                windows_failed.append(windows[i])
+            else:
+                approaching_asteroids += results[i]["approaching_asteroids"]
+                days_fetched += results[i]["days_fetched"]
 
-        # Initialize variable to store collected necessary asteroid data:
+    except:  # An error has occurred.
+        update_system_log("get_approaching_asteroids_from_api", traceback.format_exc())
         approaching_asteroids = []
+        days_fetched = []
+
+    finally:
+        # Return results to the calling function:
+        return approaching_asteroids, days_fetched, windows_failed
 
-        # If the API request was successful, display the results:
+
+def get_approaching_asteroids_from_api_by_window(start_date, end_date):
+    """Function that retrieves, via a single API request, asteroids approaching Earth within a window of at most 7 days"""
+    try:
+        # Acquire a rate-limit token.  If none is available, update system log and return failed-execution indication to the
+        # calling function (the window is re-attempted upon the next update):
+        wait_seconds = get_rate_limit_token("approaching_asteroids")
+        if wait_seconds > 0:
+            update_system_log("get_approaching_asteroids_from_api_by_window", f"Rate limit reached (retry in about {math.ceil(wait_seconds)} seconds). Data for {start_date} to {end_date} cannot be obtained at this time.")
+            return {}
+
+        # Execute the API request (limit: closest approach <= 7 days from the start date):
+        response = requests.get(URL_CLOSEST_APPROACH_ASTEROIDS, params={"start_date": start_date, "end_date": end_date, "api_key": API_KEY_CLOSEST_APPROACH_ASTEROIDS}, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+
+        # If the API request was successful, capture the results:
         if response.status_code == 200:  # API request was successful.
+            # Initialize variable to store collected necessary asteroid data:
+            approaching_asteroids = []
+
+            # Parse the returned JSON (once) and capture the asteroids listed per close-approach date:
+            near_earth_objects = response.json()["near_earth_objects"]
 
             # Capture desired fields from the returned JSON:
-            for key in response.json()["near_earth_objects"]:
-                for asteroid in response.json()["near_earth_objects"][key]:
+            for key in near_earth_objects:
+                for asteroid in near_earth_objects[key]:
                     asteroid_dict = {
                         "id": asteroid["id"],
                         "name": asteroid["name"],
@@ -1191,74 +2125,40 @@ def get_approaching_asteroids():
                     # Add captured data for each asteroid (as a dictionary) to the "approaching_asteroids" list:
                     approaching_asteroids.append(asteroid_dict)
 
-            # Delete the existing records in the "approaching_asteroids" database table and update same with
-            # the up-to-date data (from the JSON).  If an error occurred, update system log and return a
-            # failed-execution indication to the calling function:
-            if not update_database("update_approaching_asteroids", approaching_asteroids):
-                update_system_log("get_approaching_asteroids", "Error: Database could not be updated. Data cannot be obtained at this time.")
-                return "Error: Database could not be updated. Data cannot be obtained at this time.", False
-
-            # Retrieve all existing records in the "approaching_asteroids" database table. If the function
-            # called returns an empty directory, update system log and return a failed-execution indication
-            # to the calling function:
-            asteroids_data = retrieve_from_database("approaching_asteroids")
-            if asteroids_data == {}:
-                update_system_log("get_approaching_asteroids", "Error: Data cannot be obtained at this time.")
-                return "Error: Data cannot be obtained at this time.", False
-
-            # If an empty list was returned, no records satisfied the query.  Therefore, update system log and
-            # return a failed-execution indication to the calling function:
-            elif asteroids_data == []:
-                update_system_log("get_approaching_asteroids", "No matching records were retrieved.")
-                return "No matching records were retrieved.", False
-
-            # Create and format a spreadsheet file (workbook) to contain all asteroids data. If execution failed,
-            # update system log and return failed-execution indication to the calling function:
-            if not export_data_to_spreadsheet_standard("approaching_asteroids", asteroids_data):
-                update_system_log("get_approaching_asteroids", "Error: Spreadsheet creation could not be completed at this time.")
-                return "Error: Spreadsheet creation could not be completed at this time.", False
-
-            # At this point, function is deemed to have executed successfully.  Update system log and
-            # return successful-execution indication to the calling function:
-            update_system_log("get_approaching_asteroids", "Successfully updated.")
-            return "", True
+            # Return the captured asteroids, along with the close-approach dates covered by the response:
+            return {"approaching_asteroids": approaching_asteroids, "days_fetched": list(near_earth_objects.keys())}
 
         else:  # API request failed. Update system log and return failed-execution indication to the calling function:
-            update_system_log("get_approaching_asteroids", "Error: API request failed. Data cannot be obtained at this time.")
-            return "Error: API request failed. Data cannot be obtained at this time.", False
+            update_system_log("get_approaching_asteroids_from_api_by_window", f"Error: API request failed (status code {response.status_code}). Data for {start_date} to {end_date} cannot be obtained at this time.")
+            return {}
 
     except:  # An error has occurred.
-        update_system_log("get_approaching_asteroids", traceback.format_exc())
+        update_system_log("get_approaching_asteroids_from_api_by_window", traceback.format_exc())
 
         # Return failed-execution indication to the calling function:
-        return "An error has occurred. Data cannot be obtained at this time.", False
+        return {}
 
 
 def get_astronomy_pic_of_the_day():
-    """Function to retrieve the astronomy picture of the day"""
+    """Function to retrieve the astronomy picture of the day (along with the date/time it was fetched, if the upstream API is unavailable and the last known good details are provided instead)"""
     # Initialize variables to be used for returning values to the calling function:
     json = {}
     copyright_details = ""
     error_message = ""
+    date_time_fetched = None
 
     try:
-        # Execute API request:
-        url = URL_ASTRONOMY_PIC_OF_THE_DAY + "?api_key=" + API_KEY_ASTRONOMY_PIC_OF_THE_DAY
-        response = requests.get(url)
-
-        # If the API request was successful, capture the results:
-        if response.status_code == 200:  # API request was successful.
-            json = response.json()
-
-            # If there is copyright info. included in the JSON, capture it:
-            try:
-                copyright_details = f"Copyright: {response.json()["copyright"].replace("\n", "")}"
-            except:
-                pass
-
-        else:  # API request failed.  Update system log and return failed-execution indication to the calling function:
-            update_system_log("get_astronomy_pic_of_the_day", "Error: API request failed. Data cannot be obtained at this time.")
-            error_message = "API request failed. Data cannot be obtained at this time."
+        # Obtain the details of the astronomy picture of the day (falling back to the last known good details if the upstream
+        # API is unavailable).  If no details could be obtained, update system log and return failed-execution indication:
+        json, date_time_fetched, error_message = get_upstream_payload("astronomy_pic_of_the_day", get_astronomy_pic_of_the_day_from_api)
+        if json == None:
+            update_system_log("get_astronomy_pic_of_the_day", f"Error: {error_message}")
+            json = {}
+            error_message = f"{error_message} Data cannot be obtained at this time."
+
+        # If there is copyright info. included in the JSON, capture it:
+        elif "copyright" in json:
+            copyright_details = f"Copyright: {json["copyright"].replace("\n", "")}"
 
     except:  # An error has occurred.
         update_system_log("get_astronomy_pic_of_the_day", traceback.format_exc())
@@ -1266,23 +2166,99 @@ def get_astronomy_pic_of_the_day():
 
     finally:
         # Return results to calling function:
-        return json, copyright_details, error_message
+        return json, copyright_details, error_message, date_time_fetched
 
 
-def get_confirmed_planets():
+def get_astronomy_pic_of_the_day_from_api():
+    """Function to retrieve, via an API request, the details of the astronomy picture of the day (returning None if the request failed)"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Execute API request:
+    url = URL_ASTRONOMY_PIC_OF_THE_DAY + "?api_key=" + API_KEY_ASTRONOMY_PIC_OF_THE_DAY
+    response = requests.get(url, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+
+    # If the API request was successful, return the results.  Otherwise, update system log and return failed-execution indication:
+    if response.status_code == 200:
+        return response.json()
+
+    update_system_log("get_astronomy_pic_of_the_day_from_api", f"Error: API request failed (HTTP {response.status_code}).")
+    return None
+
+
+def get_autocomplete_suggestions(prefix, limit, suggestion_type=None):
+    """Function to retrieve, from the in-memory autocomplete index, the planet, host star, and constellation names starting with the supplied prefix"""
+    try:
+        # If the source datasets have changed since the autocomplete index was last built, rebuild the index (one thread only):
+        source_versions = (get_dataset_version("confirmed_planets")["version"], get_dataset_version("constellations")["version"])
+        if autocomplete_index["dataset_versions"] != source_versions:
+            with autocomplete_index_lock:
+                if autocomplete_index["dataset_versions"] != source_versions:
+                    # Retrieve the names to index.  If the function called returns a failed-execution indication,
+                    # return an empty list to the calling function (the rebuild is re-attempted upon the next call):
+                    index_entries = retrieve_from_database("autocomplete_index_entries")
+                    if index_entries == {}:
+                        return []
+
+                    # Sort the entries by lowercase name, and store the sorted keys and suggestions (along with the source
+                    # datasets' versions) in the index:
+                    index_entries = sorted(set(index_entries))
+                    autocomplete_index["suggestions"] = [{"value": entry[1], "type": entry[2], "discovery_year": entry[3]} for entry in index_entries]
+                    autocomplete_index["keys"] = [entry[0] for entry in index_entries]
+                    autocomplete_index["dataset_versions"] = source_versions
+
+        # Capture the index's current contents (a rebuild replaces, rather than modifies, these lists):
+        keys = autocomplete_index["keys"]
+        suggestions = autocomplete_index["suggestions"]
+
+        # Locate (via binary search) the first key starting with the lowercase prefix, and return up to the requested number
+        # of consecutive suggestions whose keys start with that prefix (and, if a type was requested, which are of that type):
+        prefix = prefix.strip().lower()
+        if prefix == "":
+            return []
+        i = bisect.bisect_left(keys, prefix)
+        matches = []
+        while i < len(keys) and keys[i].startswith(prefix) and len(matches) < min(limit, AUTOCOMPLETE_RESULTS_LIMIT):
+            if suggestion_type == None or suggestions[i]["type"] == suggestion_type:
+                matches.append(suggestions[i])
+            i += 1
+        return matches
+
+    except:  # An error has occurred.
+        update_system_log("get_autocomplete_suggestions", traceback.format_exc())
+
+        # Return an empty list to the calling function:
+        return []
+
+
+def get_confirmed_planets(disc_year=None, host_name=None, modified_since=None):
     """Function for getting all needed data pertaining to confirmed planets and store such information in the space database supporting our website"""
     try:
-        # Execute API request:
-        response = requests.get(URL_CONFIRMED_PLANETS)
+        # Capture the scope of the refresh (if no filter is supplied, the full catalog is refreshed):
+        scope = {"disc_year": disc_year, "host_name": host_name, "modified_since": modified_since}
+        is_partial_refresh = not (disc_year == None and host_name == None and modified_since == None)
+
+        # Acquire a rate-limit token.  If none is available, update system log and return failed-execution indication to the calling function:
+        wait_seconds = get_rate_limit_token("confirmed_planets")
+        if wait_seconds > 0:
+            update_system_log("get_confirmed_planets", f"Rate limit reached (retry in about {math.ceil(wait_seconds)} seconds).")
+            return f"Rate limit reached. Data can be obtained again in about {math.ceil(wait_seconds)} seconds.", False
+
+        # Execute API request (streamed, so that the CSV-formatted response body is not loaded into memory all at once):
+        response = requests.get(URL_CONFIRMED_PLANETS, params=build_confirmed_planets_query(disc_year, host_name, modified_since), stream=True, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
         if response.status_code == 200:
-            # Delete the existing records in the "confirmed_planets" database table and update same with
-            # the up-to-date data (from the JSON).  If execution failed, update system log and return
-            # failed-execution indication to the calling function::
+            # Update the "confirmed_planets" database table (within the scope of the refresh) with the up-to-date data
+            # (parsed incrementally from the streamed response). If execution failed, update system log and return
+            # failed-execution indication to the calling function:
             # NOTE:  Scope of data: Solution Type = 'Published Confirmed'
-            if not update_database("update_confirmed_planets", response.json()):
+            if not update_database("update_confirmed_planets", get_confirmed_planets_rows(response), scope=scope):
                 update_system_log("get_confirmed_planets", "Error: Database could not be updated. Data cannot be obtained at this time.")
                 return "Error: Database could not be updated. Data cannot be obtained at this time.", False
 
+            # If this is a partial refresh, the spreadsheet is left for the next full (administrative) refresh to regenerate.
+            # Update system log and return successful-execution indication to the calling function:
+            if is_partial_refresh:
+                update_system_log("get_confirmed_planets", f"Successfully updated (partial refresh: {scope}).")
+                return "", True
+
             # Retrieve all existing records in the "confirmed_planets" database table. If the function
             # called returns an empty directory, update system log and return failed-execution indication
             # to the calling function:
@@ -1319,6 +2295,31 @@ def get_confirmed_planets():
         return "An error has occurred. Data cannot be obtained at this time.", False
 
 
+def get_confirmed_planets_rows(response):
+    """Function (generator) for parsing confirmed-planet rows incrementally from a streamed, CSV-formatted API response"""
+    try:
+        # Decode the streamed response body as UTF-8 text, line by line:
+        response.encoding = "utf-8"
+        lines = response.iter_lines(decode_unicode=True)
+
+        # Parse each line into a dictionary keyed by column name, converting numeric columns as needed (CSV values are text):
+        for row in csv.DictReader(lines):
+            row["sy_snum"] = int(row["sy_snum"])
+            row["sy_pnum"] = int(row["sy_pnum"])
+            row["disc_year"] = int(row["disc_year"])
+            yield row
+
+    except:  # An error has occurred.
+        update_system_log("get_confirmed_planets_rows", traceback.format_exc())
+
+        # Defer further error handling (e.g., abandoning the database update) to the calling function:
+        raise
+
+    finally:
+        # Release the connection used for streaming the response:
+        response.close()
+
+
 def get_constellation_data():
     """Function for getting all needed data pertaining to constellations and store such information in the space database supporting our website"""
 
@@ -1727,48 +2728,112 @@ def get_constellation_data_nicknames(constellations):
         return {}
 
 
+def get_contact_outbox_smtp_connection(connection):
+    """Function to obtain an authenticated connection to the e-mail server, re-using the connection passed if it is still open"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the connection passed is still open (i.e., the server responds to a no-op), return it to the calling function:
+    if connection != None:
+        try:
+            if connection.noop()[0] == 250:
+                return connection
+        except smtplib.SMTPException:
+            pass
+        close_smtp_connection(connection)
+
+    # Open a new connection, securing it (including encrypting e-mail) and logging in to the sender's e-mail server, as configured:
+    connection = smtplib.SMTP(SENDER_HOST, port=int(SENDER_PORT), timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+    try:
+        if SENDER_USE_STARTTLS:
+            connection.starttls()
+        if SENDER_PASSWORD_GMAIL:
+            connection.login(SENDER_EMAIL_GMAIL, SENDER_PASSWORD_GMAIL)
+    except:
+        close_smtp_connection(connection)
+        raise
+
+    # Return the connection to the calling function:
+    return connection
+
+
+def get_data_age_note(date_time_fetched):
+    """Function to compose a note (for display) indicating that the data shown was fetched earlier (the upstream API being unavailable), and how long ago"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the data is current (i.e., no fetch date/time was passed), no note is needed:
+    if date_time_fetched == None:
+        return ""
+
+    # Express the data's age in the largest whole unit applicable:
+    age_seconds = max(0, int((datetime.now() - date_time_fetched).total_seconds()))
+    if age_seconds >= 86400:
+        age = f"{age_seconds // 86400} day(s)"
+    elif age_seconds >= 3600:
+        age = f"{age_seconds // 3600} hour(s)"
+    else:
+        age = f"{age_seconds // 60} minute(s)"
+
+    # Return the note to the calling function:
+    return f"The data source is currently unavailable. Showing data as of {date_time_fetched:%Y-%m-%d %H:%M:%S} ({age} ago)."
+
+
+def get_dataset_version(scope):
+    """Function to retrieve a dataset's current version details, cached in-process for a few seconds so that frequent callers do not query the database"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the cached version details are missing or have expired, re-read them from the "dataset_versions" database table:
+    dataset_version = dataset_versions.get(scope, None)
+    if dataset_version == None or time.monotonic() - dataset_version["date_time_cached"] > DATASET_VERSION_CACHE_SECONDS:
+        record = retrieve_from_database("dataset_version", dataset_name=scope)
+
+        # If the version details could not be retrieved, return the (expired) cached details if available; otherwise,
+        # return placeholder details (not cached, so that retrieval is re-attempted upon the next call):
+        if record == {} or record == None:
+            if dataset_version != None:
+                return dataset_version
+            return {"version": 0, "row_count": 0, "content_hash": "", "date_time_refreshed": datetime.now(), "date_time_changed": datetime.now(), "spreadsheet_version": None, "date_time_cached": time.monotonic()}
+
+        dataset_version = {
+            "version": record.version,
+            "row_count": record.row_count,
+            "content_hash": record.content_hash,
+            "date_time_refreshed": record.date_time_refreshed,
+            "date_time_changed": record.date_time_changed,
+            "spreadsheet_version": record.spreadsheet_version,
+            "date_time_cached": time.monotonic()
+        }
+        dataset_versions[scope] = dataset_version
+
+    # Return the version details to the calling function:
+    return dataset_version
+
+
 def get_iss_location():
-    """Function to retrieve the current location of the ISS and a link to view the map of same"""
+    """Function to retrieve the current location of the ISS and a link to view the map of same (along with the date/time the location was fetched, if the upstream API is unavailable and the last known good location is provided instead)"""
     # Initialize variables to be used for returning values to the calling function:
     location_address = ""
     location_url = ""
+    date_time_fetched = None
 
     try:
-        # Execute API request:
-        response = requests.get(URL_ISS_LOCATION)
-
-        # If the API request was successful, capture and process the results:
-        if response.status_code == 200:
-            latitude = response.json()["iss_position"]["latitude"]
-            longitude = response.json()["iss_position"]["longitude"]
-
-            # Execute API request (using the retrieved latitude and longitude), to
-            # get a link to a map of the ISS's current location:
-            url = URL_GET_LOC_FROM_LAT_AND_LON + "?lat=" + str(latitude) + "&lon=" + str(
-                longitude) + "&api_key=" + API_KEY_GET_LOC_FROM_LAT_AND_LON
-            response = requests.get(url)
-
-            # If the API request was successful, capture and process the results:
-            if response.status_code == 200:  # API request was successful.
-                for key in response.json():
-                    if key == "error":  # Resulting JSON has an error key (possibly due to current location being over water).
-                        if response.json()["error"] == "Unable to geocode":  # ISS may currently be over water.
-                            location_address = "No terrestrial address is available.  ISS could be over water at the current time."
-
-                    else:  # Terrestrial address is available.
-                        # Display terrestrial address:
-                        location_address = response.json()["display_name"]
-
-                    # Break from the 'for' loop:
-                    break
-
-                # Prepare and display a link that points to the ISS's current location:
-                location_url = "https://maps.google.com/?q=" + str(latitude) + "," + str(longitude)
-
-        else:  # API request failed.  Update system log and return failed-execution indication to the calling function:
-            update_system_log("get_iss_location", "Error: API request failed. Data cannot be obtained at this time.")
-            location_address = "API request failed. Data cannot be obtained at this time."
-            location_url = ""
+        # Obtain the ISS's current position (falling back to its last known good position if the upstream API is unavailable).
+        # If no position could be obtained, update system log and return failed-execution indication to the calling function:
+        position, date_time_fetched, error_message = get_upstream_payload("iss_location", get_iss_location_from_api)
+        if position == None:
+            update_system_log("get_iss_location", f"Error: {error_message}")
+            location_address = f"{error_message} Data cannot be obtained at this time."
+            return location_address, location_url
+
+        # Prepare a link that points to the ISS's location:
+        latitude = position["latitude"]
+        longitude = position["longitude"]
+        location_url = "https://maps.google.com/?q=" + str(latitude) + "," + str(longitude)
+
+        # Obtain the terrestrial address (if any) of the ISS's location.  The address is specific to the location, so there is no
+        # last known good address to fall back to.  If the address cannot be obtained, provide the link (above) without it:
+        address, address_date_time_fetched, error_message = get_upstream_payload("geocode", lambda: get_iss_location_address_from_api(latitude, longitude), use_last_known_good=False, flight_key=f"geocode_{latitude}_{longitude}")
+        if address == None:
+            update_system_log("get_iss_location", f"Error (reverse geocoding): {error_message}")
+            location_address = f"Address lookup is temporarily unavailable. {error_message}"
+        else:
+            location_address = address
 
     except:  # An error has occurred.
         update_system_log("get_iss_location", traceback.format_exc())
@@ -1776,14 +2841,67 @@ def get_iss_location():
         location_url = ""
 
     finally:
-        # Return location address and URL to the calling function:
-        return location_address, location_url
+        # Return location address and URL, and the date/time fetched, to the calling function:
+        return location_address, location_url, date_time_fetched
 
 
-def get_mars_photos():
-    """Function to retrieve summary and detailed data pertaining to the photos taken by each rover exploring on Mars"""
-    global mars_rovers
+def get_iss_location_address_from_api(latitude, longitude):
+    """Function to retrieve, via an API request, the terrestrial address (if any) at the latitude and longitude passed (returning None if the request failed)"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Execute API request (using the latitude and longitude passed):
+    url = URL_GET_LOC_FROM_LAT_AND_LON + "?lat=" + str(latitude) + "&lon=" + str(
+        longitude) + "&api_key=" + API_KEY_GET_LOC_FROM_LAT_AND_LON
+    response = requests.get(url, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+
+    # If the API request failed, update system log and return failed-execution indication to the calling function:
+    if response.status_code != 200:
+        update_system_log("get_iss_location_address_from_api", f"Error: API request failed (HTTP {response.status_code}).")
+        return None
+
+    # If the resulting JSON has an error key (possibly due to the location being over water), return a note to that effect.
+    # Otherwise, return the terrestrial address:
+    if "error" in response.json():
+        if response.json()["error"] == "Unable to geocode":  # ISS may currently be over water.
+            return "No terrestrial address is available.  ISS could be over water at the current time."
+        return ""
+
+    return response.json()["display_name"]
+
+
+def get_iss_location_from_api():
+    """Function to retrieve, via an API request, the current latitude and longitude of the ISS (returning None if the request failed)"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Execute API request:
+    response = requests.get(URL_ISS_LOCATION, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+
+    # If the API request was successful, return the ISS's position.  Otherwise, update system log and return failed-execution indication:
+    if response.status_code == 200:
+        return {"latitude": response.json()["iss_position"]["latitude"], "longitude": response.json()["iss_position"]["longitude"]}
+
+    update_system_log("get_iss_location_from_api", f"Error: API request failed (HTTP {response.status_code}).")
+    return None
+
+
+def get_listbox_choices(scope, trans_type):
+    """Function to retrieve a listbox's choices, cached in-process until the version of the dataset they are drawn from changes"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the cached choices were drawn from a prior version of the dataset (or are not cached), retrieve them from the database:
+    version = get_dataset_version(scope)["version"]
+    if trans_type not in listbox_choices or listbox_choices[trans_type]["version"] != version:
+        choices = retrieve_from_database(trans_type)
+
+        # If the choices could not be retrieved, return an empty list (not cached, so that retrieval is re-attempted upon the next call):
+        if choices == {}:
+            return []
 
+        listbox_choices[trans_type] = {"version": version, "choices": choices}
+
+    # Return the choices to the calling function:
+    return listbox_choices[trans_type]["choices"]
+
+
+def get_mars_photos(retry_failed=False):
+    """Function to retrieve summary and detailed data pertaining to the photos taken by each rover exploring on Mars"""
     try:
 
         # Delete all existing files pertaining to this scope. If the function failed, update system
@@ -1795,72 +2913,65 @@ def get_mars_photos():
         # Retrieve, from the database, a list of all rovers that are currently active for purposes of
         # data production.  If the function called returns an empty directory, update system log and return
         # failed-execution indication to the calling function:
-        mars_rovers_from_db = retrieve_from_database("mars_rovers")
-        if mars_rovers_from_db == {}:
+        rover_names = get_mars_rovers()
+        if rover_names == {}:
             update_system_log("get_mars_photos", "Error: Data (Mars rovers) cannot be obtained at this time.")
             return "Error: Data (Mars rovers) cannot be obtained at this time.", False
 
         # If an empty list was returned, no records satisfied the query.  Therefore, update system log and
         # return failed-execution indication to the calling function:
-        elif mars_rovers_from_db == []:
+        elif rover_names == []:
             update_system_log("get_mars_photos", "No matching records were retrieved (Mars rovers).")
             return "No matching records were retrieved (Mars rovers).", False
 
-        # Populate "mars_rovers" with list of active rovers per the database:
-        for record in mars_rovers_from_db:
-            mars_rovers.append(record.rover_name)
-
         # Inform user that database will be checked for updates:
-        dlg = PBI.PyBusyInfo("Photos from Mars: Checking for updates needed...", title="Administrative Update")
+        dlg = show_dialog_busy_info("Photos from Mars: Checking for updates needed...")
 
         # Prepare a dictionary which summarizes photos available by rover and earth date. If the function returns
         # an empty dictionary, update system log and return failed-execution indication to the calling function:
-        photos_available = get_mars_photos_summarize_photos_available({})
+        photos_available = get_mars_photos_summarize_photos_available({}, rover_names)
         if photos_available == {}:
             update_system_log("get_mars_photos", "Error: Data (photos, summarize available) cannot be obtained at this time.")
             return "Error: Data (photos, summarize available) cannot be obtained at this time.", False
 
-        # Obtain respective dictionaries summarizing photos available and the corresponding contents of the
-        # "mars_photo_details" database table. If the function returns an empty directory for the former,
+        # Classify each rover/earth date combo (new, grown, shrunk, or removed) by comparing the photos available with the
+        # corresponding contents of the "mars_photo_details" database table.  If the function returns an empty dictionary,
         # update system log and return failed-execution indication to the calling function:
-        photos_available_summary, photo_details_summary = retrieve_from_database("mars_photo_details_compare_with_photos_available")
-        if photos_available_summary == {}:
+        photo_combos_diff = get_mars_photos_classify_combos(photos_available)
+        if photo_combos_diff == {}:
             update_system_log("get_mars_photos", "Error: Data (photos, pre-update check) cannot be obtained at this time.")
             return "Error: Data (photos, pre-update check) cannot be obtained at this time.", False
 
-        # If an empty list was returned for "photos available", no records satisfied the query.  Therefore,
-        # update system log and return failed-execution indication to the calling function:
-        elif photos_available_summary == []:
-            update_system_log("get_mars_photos", "No matching records were retrieved (photos, pre-update check).")
-            return "No matching records were retrieved (photos, pre-update check).", False
-
-        else:
-            # Initialize a variable for capturing rover/earth date combinations for which there is a mismatch
-            # between the photos available and the corresponding photo details:
-            rover_earth_date_combo_mismatch_between_summaries = []
-
-            # Compare photos available with the corresponding contents of the "mars_photo_details" database table:
-            if photos_available_summary == photo_details_summary:  # Database is up to date.  No API requests are needed.
-                dlg = PBI.PyBusyInfo("Photos from Mars: Database is up to date. Proceeding to export results to spreadsheet files...", title="Administrative Update")
-
-            else:  # Database (specifically the "mars_photo_details" needs updating.
-                dlg = PBI.PyBusyInfo("Photos from Mars: Photo details table needs updating.  Update in progress...", title="Administrative Update")
-
-                # Capture a list of the rover/earth date combinations for which there is a mismatch
-                # between the photos available and the corresponding photo details:
-                for i in range(0, len(photos_available_summary)):
-                    if not(photos_available_summary[i] in photo_details_summary):
-                        rover_earth_date_combo_mismatch_between_summaries.append(photos_available_summary[i][0])
-
-            # Perform required database updates based on whether any mismatches were identified above.
-            # If the function called returns a failed-execution indication, update system log and return
-            # failed-execution indication to the calling function:
-            if not get_mars_photos_update_database(photos_available, rover_earth_date_combo_mismatch_between_summaries):
-                update_system_log("get_mars_photos", "Error: Data (photos, post-details-update) cannot be obtained at this time.")
+        # Merge the rover/earth date combos identified above into the sync queue (which persists, by combo, the work pending,
+        # along with its status and attempts; combos left pending by an interrupted or rate-limited prior run are retained, and
+        # combos which failed are re-attempted only if requested or if their manifest details have changed).  If the function
+        # called returns a failed-execution indication, update system log and return failed-execution indication to the
+        # calling function:
+        if not update_database("update_mars_photos_sync_queue", photo_combos_diff, photos_available=photos_available, retry_failed=retry_failed):
+            update_system_log("get_mars_photos", "Error: Data (photos, sync queue) cannot be obtained at this time.")
+            return "Error: Data (photos, sync queue) cannot be obtained at this time.", False
+
+        sync_queue = retrieve_from_database("mars_photos_sync_queue")
+        if sync_queue == {}:
+            update_system_log("get_mars_photos", "Error: Data (photos, sync queue) cannot be obtained at this time.")
+            return "Error: Data (photos, sync queue) cannot be obtained at this time.", False
+
+        if sync_queue == []:
+            # Database is up to date.  No API requests are needed:
+            dlg = show_dialog_busy_info("Photos from Mars: Database is up to date. Proceeding to export results to spreadsheet files...")
+
+        else:  # Database (specifically the "mars_photo_details" needs updating.
+            dlg = show_dialog_busy_info(f"Photos from Mars: Photo details table needs updating ({len(sync_queue)} rover/earth date combinations queued).  Update in progress...")
+
+            # Process the sync queue.  If the function called returns a failed-execution indication, update system log and
+            # return failed-execution indication to the calling function:
+            error_msg, success = get_mars_photos_update_database(sync_queue)
+            if not success:
+                update_system_log("get_mars_photos", f"Error: Data (photos, post-details-update) cannot be obtained at this time ({error_msg}).")
                 return "Error: Data (photos, post-details-update) cannot be obtained at this time.", False
 
         # Provide user an update before proceeding to export results to spreadsheet files:
-        dlg = PBI.PyBusyInfo("Photos from Mars: Proceeding to export results to spreadsheet files...", title="Administrative Update")
+        dlg = show_dialog_busy_info("Photos from Mars: Proceeding to export results to spreadsheet files...")
 
         # Retrieve a list of records from the "mars_photos_available" database table.  If the function
         # called returns a failed-execution indication (i.e., an empty dictionary), update system log and
@@ -1907,13 +3018,54 @@ def get_mars_photos():
         return "An error has occurred. Data cannot be obtained at this time.", False
 
 
+def get_mars_photos_classify_combos(photos_available):
+    """Function to classify each rover/earth date combo as new, grown, shrunk, or removed, by comparing the photos available (per the API) with the photo details in the database"""
+    try:
+        # Retrieve the photo counts, by rover/earth date combo, from the "mars_photo_details" database table.  If the function
+        # called returns a failed-execution indication, update system log and return failed-execution indication to the calling function:
+        details_summary = retrieve_from_database("mars_photo_details_counts_by_rover_earth_date_combo")
+        if details_summary == {}:
+            update_system_log("get_mars_photos_classify_combos", "Error: Data could not be obtained at this time.")
+            return {}
+
+        # Key the photo counts by rover name / earth date combo, so that each combo can be classified via dictionary lookups
+        # (one pass over each side) rather than by searching one list for each entry of the other:
+        details_counts = {record.rover_name + "_" + record.earth_date.isoformat(): record.total_photos for record in details_summary}
+        photo_combos_diff = {"new": [], "grown": [], "shrunk": [], "removed": [], "details_counts": details_counts}
+        for combo in photos_available:
+            if not (combo in details_counts):
+                if photos_available[combo]["total_photos"] > 0:
+                    photo_combos_diff["new"].append(combo)
+            elif photos_available[combo]["total_photos"] > details_counts[combo]:
+                photo_combos_diff["grown"].append(combo)
+            elif photos_available[combo]["total_photos"] < details_counts[combo]:
+                photo_combos_diff["shrunk"].append(combo)
+
+        # Combos are deemed removed only for rovers surveyed via the API (i.e., the details of rovers no longer
+        # active are retained):
+        rovers_surveyed = {photos_available[combo]["rover_name"] for combo in photos_available}
+        for combo in details_counts:
+            if not (combo in photos_available) and combo.split("_")[0] in rovers_surveyed:
+                photo_combos_diff["removed"].append(combo)
+
+        # Return the classification to the calling function:
+        return photo_combos_diff
+
+    except:  # An error has occurred.
+        update_system_log("get_mars_photos_classify_combos", traceback.format_exc())
+
+        # Return empty dictionary as a failed-execution indication to the calling function:
+        return {}
+
+
 def get_mars_photos_summarize_photo_counts_by_rover_and_earth_year():
     """Function to summarize photo counts by rover and earth year.  This supports final spreadsheet creation"""
     try:
-        # Get counts (by rover name and earth date) from "mars_photo_details" database table. If the
-        # function called returns a failed-execution indication (i.e., an empty dictionary), update system log
-        # and return failed-execution indication to the calling function:
-        photo_counts = retrieve_from_database("mars_photo_details_get_counts_by_rover_and_earth_date")
+        # Get counts (by rover name and earth year) from the "mars_photo_counts" database table (an aggregate of the
+        # "mars_photo_details" database table, maintained during each update).  If the function called returns a
+        # failed-execution indication (i.e., an empty dictionary), update system log and return failed-execution
+        # indication to the calling function:
+        photo_counts = retrieve_from_database("mars_photo_counts_by_rover_and_earth_year")
         if photo_counts == {}:
             update_system_log("get_mars_photos_summarize_photo_counts_by_rover_and_earth_year",
                               "Error: Data could not be obtained at this time.")
@@ -1926,51 +3078,8 @@ def get_mars_photos_summarize_photo_counts_by_rover_and_earth_year():
                               "Error: No matching records were retrieved.")
             return []
 
-        # Initialize list variables needed to produce the final results to the calling function:
-        photo_count_grouping_1 = []
-        photo_count_grouping_2 = []
-
-        # Add a rover name/earth year combo value to the results obtained above, and add all to a list:
-        for item in photo_counts:
-            photo_count_grouping_1.append([item[0], item[1], item[0] + "_" + item[1][:4], item[2]])
-
-        # Iterate through the list created above, summarize photo counts by rover name/earth year combo, and
-        # populate list with summarized data:
-        # Capture the first row of data:
-        rover_name_a = photo_count_grouping_1[0][0]
-        earth_year_a = photo_count_grouping_1[0][1][:4]
-        rover_earth_date_combo_a = photo_count_grouping_1[0][2]
-        total_photos_a = photo_count_grouping_1[0][3]
-
-        # Capture the next row of date.  Compare the rover/earth year combo with the combo from
-        # the previous row.  Iterate through this process until the end of the data set has been
-        # reached:
-        for i in range(1, len(photo_count_grouping_1)):
-            # Capture the next row of data:
-            rover_name_b = photo_count_grouping_1[i][0]
-            earth_year_b = photo_count_grouping_1[i][1][:4]
-            rover_earth_date_combo_b = photo_count_grouping_1[i][2]
-            total_photos_b = photo_count_grouping_1[i][3]
-
-            # Compare the rover/earth year combo with the combo from the previous row:
-            if rover_earth_date_combo_b != rover_earth_date_combo_a:  # New rover/earth year combo has been reached.
-                # Append the final photo count for the previous row (whose final row has been reached) to the
-                # final list to be returned to the calling function:
-                photo_count_grouping_2.append([rover_name_a, earth_year_a, rover_earth_date_combo_a, total_photos_a])
-                rover_name_a = rover_name_b
-                earth_year_a = earth_year_b
-                rover_earth_date_combo_a = rover_earth_date_combo_b
-                total_photos_a = total_photos_b
-            else:  # New rover/earth year combo has NOT been reached.
-                # Continue tallying the running total for the current combo.
-                total_photos_a += total_photos_b
-
-        # Capture the final total photo count for the final rover/earth date combo (whose final row
-        # has been reached), and append it to the final list to be returned to the calling function:
-        photo_count_grouping_2.append([rover_name_a, earth_year_a, rover_earth_date_combo_a, total_photos_a])
-
-        # Return resulting list to the calling function:
-        return photo_count_grouping_2
+        # Return the counts (each with its rover name / earth year combo) to the calling function:
+        return [[item.rover_name, str(item.earth_year), item.rover_name + "_" + str(item.earth_year), item.total_photos] for item in photo_counts]
 
     except:  # An error has occurred.
         update_system_log("get_mars_photos_summarize_photo_counts_by_rover_and_earth_year", traceback.format_exc())
@@ -1979,43 +3088,115 @@ def get_mars_photos_summarize_photo_counts_by_rover_and_earth_year():
         return []
 
 
-def get_mars_photos_summarize_photos_available(photos_available):
+def get_mars_photos_summarize_photos_available(photos_available, rover_names):
     """Function to summarize photos available.  This supports final spreadsheet creation"""
 
     try:
+        # Retrieve the cached manifest details (by rover) and the existing records from the "mars_rover_manifests" and
+        # "mars_photos_available" database tables, respectively.  If either function called returns a failed-execution
+        # indication, update system log and return failed-execution indication to the calling function:
+        manifests_from_db = retrieve_from_database("mars_rover_manifests")
+        existing_photos_available = retrieve_from_database("mars_photos_available")
+        if manifests_from_db == {} or existing_photos_available == {}:
+            update_system_log("get_mars_photos_summarize_photos_available", "Error: Data (manifests / photos available) cannot be obtained at this time.")
+            return {}
+
+        manifests = {record.rover_name: record for record in manifests_from_db}
+
         # Perform the following for each rover that is currently active:
-        for rover_name in mars_rovers:
-            # Execute the API request:
-            url = URL_MARS_ROVER_PHOTOS_BY_ROVER + rover_name + "?api_key=" + API_KEY_MARS_ROVER_PHOTOS
-            response = requests.get(url)
-
-            # If API request was successful, capture desired data elements:
-            if response.status_code == 200:  # API request was successful.
-                i = 0
-                for item in response.json()['photo_manifest']['photos']:
-                    photos_available[rover_name + "_" + str(item["earth_date"])] = {
-                        "sol": item["sol"],
-                        "rover_name": rover_name,
-                        "earth_date": item["earth_date"],
-                        "total_photos": item['total_photos'],
-                        "cameras": ','.join(item["cameras"])
+        for rover_name in rover_names:
+            # Capture the rover's existing records (i.e., as of the last manifest processed):
+            rover_photos_available = {}
+            for record in existing_photos_available:
+                if record.rover_name == rover_name:
+                    rover_photos_available[record.rover_earth_date_combo] = {
+                        "sol": str(record.sol),
+                        "rover_name": record.rover_name,
+                        "earth_date": record.earth_date,
+                        "total_photos": record.total_photos,
+                        "cameras": record.cameras
                     }
 
-                if photos_available == {}:
-                    update_system_log("get_mars_photos_summarize_photos_available",f"No photos are available for Mars rover '{rover_name}'")
+            # If the rover's mission is complete (per the cached manifest), its manifest can no longer change.  Therefore,
+            # use the existing records and skip the API request:
+            manifest = manifests.get(rover_name, None)
+            if manifest != None and manifest.status == "complete" and rover_photos_available != {}:
+                photos_available.update(rover_photos_available)
+                continue
+
+            # Execute the API request.  If the rover's existing records are available, make the request conditional upon the
+            # manifest having changed (per the validators cached from the last manifest processed):
+            headers = {}
+            if manifest != None and rover_photos_available != {}:
+                if manifest.etag != None:
+                    headers["If-None-Match"] = manifest.etag
+                if manifest.last_modified != None:
+                    headers["If-Modified-Since"] = manifest.last_modified
+
+            # Acquire a rate-limit token.  If none is available, use the rover's existing records (if any); otherwise, update
+            # system log and return failed-execution indication to the calling function:
+            wait_seconds = get_rate_limit_token("mars_photos")
+            if wait_seconds > 0:
+                update_system_log("get_mars_photos_summarize_photos_available", f"Rate limit reached (retry in about {math.ceil(wait_seconds)} seconds). Existing records used for Mars rover '{rover_name}'.")
+                if rover_photos_available == {}:
+                    return {}
+                photos_available.update(rover_photos_available)
+                continue
+
+            url = URL_MARS_ROVER_PHOTOS_BY_ROVER + rover_name + "?api_key=" + API_KEY_MARS_ROVER_PHOTOS
+            response = requests.get(url, headers=headers, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+
+            if response.status_code == 304:  # Manifest has not changed.  Use the existing records:
+                photos_available.update(rover_photos_available)
+
+            elif response.status_code == 200:  # API request was successful.
+                photo_manifest = response.json()['photo_manifest']
+                manifest_details = {
+                    "status": photo_manifest.get("status", None),
+                    "max_sol": photo_manifest["max_sol"],
+                    "total_photos": photo_manifest["total_photos"],
+                    "etag": response.headers.get("ETag", None),
+                    "last_modified": response.headers.get("Last-Modified", None)
+                }
+
+                # If the rover's max sol and total photos are unchanged from the last manifest processed, use the existing records.
+                # Otherwise, capture desired data elements and identify the combos which are new / have changed (e.g., the
+                # latest sols), as well as those which are no longer in the manifest:
+                if manifest != None and rover_photos_available != {} and manifest.max_sol == manifest_details["max_sol"] and manifest.total_photos == manifest_details["total_photos"]:
+                    changed_photos_available = {}
+                    removed_combos = []
+                else:
+                    manifest_photos_available = {}
+                    for item in photo_manifest['photos']:
+                        manifest_photos_available[rover_name + "_" + str(item["earth_date"])] = {
+                            "sol": str(item["sol"]),
+                            "rover_name": rover_name,
+                            "earth_date": item["earth_date"],
+                            "total_photos": item['total_photos'],
+                            "cameras": ','.join(item["cameras"])
+                        }
+
+                    changed_photos_available = {combo: manifest_photos_available[combo] for combo in manifest_photos_available if rover_photos_available.get(combo, None) != manifest_photos_available[combo]}
+                    removed_combos = [combo for combo in rover_photos_available if not (combo in manifest_photos_available)]
+                    rover_photos_available = manifest_photos_available
+
+                # Update the "mars_photos_available" database table for the combos identified above, and cache the manifest
+                # details.  If the function returns a failed-execution indication, update system log and return
+                # failed-execution indication to the calling function:
+                if not update_database("update_mars_photos_available", changed_photos_available, rover_name=rover_name, removed_combos=removed_combos, manifest=manifest_details):
+                    update_system_log("get_mars_photos_summarize_photos_available","Error: Database could not be updated. Data cannot be obtained at this time.")
                     return {}
 
+                photos_available.update(rover_photos_available)
+
             else:  # API request failed.  Update system log and return failed-execution indication to the calling function:
                 # Update system log and return failed-execution indication to the calling function:
                 update_system_log("get_mars_photos_summarize_photos_available",f"API request failed. No photos are available for Mars rover '{rover_name}'")
                 return {}
 
-        # Delete the existing records in the "mars_photos_available" database table and update same with the
-        # contents of the "photos_available" dictionary.  If the function returns a failed-execution
-        # indication, update system log and return failed-execution indication to the calling function:
-        if not update_database("update_mars_photos_available", photos_available):
-            update_system_log("get_mars_photos_summarize_photos_available","Error: Database could not be updated. Data cannot be obtained at this time.")
-            return {}
+            if photos_available == {}:
+                update_system_log("get_mars_photos_summarize_photos_available",f"No photos are available for Mars rover '{rover_name}'")
+                return {}
 
         # Return populated "photos_available" dictionary to the calling function:
         return photos_available
@@ -2027,49 +3208,54 @@ def get_mars_photos_summarize_photos_available(photos_available):
         return {}
 
 
-def get_mars_photos_update_database(photos_available, rover_earth_date_combo_mismatch_between_summaries):
-    try:
-        if len(rover_earth_date_combo_mismatch_between_summaries) > 0:
-            # For each rover/earth date combo where there is a mismatch between what the API provided and what exists in the database,
-            # perform necessary updates to the database to align with what the API indicates is current:
-            for i in range(0, len(rover_earth_date_combo_mismatch_between_summaries)):
-                dlg = PBI.PyBusyInfo(f"Photos from Mars: {i + 1} of {len(rover_earth_date_combo_mismatch_between_summaries)} rover/earth date combinations needing update ({round((i+1)/len(rover_earth_date_combo_mismatch_between_summaries) * 100, 1)} %)...", title="Administrative Update")
-                photo_details_rover_earth_date_combo = []
-
-                # Capture a count of how many records are in the database for the rover-earth date combo.
-                # If function failed, update system log and return failed-execution indication to the calling function:
-                existing_record_count = retrieve_from_database("mars_photo_details_rover_earth_date_combo_count",
-                                                               rover_name=rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0],
-                                                               earth_date=rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1])
-                if existing_record_count == {}:
-                    update_system_log("get_mars_photos_update_database",
-                                      f"Error: Pre-update retrieval of existing detail records failed (Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1]}).")
-                    return "Error: Pre-update retrieval of existing detail records failed (Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split('_')[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split('_')[1]}).", False
-
-                # Capture updated record count for the rover/earth date combo being processed, using the "photos_available" dictionary to represent
-                # what the API has indicated is current:
-                updated_record_count = photos_available[rover_earth_date_combo_mismatch_between_summaries[i]]["total_photos"]
-
-                # Provide user a progress update:
-                dlg = PBI.PyBusyInfo(f"Photos from Mars: Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1]} - Total Photos in DB: {existing_record_count}\nRover '{rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1]} - Total Photos (updated from API): {updated_record_count}\nUpdate in progress...", title="Administrative Update")
-
-                # Capture the updated record set (for the rover/earth-date combo being processed) from what the API provided:
-                dict_to_add = get_mars_photos_update_from_api(rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0], rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1])
-                if dict_to_add != {}:
-                    # Delete existing records in DB for this rover/earth date combo.  If function failed,
-                    # update system log and return failed-execution indication to the calling function:
-                    if not update_database("update_mars_photo_details_delete_existing", {},
-                                           rover_name=rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0],
-                                           earth_date=rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1]):
-                        update_system_log("get_mars_photos_update_database",
-                                          f"Error: Pre-update deletion of existing detail records failed (Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1]}).")
-                        return "Error: Pre-update deletion of existing detail records failed (Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split('_')[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split('_')[1]}).", False
-
-                    # Populate dictionary which will be used to update database with updated detail records for the rover/earth date combo being processed:
+def get_mars_photos_update_database(sync_queue):
+    """Function to align the "mars_photo_details" database table with the photos available, by processing the sync queue (one rover/earth date combo at a time, checkpointing each combo's status)"""
+    try:
+        # Initialize variables needed to track the rover / earth year buckets of the photo counts aggregate affected by the
+        # updates below, the combos which were (or failed to be, after exhausting their attempts) updated, and the date/time
+        # until which further API requests are deferred (if the API reports its quota as exhausted):
+        buckets_affected = set()
+        combos_done = []
+        combos_failed = []
+        deferred_until = None
+
+        # Process each combo in the sync queue (deletions first).  Combos deferred to a later date/time are skipped:
+        for i in range(0, len(sync_queue)):
+            item = sync_queue[i]
+            if item.not_before != None and item.not_before > datetime.now():
+                continue
+
+            # Provide user a progress update:
+            dlg = show_dialog_busy_info(f"Photos from Mars: {i + 1} of {len(sync_queue)} rover/earth date combinations queued ({round((i+1)/len(sync_queue) * 100, 1)} %)...\nRover '{item.rover_name}', Earth Date {item.earth_date} - Action: {item.action.title()}; Total Photos (per API): {item.total_photos_expected}; Attempt {item.attempts + 1}\nUpdate in progress...")
+
+            if item.action == "delete":
+                # Delete the photo details of the combo (no longer represented among the photos available):
+                success = update_database("update_mars_photo_details_delete_existing", {}, rover_name=item.rover_name, earth_date=item.earth_date, update_version=False)
+                error_msg = "" if success else "Deletion of detail records failed."
+
+            elif deferred_until != None:
+                # The API's quota has been exhausted during this run.  Therefore, defer the combo without making an API request:
+                update_database("update_mars_photos_sync_queue_item", {}, rover_earth_date_combo=item.rover_earth_date_combo, status="deferred", not_before=deferred_until, last_error="API quota exhausted (HTTP 429).")
+                continue
+
+            else:
+                # Capture the updated record set (for the rover/earth-date combo being processed) from what the API provided.
+                # If the API reports its quota as exhausted, defer this combo (and any remaining combos needing API requests)
+                # until after the quota window:
+                dict_to_add, status_code = get_mars_photos_update_from_api(item.rover_name, item.earth_date)
+                if status_code == 429:
+                    deferred_until = datetime.now() + timedelta(seconds=MARS_PHOTOS_SYNC_QUOTA_WINDOW_SECONDS)
+                    update_database("update_mars_photos_sync_queue_item", {}, rover_earth_date_combo=item.rover_earth_date_combo, status="deferred", not_before=deferred_until, last_error="API quota exhausted (HTTP 429).")
+                    continue
+
+                if dict_to_add == {}:
+                    success = False
+                    error_msg = f"API request failed (HTTP {status_code})."
+                else:
+                    # Populate list which will be used to update database with updated detail records for the rover/earth date combo being processed:
+                    photo_details_rover_earth_date_combo = []
                     for j in range(0, len(dict_to_add)):
-                        dict_to_add_sub = {
-                            "rover_earth_date_combo": dict_to_add[j]["rover"]["name"] + "_" + dict_to_add[j][
-                                "earth_date"],
+                        photo_details_rover_earth_date_combo.append({
                             "rover_name": dict_to_add[j]["rover"]["name"],
                             "sol": dict_to_add[j]["sol"],
                             "pic_id": dict_to_add[j]["id"],
@@ -2077,20 +3263,46 @@ def get_mars_photos_update_database(photos_available, rover_earth_date_combo_mis
                             "camera_name": dict_to_add[j]["camera"]["name"],
                             "camera_full_name": dict_to_add[j]["camera"]["full_name"],
                             "url": dict_to_add[j]["img_src"]
-                        }
-                        photo_details_rover_earth_date_combo.append(dict_to_add_sub)
-
-                    # Update the "mars_photo_details" database table with the contents of the "photo_details_rover_earth_date_combo" list.
-                    # If the function called returns a failed-execution indication, If function failed, update system log and return
-                    # failed-execution indication to the calling function:
-                    if not update_database("update_mars_photo_details", photo_details_rover_earth_date_combo):
-                        update_system_log("get_mars_photos_update_database",
-                                          f"Error: Database could not be updated (photo details) (Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1]}).")
-                        return "Error: Database could not be updated (photo details) (Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split('_')[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split('_')[1]}).", False
-
-                    else:
-                        # Inform user that the update has been successfully completed:
-                        dlg = PBI.PyBusyInfo(f"Photos from Mars: Rover '{rover_earth_date_combo_mismatch_between_summaries[i].split("_")[0]}', Earth Date {rover_earth_date_combo_mismatch_between_summaries[i].split("_")[1]} - Update complete.",title="Administrative Update")
+                        })
+
+                    # Replace the rover/earth date combo's records in the "mars_photo_details" database table with the contents of the
+                    # "photo_details_rover_earth_date_combo" list (in a single transaction):
+                    success = update_database("update_mars_photo_details", photo_details_rover_earth_date_combo, rover_name=item.rover_name, earth_date=item.earth_date, update_version=False)
+                    error_msg = "" if success else "Database could not be updated (photo details)."
+
+            # Checkpoint the combo's status: done if successful; otherwise, pending (to be re-attempted) unless its attempts have
+            # been exhausted, in which case failed:
+            if success:
+                update_database("update_mars_photos_sync_queue_item", {}, rover_earth_date_combo=item.rover_earth_date_combo, status="done")
+                buckets_affected.add((item.rover_name, int(item.earth_date[:4])))
+                combos_done.append((item.rover_earth_date_combo, item.action, item.total_photos_expected))
+            else:
+                update_system_log("get_mars_photos_update_database", f"Error: {error_msg} (Rover '{item.rover_name}', Earth Date {item.earth_date}, Attempt {item.attempts + 1}).")
+                status = "failed" if item.attempts + 1 >= MARS_PHOTOS_SYNC_MAX_ATTEMPTS else "pending"
+                update_database("update_mars_photos_sync_queue_item", {}, rover_earth_date_combo=item.rover_earth_date_combo, status=status, attempts=item.attempts + 1, last_error=error_msg)
+                if status == "failed":
+                    combos_failed.append(item.rover_earth_date_combo)
+
+        # Following the above (potentially large) updates, refresh the photo counts aggregate for the buckets affected, update the
+        # versions of the datasets affected (once each, the photo details per the combos updated; rovers and cameras not previously
+        # known may have been added), and refresh the database's statistics.  If function failed, update system log (the updates
+        # themselves are unaffected):
+        if not update_database("update_mars_photo_counts", sorted(buckets_affected)):
+            update_system_log("get_mars_photos_update_database", "Error: Photo counts could not be refreshed.")
+        for scope, changes in [("mars_photo_details", combos_done), ("mars_rovers", None)]:
+            if not update_database("update_dataset_version", scope, changes=changes):
+                update_system_log("get_mars_photos_update_database", f"Error: Dataset version ({scope}) could not be updated.")
+        if not update_database("update_database_statistics", {}):
+            update_system_log("get_mars_photos_update_database", "Error: Database statistics could not be refreshed.")
+
+        # If combos were deferred (API quota exhausted), update system log.  They are resumed by the next run after the quota window:
+        if deferred_until != None:
+            update_system_log("get_mars_photos_update_database", f"API quota exhausted.  Remaining rover/earth date combinations deferred until {deferred_until:%Y-%m-%d %H:%M:%S}.")
+
+        # If any combo failed (after exhausting its attempts), update system log and return failed-execution indication to the calling function:
+        if combos_failed != []:
+            update_system_log("get_mars_photos_update_database", f"Error: Update failed for {len(combos_failed)} rover/earth date combination(s): {", ".join(combos_failed)}.")
+            return f"Error: Update failed for {len(combos_failed)} rover/earth date combination(s).", False
 
         # At this point, function is deemed to have executed successfully.  Return successful-execution indication to the calling function:
         return "", True
@@ -2099,78 +3311,236 @@ def get_mars_photos_update_database(photos_available, rover_earth_date_combo_mis
         update_system_log("get_mars_photos_update_database", traceback.format_exc())
 
         # Return failed-execution indication to the calling function:
-        return False
+        return "An error has occurred. Data cannot be obtained at this time.", False
 
 
 def get_mars_photos_update_from_api(rover_name, earth_date):
-    """Function to retrieve, via an API request, photos available for a particular rover/earth date combination"""
+    """Function to retrieve, via an API request, photos available for a particular rover/earth date combination (along with the request's HTTP status code)"""
     try:
+        # Acquire a rate-limit token.  If none is available, update system log and return the same indication as the API
+        # would if its quota were exhausted (HTTP 429), so that the calling function defers the request:
+        wait_seconds = get_rate_limit_token("mars_photos")
+        if wait_seconds > 0:
+            update_system_log("get_mars_photos_update_from_api", f"Rate limit reached (retry in about {math.ceil(wait_seconds)} seconds). Data (for Rover: '{rover_name}', Earth Date {earth_date}) cannot be obtained at this time.")
+            return {}, 429
+
         # Identify the URL which will be used as part of the API request:
         url = URL_MARS_ROVER_PHOTOS_BY_ROVER_AND_OTHER_CRITERIA + rover_name + "/photos/?api_key=" + API_KEY_MARS_ROVER_PHOTOS + "&earth_date=" + earth_date
 
         # Execute the API request.
-        response = requests.get(url)
+        response = requests.get(url, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
         if response.status_code == 200:  # API request was successful.
             # Return the retrieved JSON to the calling function:
-            return response.json()['photos']
+            return response.json()['photos'], response.status_code
 
         else:  # API request failed.  Update system log and return failed-execution indication to the calling function:
             # Inform the user that the photos cannot be obtained at this time:
-            update_system_log("get_mars_photos_update_from_api", "Error: API request failed. Data (for Rover: '{rover_name}', Earth Date {earth_date}) cannot be obtained at this time.")
-            return {}
+            update_system_log("get_mars_photos_update_from_api", f"Error: API request failed (HTTP {response.status_code}). Data (for Rover: '{rover_name}', Earth Date {earth_date}) cannot be obtained at this time.")
+            return {}, response.status_code
 
     except:  # An error has occurred.
         update_system_log("get_mars_photos_update_from_api", traceback.format_exc())
 
         # Return failed-execution indication to the calling function:
+        return {}, None
+
+
+def get_mars_rovers():
+    """Function to retrieve the names of the Mars rovers that are currently active (for purposes of data production), cached in-process until the "mars_rovers" dataset changes"""
+    try:
+        # If the "mars_rovers" dataset has changed since the cached rover names were loaded (or they have not yet been
+        # loaded), reload them from the database (one thread only):
+        version = get_dataset_version("mars_rovers")["version"]
+        if mars_rovers["dataset_version"] != version:
+            with mars_rovers_lock:
+                if mars_rovers["dataset_version"] != version:
+                    # Retrieve the active rovers.  If the function called returns a failed-execution indication, return
+                    # failed-execution indication to the calling function (the reload is re-attempted upon the next call):
+                    mars_rovers_from_db = retrieve_from_database("mars_rovers")
+                    if mars_rovers_from_db == {}:
+                        return {}
+
+                    # Replace (rather than modify) the cached list of rover names, and record the version it was drawn from:
+                    mars_rovers["rover_names"] = [record.rover_name for record in mars_rovers_from_db]
+                    mars_rovers["dataset_version"] = version
+
+        # Return a copy of the cached rover names to the calling function:
+        return list(mars_rovers["rover_names"])
+
+    except:  # An error has occurred.
+        update_system_log("get_mars_rovers", traceback.format_exc())
+
+        # Return empty dictionary as a failed-execution indication to the calling function:
         return {}
 
 
 def get_people_in_space_now():
-    """Function that retrieves a list of people currently in space at the present moment"""
+    """Function that retrieves a list of people currently in space at the present moment (along with the date/time it was fetched, if the upstream API is unavailable and the last known good list is provided instead)"""
     try:
-        # Execute the API request:
-        response = requests.get(URL_PEOPLE_IN_SPACE_NOW)
+        # Obtain the list (falling back to the last known good list if the upstream API is unavailable).  If no list could be
+        # obtained, update system log and return failed-execution indication to the calling function:
+        people_in_space_now, date_time_fetched, error_message = get_upstream_payload("people_in_space_now", get_people_in_space_now_from_api)
+        if people_in_space_now == None:
+            update_system_log("get_people_in_space_now", f"Error: {error_message}")
+            return f"{error_message} Data cannot be obtained at this time.", False, None
 
-        # If the API request was successful, display the results:
-        if response.status_code == 200:  # API request was successful.
-            # Sort the resulting JSON by person's name:
-            people_in_space_now = collections.OrderedDict(response.json().items())
+        # Return the list to the calling function:
+        return people_in_space_now, True, date_time_fetched
 
-            # Return the sorted JSON to the calling function:
-            return people_in_space_now["people"], True
+    except:  # An error has occurred.
+        update_system_log("get_people_in_space_now", traceback.format_exc())
+        return "An error has occurred. Data cannot be obtained at this time.", False, None
 
-        else:  # API request failed. Update system log and return failed-execution indication to the calling function:
-            update_system_log("get_people_in_space_now", "Error: API request failed. Data cannot be obtained at this time.")
-            return "Error: API request failed. Data cannot be obtained at this time.", False
+
+def get_people_in_space_now_from_api():
+    """Function to retrieve, via an API request, a list of people currently in space (returning None if the request failed)"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Execute the API request:
+    response = requests.get(URL_PEOPLE_IN_SPACE_NOW, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+
+    # If the API request was successful, return the list.  Otherwise, update system log and return failed-execution indication:
+    if response.status_code == 200:
+        return response.json()["people"]
+
+    update_system_log("get_people_in_space_now_from_api", f"Error: API request failed (HTTP {response.status_code}).")
+    return None
+
+
+def get_rate_limit_token(api_name, limits=None, shared=True):
+    """Function to acquire a token from each of the rate-limit buckets of an upstream API (or other key, such as a client's use of a route), returning 0 if acquired or otherwise the estimated number of seconds until a token is available"""
+    try:
+        # Capture the limits applicable (by default, the API's documented limits).  If there are none, no token is needed:
+        if limits == None:
+            limits = rate_limits.get(api_name, [])
+        if limits == []:
+            return 0
+
+        # If shared, take a token from each of the buckets held in the "rate_limit_buckets" database table (so that usage is
+        # retained across restarts and processes, the buckets being updated atomically):
+        if shared:
+            return get_rate_limit_token_shared(api_name, limits)
+
+        # Otherwise, capture each of the in-process buckets, and take a token from each if every bucket holds one:
+        with rate_limit_buckets_lock:
+            current_date_time = datetime.now()
+
+            # If the in-process buckets have grown beyond the allowance (e.g., from many distinct clients), discard those which
+            # have since refilled (their absence being equivalent):
+            if len(rate_limit_buckets) > INBOUND_RATE_LIMITS_MAX_CLIENTS:
+                for key in [key for key, bucket in rate_limit_buckets.items() if (current_date_time - bucket["date_time_updated"]).total_seconds() >= key[1]]:
+                    del rate_limit_buckets[key]
+
+            buckets = []
+            for capacity, period_seconds in limits:
+                buckets.append(rate_limit_buckets.setdefault((api_name, period_seconds), {"tokens": capacity, "date_time_updated": current_date_time}))
+
+            wait_seconds = get_rate_limit_token_from_buckets(buckets, limits, current_date_time)
+
+        # Return 0 (token acquired) or the estimated wait (in seconds) to the calling function:
+        return wait_seconds
 
     except:  # An error has occurred.
-        update_system_log("get_people_in_space_now", traceback.format_exc())
-        return "An error has occurred. Data cannot be obtained at this time.", False
+        update_system_log("get_rate_limit_token", traceback.format_exc())
+
+        # Return 0, so that the request proceeds (rate limiting failing open):
+        return 0
+
+
+def get_rate_limit_token_from_buckets(buckets, limits, current_date_time):
+    """Function to refill rate-limit buckets (dictionaries of tokens held and date/time updated) and, if every bucket holds a token, take one from each, returning 0 if taken or otherwise the estimated number of seconds until a token is available"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Refill each bucket in proportion to the time elapsed since it was last updated, estimating (for any bucket not holding a
+    # token) the time until it does:
+    wait_seconds = 0
+    for bucket, (capacity, period_seconds) in zip(buckets, limits):
+        bucket["tokens"] = min(capacity, bucket["tokens"] + max(0, (current_date_time - bucket["date_time_updated"]).total_seconds()) * capacity / period_seconds)
+        bucket["date_time_updated"] = current_date_time
+        if bucket["tokens"] < 1:
+            wait_seconds = max(wait_seconds, (1 - bucket["tokens"]) * period_seconds / capacity)
+
+    # If every bucket holds a token, take one from each:
+    if wait_seconds == 0:
+        for bucket in buckets:
+            bucket["tokens"] -= 1
+
+    # Return 0 (token taken) or the estimated wait (in seconds) to the calling function:
+    return wait_seconds
+
+
+def get_rate_limit_token_shared(api_name, limits):
+    """Function to acquire a token from each of the rate-limit buckets (held in the "rate_limit_buckets" database table, shared by all processes serving this website) of an upstream API or other key, returning 0 if acquired or otherwise the estimated number of seconds until a token is available"""
+    # NOTE: Error handling is deferred to the calling function.
+    with app.app_context():
+        for attempt in range(0, RATE_LIMIT_TOKEN_MAX_ATTEMPTS):
+            # Read the buckets (in a transaction of its own, so that no transaction is held between the read and the update below).
+            # If any bucket does not yet exist, create it (full), then read the buckets afresh:
+            current_date_time = datetime.now()
+            records = {record.period_seconds: record for record in db.session.execute(db.select(RateLimitBuckets.period_seconds, RateLimitBuckets.tokens, RateLimitBuckets.date_time_updated).where(RateLimitBuckets.api_name == api_name)).all()}
+            db.session.commit()
+            if any(not (period_seconds in records) for capacity, period_seconds in limits):
+                try:
+                    db.session.execute(db.insert(RateLimitBuckets), [{"api_name": api_name, "period_seconds": period_seconds, "tokens": capacity, "date_time_updated": current_date_time} for capacity, period_seconds in limits if not (period_seconds in records)])
+                    db.session.commit()
+                except IntegrityError:  # Another process created the bucket(s) in the meantime.
+                    db.session.rollback()
+                continue
+
+            # Refill the buckets and, if every bucket holds a token, take one from each.  If not, return the estimated wait to the
+            # calling function (there being nothing to update, as refilling depends only on the time elapsed):
+            buckets = [{"period_seconds": period_seconds, "tokens": records[period_seconds].tokens, "date_time_updated": records[period_seconds].date_time_updated} for capacity, period_seconds in limits]
+            wait_seconds = get_rate_limit_token_from_buckets(buckets, limits, current_date_time)
+            if wait_seconds > 0:
+                return wait_seconds
+
+            # Update each bucket, provided it is unchanged since it was read (i.e., no other process took a token from it in the
+            # meantime), committing all of the updates as a single transaction.  If any bucket has changed, discard the updates and
+            # try again:
+            is_unchanged = True
+            for bucket in buckets:
+                result = db.session.execute(db.update(RateLimitBuckets).where(RateLimitBuckets.api_name == api_name, RateLimitBuckets.period_seconds == bucket["period_seconds"], RateLimitBuckets.date_time_updated == records[bucket["period_seconds"]].date_time_updated).values(tokens=bucket["tokens"], date_time_updated=bucket["date_time_updated"]))
+                if result.rowcount == 0:
+                    is_unchanged = False
+                    break
+            if is_unchanged:
+                db.session.commit()
+                return 0
+            db.session.rollback()
+
+    # The buckets were updated concurrently by other processes on every attempt.  Update system log and return 0, so that the
+    # request proceeds (rate limiting failing open):
+    update_system_log("get_rate_limit_token_shared", f"Warning: Token for '{api_name}' could not be taken after {RATE_LIMIT_TOKEN_MAX_ATTEMPTS} attempts.")
+    return 0
 
 
 def get_space_news():
-    """Function for retrieving the latest space news articles"""
+    """Function for retrieving the latest space news articles (along with the date/time the stored articles were fetched, if the upstream API is unavailable and those articles are to be provided instead)"""
     try:
         # Initialize variables to return to calling function:
         success = True
         error_message = ""
+        date_time_fetched = None
 
-        # Execute API request:
-        response = requests.get(URL_SPACE_NEWS)
-        if response.status_code == 200:
+        # Obtain the latest articles.  The articles stored in the "space_news" database table serve as the last known good
+        # articles, so no separate copy of same is kept:
+        articles, date_time_fetched, error_message = get_upstream_payload("space_news", get_space_news_from_api, use_last_known_good=False)
+        if articles != None:
             # Delete the existing records in the "space_news" database table and update same with
-            # the newly acquired articles (from the JSON).  If function failed, update system log
+            # the newly acquired articles.  If function failed, update system log
             # and return failed-execution indication to the calling function:
-            if not update_database("update_space_news", response.json()['results']):
+            if not update_database("update_space_news", articles):
                 update_system_log("update_space_news", "Error: Space news articles cannot be obtained at this time.")
                 error_message = "Error: Space news articles cannot be obtained at this time."
                 success = False
 
-        else:  # API request failed. Update system log and return failed-execution calling function:
-            update_system_log("get_space_news", "Error: API request failed. Data cannot be obtained at this time.")
-            error_message = "API request failed. Space news articles cannot be obtained at this time."
-            success = False
+        else:  # Upstream API is unavailable.  Fall back to the stored articles (if any), as of when they were last refreshed:
+            dataset_version = get_dataset_version("space_news")
+            if dataset_version["row_count"] > 0 and dataset_version["date_time_refreshed"] != None:
+                date_time_fetched = dataset_version["date_time_refreshed"]
+                error_message = ""
+            else:  # No stored articles.  Update system log and return failed-execution indication to the calling function:
+                update_system_log("get_space_news", f"Error: {error_message}")
+                error_message = f"{error_message} Space news articles cannot be obtained at this time."
+                success = False
 
     except:  # An error has occurred.
         update_system_log("get_space_news", traceback.format_exc())
@@ -2179,7 +3549,162 @@ def get_space_news():
 
     finally:
         # Return results to the calling function:
-        return success, error_message
+        return success, error_message, date_time_fetched
+
+
+def get_space_news_from_api():
+    """Function to retrieve, via an API request, the latest space news articles (returning None if the request failed)"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Execute API request:
+    response = requests.get(URL_SPACE_NEWS, timeout=UPSTREAM_REQUEST_TIMEOUT_SECONDS)
+
+    # If the API request was successful, return the articles.  Otherwise, update system log and return failed-execution indication:
+    if response.status_code == 200:
+        return response.json()['results']
+
+    update_system_log("get_space_news_from_api", f"Error: API request failed (HTTP {response.status_code}).")
+    return None
+
+
+def get_upstream_payload(upstream_name, fetch_function, use_last_known_good=True, flight_key=None):
+    """Function to obtain an upstream API's payload via the fetch function passed, guarded by the upstream's circuit breaker and rate limit, falling back (if requested) to the upstream's last known good payload.  Concurrent identical requests (per the flight key, which defaults to the upstream's name) are coalesced into one"""
+    try:
+        # Capture (creating, if needed) the upstream's circuit breaker:
+        with circuit_breakers_lock:
+            breaker = circuit_breakers.setdefault(upstream_name, {"state": "closed", "consecutive_failures": 0})
+
+        # If the upstream's circuit is open, do not make a request of it (it is probed in the background until it recovers).
+        # Otherwise, obtain the payload (sharing the result of any identical request already in flight).  If successful, return it:
+        if breaker["state"] == "open":
+            error_message = "The data source is currently unavailable."
+        else:
+            payload, error_message = get_upstream_payload_single_flight(upstream_name, fetch_function, upstream_name if flight_key == None else flight_key, use_last_known_good)
+            if payload != None:
+                return payload, None, ""
+
+        # Fall back to the upstream's last known good payload (if requested and available), returned along with the date/time it
+        # was fetched:
+        if use_last_known_good:
+            upstream_payload = retrieve_from_database("upstream_payload", upstream_name=upstream_name)
+            if upstream_payload not in [None, {}]:
+                return upstream_payload.payload, upstream_payload.date_time_fetched, ""
+
+        # Return failed-execution indication to the calling function:
+        return None, None, error_message
+
+    except:  # An error has occurred.
+        update_system_log("get_upstream_payload", traceback.format_exc())
+
+        # Return failed-execution indication to the calling function:
+        return None, None, "An error has occurred."
+
+
+def get_upstream_payload_from_api(upstream_name, fetch_function, use_last_known_good):
+    """Function to obtain an upstream API's payload via the fetch function passed, recording the outcome against the upstream's circuit breaker (and, if successful and the upstream falls back to it, recording the payload as the upstream's last known good payload)"""
+    # NOTE: Error handling (other than of the request itself) is deferred to the calling function.
+    # Obtain the payload, timing the request.  A request which raises an error is deemed to have failed:
+    time_started = time.monotonic()
+    try:
+        payload = fetch_function()
+    except:
+        update_system_log("get_upstream_payload_from_api", traceback.format_exc())
+        payload = None
+    elapsed_seconds = time.monotonic() - time_started
+
+    # Record the outcome against the upstream's circuit breaker.  A failed or slow request adds to the count of consecutive
+    # failures; once the threshold is reached, open the circuit and start probing the upstream in the background:
+    with circuit_breakers_lock:
+        breaker = circuit_breakers[upstream_name]
+        if payload != None and elapsed_seconds <= CIRCUIT_BREAKER_SLOW_CALL_SECONDS:
+            breaker["consecutive_failures"] = 0
+        else:
+            breaker["consecutive_failures"] += 1
+            if breaker["state"] == "closed" and breaker["consecutive_failures"] >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+                breaker["state"] = "open"
+                update_system_log("get_upstream_payload_from_api", f"Circuit opened for '{upstream_name}' after {breaker["consecutive_failures"]} consecutive failed or slow requests.")
+                threading.Thread(target=run_upstream_probes, args=(upstream_name, fetch_function, use_last_known_good), daemon=True).start()
+
+    # If the payload was obtained, record it as the upstream's last known good payload (unless the upstream never falls back to it):
+    if payload != None and use_last_known_good:
+        update_database("update_upstream_payload", payload, upstream_name=upstream_name)
+
+    # Return the payload (or None, if the request failed) to the calling function:
+    return payload
+
+
+def get_upstream_payload_from_api_exclusive(upstream_name, fetch_function, flight_key, use_last_known_good):
+    """Function to obtain an upstream API's payload (subject to its rate limit) such that, of the processes making identical requests concurrently (per the flight key), only one makes the request of the upstream, the others sharing its result"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Claim the flight's lock file (waiting while another process holds it):
+    lock_file_path = os.path.join(app.instance_path, f"upstream_{hashlib.sha256(flight_key.encode()).hexdigest()[:16]}.lock")
+    date_time_started = datetime.now()
+    lock_token, has_waited = claim_lock_file(lock_file_path, UPSTREAM_FLIGHT_LOCK_WAIT_SECONDS)
+
+    try:
+        # If another process completed the request while this one waited, share the payload it recorded (available only where
+        # the payload is recorded, i.e., the upstream falls back to its last known good payload, and recorded under the flight
+        # key, i.e., the request has no parameters beyond the upstream's name):
+        if has_waited and use_last_known_good and flight_key == upstream_name:
+            upstream_payload = retrieve_from_database("upstream_payload", upstream_name=upstream_name)
+            if upstream_payload not in [None, {}] and upstream_payload.date_time_fetched >= date_time_started:
+                return upstream_payload.payload, ""
+
+        # Acquire a rate-limit token.  If none is available, update system log and return failed-execution indication to the calling function:
+        wait_seconds = get_rate_limit_token(upstream_name)
+        if wait_seconds > 0:
+            update_system_log("get_upstream_payload_from_api_exclusive", f"Rate limit reached for '{upstream_name}' (retry in about {math.ceil(wait_seconds)} seconds).")
+            return None, f"Rate limit reached. Data can be obtained again in about {math.ceil(wait_seconds)} seconds."
+
+        # Obtain the payload and return it (or failed-execution indication) to the calling function:
+        payload = get_upstream_payload_from_api(upstream_name, fetch_function, use_last_known_good)
+        return payload, "" if payload != None else "The data source is currently unavailable."
+
+    finally:
+        # Release the flight's lock file (if claimed):
+        if lock_token != None:
+            release_lock_file(lock_token)
+
+
+def get_upstream_payload_single_flight(upstream_name, fetch_function, flight_key, use_last_known_good):
+    """Function to obtain an upstream API's payload such that, of the threads making identical requests concurrently (per the flight key), only the first makes the request, the others waiting on and sharing its result"""
+    # NOTE: Error handling is deferred to the calling function.
+    # Join the flight already in progress for the key, if any.  Otherwise, start one (this thread making the request):
+    with upstream_flights_lock:
+        flight = upstream_flights.get(flight_key, None)
+        is_leader = flight == None
+        if is_leader:
+            flight = {"event": threading.Event(), "payload": None, "error_message": "The data source is currently unavailable."}
+            upstream_flights[flight_key] = flight
+
+    # If joining a flight in progress, wait for its result and return same to the calling function:
+    if not is_leader:
+        flight["event"].wait()
+        return flight["payload"], flight["error_message"]
+
+    # Make the request (coordinating with any other processes making the identical request), then publish its result to the
+    # threads waiting on it and end the flight (so that subsequent requests are made afresh):
+    try:
+        flight["payload"], flight["error_message"] = get_upstream_payload_from_api_exclusive(upstream_name, fetch_function, flight_key, use_last_known_good)
+    finally:
+        with upstream_flights_lock:
+            del upstream_flights[flight_key]
+        flight["event"].set()
+
+    # Return the result to the calling function:
+    return flight["payload"], flight["error_message"]
+
+
+def open_spreadsheet(file_name):
+    """Function to open a spreadsheet file on the desktop (if available), or otherwise to prepare a response sending it to the browser.  The file name must already have been validated against the files listed for the scope involved"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If running on a desktop which can open files with their associated application, open the file there (no response needed):
+    if not HEADLESS and hasattr(os, "startfile"):
+        os.startfile(file_name)
+        return None
+
+    # Return a response sending the file (as an attachment, and only from the folder where spreadsheets are exported) to the
+    # calling function:
+    return send_from_directory(os.getcwd(), file_name, as_attachment=True)
 
 
 def prepare_spreadsheet_get_format(workbook, name):
@@ -2317,22 +3842,18 @@ def prepare_spreadsheet_main_contents(workbook, worksheet, name, **kwargs):
 
             # Add/format main contents:
             i = 3
-            dlg = PBI.PyBusyInfo(
-                f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Details - {worksheet_details[0]}.xlsx': Processing...",
-                title="Administrative Update")
+            dlg = show_dialog_busy_info(f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Details - {worksheet_details[0]}.xlsx': Processing...")
 
             for j in range(worksheet_details[4], worksheet_details[5]):
                 worksheet.write(i, 0, list_name[j].rover_name, prepare_spreadsheet_get_format(workbook, "data"))
-                worksheet.write(i, 1, list_name[j].earth_date, prepare_spreadsheet_get_format(workbook, "data"))
+                worksheet.write(i, 1, list_name[j].earth_date.isoformat(), prepare_spreadsheet_get_format(workbook, "data"))
                 worksheet.write(i, 2, str(list_name[j].sol), prepare_spreadsheet_get_format(workbook, "data"))
                 worksheet.write(i, 3, str(list_name[j].pic_id), prepare_spreadsheet_get_format(workbook, "data"))
                 worksheet.write(i, 4, list_name[j].camera_name, prepare_spreadsheet_get_format(workbook, "data"))
                 worksheet.write(i, 5, list_name[j].camera_full_name, prepare_spreadsheet_get_format(workbook, "data"))
                 worksheet.write_url(i, 6, list_name[j].url, prepare_spreadsheet_get_format(workbook, "url"), tip="Click here for photo.")
                 i += 1
-            dlg = PBI.PyBusyInfo(
-                f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Details - {worksheet_details[0]}.xlsx': Completed...",
-                title="Administrative Update")
+            dlg = show_dialog_busy_info(f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Details - {worksheet_details[0]}.xlsx': Completed...")
 
         elif name == "photos_available_headers":
             worksheet.write(2, 0, "Rover Name", prepare_spreadsheet_get_format(workbook, "column_headers"))
@@ -2342,9 +3863,7 @@ def prepare_spreadsheet_main_contents(workbook, worksheet, name, **kwargs):
             worksheet.write(2, 4, "Total Photos Available", prepare_spreadsheet_get_format(workbook, "column_headers"))
 
         elif name == "photos_available_data":
-            dlg = PBI.PyBusyInfo(
-                f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Summary.xlsx': Processing...",
-                title="Administrative Update")
+            dlg = show_dialog_busy_info(f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Summary.xlsx': Processing...")
 
             # Capture optional arguments:
             list_name = kwargs.get("list_name", None)
@@ -2359,9 +3878,7 @@ def prepare_spreadsheet_main_contents(workbook, worksheet, name, **kwargs):
                 worksheet.write(i, 4, item.total_photos, prepare_spreadsheet_get_format(workbook, "data"))
                 i += 1
 
-            dlg = PBI.PyBusyInfo(
-                f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Summary.xlsx': Completed...",
-                title="Administrative Update")
+            dlg = show_dialog_busy_info(f"Photos from Mars: Exporting results to spreadsheet file 'Mars Photos - Summary.xlsx': Completed...")
 
         # At this point, function is presumed to have executed succssfully.  Return successful-execution indication
         # to the calling function:
@@ -2473,6 +3990,15 @@ def prepare_spreadsheet_supplemental_formatting(workbook, worksheet, name, curre
         return False
 
 
+def release_lock_file(lock_token):
+    """Function to release a lock file claimed via the "claim_lock_file" function (the lock file itself is kept, for reuse by later claims)"""
+    try:
+        if os.name == "nt":
+            msvcrt.locking(lock_token, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(lock_token)
+
+
 def retrieve_from_database(trans_type, **kwargs):
     """Function to retrieve data from this application's database based on the type of transaction"""
     try:
@@ -2488,6 +4014,38 @@ def retrieve_from_database(trans_type, **kwargs):
                 # Retrieve and return all existing records, sorted by asteroid's name, from the "approaching_asteroids" database table where the "close_approach_date" field matches the passed parameter:
                 return db.session.execute(db.select(ApproachingAsteroids).where(ApproachingAsteroids.close_approach_date == close_approach_date).order_by(ApproachingAsteroids.name)).scalars().all()
 
+            elif trans_type == "approaching_asteroids_close_approach_dates":
+                # Retrieve and return the distinct close-approach dates, in ascending order, from the "approaching_asteroids" database table:
+                return db.session.execute(db.select(ApproachingAsteroids.close_approach_date).distinct().order_by(ApproachingAsteroids.close_approach_date)).scalars().all()
+
+            elif trans_type == "approaching_asteroids_days_to_fetch":
+                # Capture optional arguments:
+                start_date = kwargs.get("start_date", None)
+                end_date = kwargs.get("end_date", None)
+
+                # Build the list of close-approach dates (as "YYYY-MM-DD" strings) covered by the requested window:
+                window_days = [(start_date + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(0, (end_date.date() - start_date.date()).days + 1)]
+
+                # Retrieve the close-approach dates within the window that were fetched recently enough to still be current:
+                current_days = set(db.session.execute(db.select(ApproachingAsteroidsDays.close_approach_date).where(ApproachingAsteroidsDays.close_approach_date.in_(window_days), ApproachingAsteroidsDays.date_time_fetched >= datetime.now() - timedelta(hours=APPROACHING_ASTEROIDS_DAY_EXPIRY_HOURS))).scalars().all())
+
+                # Return (in ascending order) the close-approach dates which are missing or expired:
+                return [day for day in window_days if day not in current_days]
+
+            elif trans_type == "autocomplete_index_entries":
+                # Retrieve the names to be indexed for autocompletion (planet names, host names, and constellation names and nicknames).
+                # Planet entries also carry the discovery year, so that the "confirmed planets" page can select it for the user:
+                index_entries = []
+                for record in db.session.execute(db.select(ConfirmedPlanets.planet_name, ConfirmedPlanets.host_name, ConfirmedPlanets.discovery_year)).all():
+                    index_entries.append((record.planet_name.lower(), record.planet_name, "Planet", record.discovery_year))
+                    index_entries.append((record.host_name.lower(), record.host_name, "Host Star", None))
+                for record in db.session.execute(db.select(Constellations.name, Constellations.nickname)).all():
+                    index_entries.append((record.name.lower(), f"{record.name} ({record.nickname})", "Constellation", None))
+                    index_entries.append((record.nickname.lower(), f"{record.name} ({record.nickname})", "Constellation", None))
+
+                # Return the list of (key, name, type, discovery year) entries to the calling function:
+                return index_entries
+
             elif trans_type == "confirmed_planets":
                 # Retrieve and return all existing records, sorted by host and planet names. from the "confirmed_planets" database table:
                 return db.session.execute(db.select(ConfirmedPlanets).order_by(ConfirmedPlanets.host_name, ConfirmedPlanets.planet_name)).scalars().all()
@@ -2499,6 +4057,30 @@ def retrieve_from_database(trans_type, **kwargs):
                 # Retrieve and return all existing records, sorted by host and planet names, from the "confirmed_planets" database table where the "discovery_year" field matches the passed parameter:
                 return db.session.execute(db.select(ConfirmedPlanets).where(ConfirmedPlanets.discovery_year == disc_year).order_by(ConfirmedPlanets.host_name, ConfirmedPlanets.planet_name)).scalars().all()
 
+            elif trans_type == "confirmed_planets_discovery_years":
+                # Retrieve and return the distinct discovery years, in descending order, from the "confirmed_planets" database table:
+                return db.session.execute(db.select(ConfirmedPlanets.discovery_year).distinct().order_by(ConfirmedPlanets.discovery_year.desc())).scalars().all()
+
+            elif trans_type == "confirmed_planets_newly_confirmed":
+                # Identify the date/time of the most recent full refresh which inserted planets into the "confirmed_planets" database
+                # table (partial refreshes, e.g., of a single discovery year, are not considered):
+                latest_refresh = db.session.execute(db.select(func.max(ConfirmedPlanetsChanges.date_time_refreshed)).where(ConfirmedPlanetsChanges.is_full_refresh == True, ConfirmedPlanetsChanges.change_type == "insert")).scalar()
+
+                # Retrieve and return all existing records, sorted by host and planet names, from the "confirmed_planets" database table which were inserted by that refresh:
+                return db.session.execute(db.select(ConfirmedPlanets).join(ConfirmedPlanetsChanges, ConfirmedPlanetsChanges.planet_name == ConfirmedPlanets.planet_name).where(ConfirmedPlanetsChanges.change_type == "insert", ConfirmedPlanetsChanges.date_time_refreshed == latest_refresh).order_by(ConfirmedPlanets.host_name, ConfirmedPlanets.planet_name)).scalars().all()
+
+            elif trans_type == "confirmed_planets_year_refresh_due":
+                # Capture optional argument:
+                disc_year = kwargs.get("disc_year", None)
+
+                # Determine and return whether the confirmed planets discovered in the year passed to this function are due to be
+                # refreshed on demand (i.e., not refreshed recently, and not claimed for a refresh or deferred after a failed one):
+                current_date_time = datetime.now()
+                record = db.session.get(ConfirmedPlanetsYearRefreshes, disc_year)
+                if record == None:
+                    return True
+                return (record.date_time_refreshed == None or current_date_time - record.date_time_refreshed > timedelta(hours=CONFIRMED_PLANETS_ON_DEMAND_REFRESH_HOURS)) and (record.not_before == None or record.not_before <= current_date_time)
+
             elif trans_type == "constellations":
                 # Initialize return variable (dictionary):
                 item_to_return = {}
@@ -2524,23 +4106,37 @@ def retrieve_from_database(trans_type, **kwargs):
                 # Return the "item to return" dictionary to the calling function:
                 return item_to_return
 
-            elif trans_type == "mars_photo_details_compare_with_photos_available":
-                # Retrieve all existing records, sorted by rover name/earth date combo and sol, from the "mars_photos_available" database table:
-                photos_available_summary = db.session.query(MarsPhotosAvailable).with_entities(MarsPhotosAvailable.rover_earth_date_combo, MarsPhotosAvailable.sol, MarsPhotosAvailable.total_photos).group_by(MarsPhotosAvailable.rover_earth_date_combo, MarsPhotosAvailable.sol).order_by(MarsPhotosAvailable.rover_earth_date_combo, MarsPhotosAvailable.sol).all()
+            elif trans_type == "constellations_names_and_nicknames":
+                # Retrieve and return the constellation names (each with its nickname), sorted by name, from the "constellations" database table:
+                return db.session.execute(db.select(Constellations.name + " (" + Constellations.nickname + ")").order_by(Constellations.name)).scalars().all()
+
+            elif trans_type == "contact_outbox_to_send":
+                # Retrieve and return the next batch of messages due to be sent (pending, and not deferred to a later date/time),
+                # oldest first, from the "contact_outbox" database table:
+                return db.session.execute(db.select(ContactOutbox).where(ContactOutbox.status == "pending", or_(ContactOutbox.not_before == None, ContactOutbox.not_before <= datetime.now())).order_by(ContactOutbox.row_id).limit(CONTACT_OUTBOX_BATCH_SIZE)).scalars().all()
 
-                # Retrieve all existing records, sorted by rover name/earth date combo and sol, from the "mars_photo_details" database table:
-                photo_details_summary = db.session.query(MarsPhotoDetails).with_entities(MarsPhotoDetails.rover_earth_date_combo, MarsPhotoDetails.sol,func.count(MarsPhotoDetails.pic_id).label("total_photos")).group_by(MarsPhotoDetails.rover_earth_date_combo, MarsPhotoDetails.sol).order_by(MarsPhotoDetails.rover_earth_date_combo, MarsPhotoDetails.sol).all()
+            elif trans_type == "dataset_version":
+                # Capture optional argument:
+                dataset_name = kwargs.get("dataset_name", None)
+
+                # Retrieve and return the record, from the "dataset_versions" database table, for the dataset passed to this function:
+                return db.session.get(DatasetVersions, dataset_name)
 
-                # Return both retrieved-record lists to the calling function:
-                return photos_available_summary, photo_details_summary
+            elif trans_type == "mars_photo_details_counts_by_rover_earth_date_combo":
+                # Retrieve and return photo counts, by rover name and earth date, from the "mars_photo_details" database table:
+                return db.session.execute(db.select(MarsRovers.rover_name, MarsPhotoDetails.earth_date, func.count(MarsPhotoDetails.row_id).label("total_photos")).join(MarsPhotoDetails.rover).group_by(MarsRovers.rover_name, MarsPhotoDetails.earth_date)).all()
 
-            elif trans_type == "mars_photo_details_get_counts_by_rover_and_earth_date":
-                # Retrieve and return all existing records, sorted by rover name (asc) and earth date (desc), from the "mars_photos_available" database table:
-                return db.session.query(MarsPhotosAvailable).with_entities(MarsPhotosAvailable.rover_name, MarsPhotosAvailable.earth_date, MarsPhotosAvailable.total_photos).group_by(MarsPhotosAvailable.rover_name, MarsPhotosAvailable.earth_date).order_by(MarsPhotosAvailable.rover_name,MarsPhotosAvailable.earth_date.desc()).all()
+            elif trans_type == "mars_photo_counts":
+                # Retrieve and return all existing records, sorted by rover name (asc), earth year (desc), and camera name (asc), from the "mars_photo_counts" database table:
+                return db.session.execute(db.select(MarsPhotoCounts).order_by(MarsPhotoCounts.rover_name, MarsPhotoCounts.earth_year.desc(), MarsPhotoCounts.camera_name)).scalars().all()
+
+            elif trans_type == "mars_photo_counts_by_rover_and_earth_year":
+                # Retrieve and return photo counts (totalled across cameras), sorted by rover name (asc) and earth year (desc), from the "mars_photo_counts" database table:
+                return db.session.execute(db.select(MarsPhotoCounts.rover_name, MarsPhotoCounts.earth_year, func.sum(MarsPhotoCounts.total_photos).label("total_photos")).group_by(MarsPhotoCounts.rover_name, MarsPhotoCounts.earth_year).order_by(MarsPhotoCounts.rover_name, MarsPhotoCounts.earth_year.desc())).all()
 
             elif trans_type == "mars_photo_details":
                 # Retrieve and return all existing records, sorted by rover name (asc), earth date (desc), sol (asc), and pic id (asc) from the "mars_photo_details" database table:
-                return db.session.execute(db.select(MarsPhotoDetails).order_by(MarsPhotoDetails.rover_name, MarsPhotoDetails.earth_date.desc(), MarsPhotoDetails.sol, MarsPhotoDetails.pic_id)).scalars().all()
+                return db.session.execute(db.select(MarsPhotoDetails).join(MarsPhotoDetails.rover).order_by(MarsRovers.rover_name, MarsPhotoDetails.earth_date.desc(), MarsPhotoDetails.sol, MarsPhotoDetails.pic_id)).scalars().all()
 
             elif trans_type == "mars_photo_details_rover_earth_date_combo":
                 # Capture optional arguments:
@@ -2548,37 +4144,152 @@ def retrieve_from_database(trans_type, **kwargs):
                 earth_date = kwargs.get("earth_date", None)
 
                 # Retrieve and return all existing records, sorted by sol and pic id, from the "mars_photo_details" database table for the rover name and earth date passed to this function:
-                return db.session.execute(db.select(MarsPhotoDetails).where(MarsPhotoDetails.rover_earth_date_combo == rover_name + "_" + earth_date).order_by(MarsPhotoDetails.sol, MarsPhotoDetails.pic_id)).scalars().all()
+                return db.session.execute(db.select(MarsPhotoDetails).join(MarsPhotoDetails.rover).where(MarsRovers.rover_name == rover_name, MarsPhotoDetails.earth_date == date.fromisoformat(earth_date)).order_by(MarsPhotoDetails.sol, MarsPhotoDetails.pic_id)).scalars().all()
 
             elif trans_type == "mars_photo_details_rover_earth_date_combo_count":
                 # Capture optional arguments:
                 rover_name = kwargs.get("rover_name", None)
                 earth_date = kwargs.get("earth_date", None)
 
-                # Retrieve all existing records from the "mars_photo_details" database table for the rover name and earth date passed to this function:
-                records = db.session.execute(db.select(MarsPhotoDetails).where(MarsPhotoDetails.rover_earth_date_combo == rover_name + "_" + earth_date)).scalars().all()
-
-                # Return the count of retrieved records to the calling function:
-                return len(records)
+                # Count and return the existing records in the "mars_photo_details" database table for the rover name and earth date passed to this function:
+                return db.session.execute(db.select(func.count(MarsPhotoDetails.row_id)).join(MarsPhotoDetails.rover).where(MarsRovers.rover_name == rover_name, MarsPhotoDetails.earth_date == date.fromisoformat(earth_date))).scalar()
 
             elif trans_type == "mars_photos_available":
                 # Retrieve and return all existing records, sorted by rover name and earth date (latter = descending order) from the "mars_photos_available" database table:
                 return db.session.execute(db.select(MarsPhotosAvailable).order_by(MarsPhotosAvailable.rover_name, MarsPhotosAvailable.earth_date.desc())).scalars().all()
 
+            elif trans_type == "mars_photos_available_rover_earth_date_combos":
+                # Retrieve and return the distinct rover name / earth date combos, sorted by rover name and earth date (latter = descending order), from the "mars_photos_available" database table:
+                return [record.rover_earth_date_combo for record in db.session.execute(db.select(MarsPhotosAvailable.rover_earth_date_combo, MarsPhotosAvailable.rover_name, MarsPhotosAvailable.earth_date).distinct().order_by(MarsPhotosAvailable.rover_name, MarsPhotosAvailable.earth_date.desc())).all()]
+
             elif trans_type == "mars_photos_by_rover_earth_date_combo":
                 # Capture optional argument:
                 rover_earth_date_combo = kwargs.get("rover_earth_date_combo", None)
 
-                # Retrieve and return all existing records, sorted by sol and pic id, from the "mars_photo_details" database table where the "rover_earth_date_combo" field matches the passed parameter:
-                return db.session.execute(db.select(MarsPhotoDetails).where(MarsPhotoDetails.rover_earth_date_combo == rover_earth_date_combo).order_by(MarsPhotoDetails.sol, MarsPhotoDetails.pic_id)).scalars().all()
+                # Retrieve and return all existing records, sorted by sol and pic id, from the "mars_photo_details" database table for the rover name and earth date making up the passed parameter:
+                rover_name, earth_date = rover_earth_date_combo.split("_")
+                return db.session.execute(db.select(MarsPhotoDetails).join(MarsPhotoDetails.rover).where(MarsRovers.rover_name == rover_name, MarsPhotoDetails.earth_date == date.fromisoformat(earth_date)).order_by(MarsPhotoDetails.sol, MarsPhotoDetails.pic_id)).scalars().all()
+
+            elif trans_type == "mars_photos_filtered":
+                # Capture optional arguments (filters, and the page of results requested):
+                rover_name = kwargs.get("rover_name", None)
+                camera_name = kwargs.get("camera_name", None)
+                sol_min = kwargs.get("sol_min", None)
+                sol_max = kwargs.get("sol_max", None)
+                earth_date_min = kwargs.get("earth_date_min", None)
+                earth_date_max = kwargs.get("earth_date_max", None)
+                page = kwargs.get("page", 1)
+                per_page = kwargs.get("per_page", MARS_PHOTOS_FILTER_PER_PAGE)
+
+                # Translate the filters into conditions on the "mars_photo_details" database table's own columns (rover and camera
+                # names are resolved to IDs), so that the table's composite indexes (rover/camera/sol, rover/earth date/sol, and
+                # rover/sol) can be used:
+                conditions = []
+                if rover_name != None:
+                    conditions.append(MarsPhotoDetails.rover_id == db.select(MarsRovers.row_id).where(MarsRovers.rover_name == rover_name).scalar_subquery())
+                if sol_min != None:
+                    conditions.append(MarsPhotoDetails.sol >= sol_min)
+                if sol_max != None:
+                    conditions.append(MarsPhotoDetails.sol <= sol_max)
+                if earth_date_min != None:
+                    conditions.append(MarsPhotoDetails.earth_date >= earth_date_min)
+                if earth_date_max != None:
+                    conditions.append(MarsPhotoDetails.earth_date <= earth_date_max)
+
+                # Count the photos matching all filters other than camera, by camera (i.e., facet counts):
+                facets = {record.camera_name: record.total_photos for record in db.session.execute(db.select(MarsRoverCameras.camera_name, func.count(MarsPhotoDetails.row_id).label("total_photos")).join(MarsPhotoDetails.camera).where(*conditions).group_by(MarsRoverCameras.camera_name).order_by(MarsRoverCameras.camera_name)).all()}
+
+                # Retrieve the requested page of photos matching all filters, sorted by rover, sol, and pic id:
+                if camera_name != None:
+                    conditions.append(MarsPhotoDetails.camera_id.in_(db.select(MarsRoverCameras.row_id).where(MarsRoverCameras.camera_name == camera_name)))
+                photos = db.paginate(db.select(MarsPhotoDetails).where(*conditions).order_by(MarsPhotoDetails.rover_id, MarsPhotoDetails.sol, MarsPhotoDetails.pic_id), page=page, per_page=per_page, max_per_page=MARS_PHOTOS_FILTER_MAX_PER_PAGE, error_out=False)
+
+                # Return the page of photos, pagination details, and facet counts to the calling function:
+                return {"photos": photos.items, "page": photos.page, "per_page": photos.per_page, "pages": photos.pages, "total": photos.total, "facets": facets}
+
+            elif trans_type == "mars_photos_sync_queue":
+                # Retrieve and return all outstanding (pending or deferred) records, sorted by action (deletions first) and rover name / earth date combo, from the "mars_photos_sync_queue" database table:
+                return db.session.execute(db.select(MarsPhotosSyncQueue).where(MarsPhotosSyncQueue.status.in_(["pending", "deferred"])).order_by(MarsPhotosSyncQueue.action, MarsPhotosSyncQueue.rover_earth_date_combo)).scalars().all()
+
+            elif trans_type == "mars_rover_camera_names":
+                # Retrieve and return the distinct camera names, sorted by name, from the "mars_rover_cameras" database table:
+                return db.session.execute(db.select(MarsRoverCameras.camera_name).distinct().order_by(MarsRoverCameras.camera_name)).scalars().all()
+
+            elif trans_type == "mars_rover_manifests":
+                # Retrieve and return all existing records, sorted by rover name, from the "mars_rover_manifests" database table:
+                return db.session.execute(db.select(MarsRoverManifests).order_by(MarsRoverManifests.rover_name)).scalars().all()
+
+            elif trans_type == "mars_rover_names":
+                # Retrieve and return the names of all rovers (active or not), sorted by name, from the "mars_rovers" database table:
+                return db.session.execute(db.select(MarsRovers.rover_name).order_by(MarsRovers.rover_name)).scalars().all()
 
             elif trans_type == "mars_rovers":
                 # Retrieve and return all existing records, sorted by rover name, from the "mars_rovers" database table where rovers are tagged as active (in terms of data production):
-                return db.session.execute(db.select(MarsRovers).where(MarsRovers.active == "Yes").order_by(MarsRovers.rover_name)).scalars().all()
+                return db.session.execute(db.select(MarsRovers).where(MarsRovers.active == True).order_by(MarsRovers.rover_name)).scalars().all()
+
+            elif trans_type == "search":
+                # Capture optional argument:
+                query = kwargs.get("query", "")
+
+                # If no words were entered, return an empty list to the calling function:
+                words = query.split()
+                if words == []:
+                    return []
+
+                search_results = []
+                if db.engine.dialect.name == "sqlite":
+                    # Convert the user's query into an FTS5 expression which matches all words entered (each as a quoted prefix term,
+                    # so that punctuation entered by the user cannot break the FTS5 query syntax):
+                    match_expression = " ".join(['"' + word.replace('"', '""') + '"*' for word in words])
+
+                    # Retrieve the ranked results (with highlighted snippets) from each full-text search index:
+                    for scope in search_index_attributes:
+                        records = db.session.execute(text(f"SELECT source_row_id, url, {search_index_attributes[scope]["title_column"]} AS title, snippet({search_index_attributes[scope]["fts_table"]}, -1, char(2), char(3), '...', 16) AS snippet, bm25({search_index_attributes[scope]["fts_table"]}) AS rank FROM {search_index_attributes[scope]["fts_table"]} WHERE {search_index_attributes[scope]["fts_table"]} MATCH :match_expression ORDER BY rank LIMIT :limit"), {"match_expression": match_expression, "limit": SEARCH_RESULTS_LIMIT}).all()
+                        for record in records:
+                            search_results.append({
+                                "category": search_index_attributes[scope]["category"],
+                                "title": record.title,
+                                "url": record.url,
+                                # Escape the snippet's text, then highlight the matched terms (delimited above by control characters):
+                                "snippet": Markup(str(escape(record.snippet)).replace("\x02", "<mark>").replace("\x03", "</mark>")),
+                                "rank": record.rank
+                            })
+
+                else:  # Full-text search indexes are available on SQLite only.
+                    # Retrieve, from each source table, the records in which every word entered appears (case-insensitive) in
+                    # at least one of the searched columns:
+                    for scope in search_index_attributes:
+                        source_table = db.metadata.tables[search_index_attributes[scope]["source_table"]]
+                        columns = [source_table.c[column] for column in search_index_attributes[scope]["columns"]]
+                        records = db.session.execute(db.select(source_table.c.url, source_table.c[search_index_attributes[scope]["title_column"]].label("title"), *columns).where(*[or_(*[column.icontains(word, autoescape=True) for column in columns]) for word in words]).limit(SEARCH_RESULTS_LIMIT)).all()
+                        for record in records:
+                            # Use (as the snippet) the first searched column containing the first word entered, escaped and
+                            # with each word entered highlighted:
+                            snippet = next(str(record._mapping[column.name]) for column in columns if words[0].lower() in str(record._mapping[column.name]).lower())
+                            snippet = str(escape(snippet[:250]))
+                            for word in words:
+                                snippet = re.sub(re.escape(str(escape(word))), lambda match: f"<mark>{match.group(0)}</mark>", snippet, flags=re.IGNORECASE)
+                            search_results.append({
+                                "category": search_index_attributes[scope]["category"],
+                                "title": record.title,
+                                "url": record.url,
+                                "snippet": Markup(snippet),
+                                "rank": 0
+                            })
+
+                # Return all results, sorted by rank (best match first), to the calling function:
+                return sorted(search_results, key=lambda search_result: search_result["rank"])
 
             elif trans_type == "space_news":
                 # Retrieve and return all existing records, sorted by article ID, from the "space_news" database table:
-                return db.session.execute(db.select(SpaceNews).orderby(SpaceNews.article_id)).scalars().all()
+                return db.session.execute(db.select(SpaceNews).order_by(SpaceNews.article_id)).scalars().all()
+
+            elif trans_type == "upstream_payload":
+                # Capture optional argument:
+                upstream_name = kwargs.get("upstream_name", None)
+
+                # Retrieve and return the last known good payload (if any) of the upstream API passed to this function:
+                return db.session.get(UpstreamPayloads, upstream_name)
 
     except:  # An error has occurred.
         update_system_log("retrieve_from_database (" + trans_type + ")", traceback.format_exc())
@@ -2588,39 +4299,167 @@ def retrieve_from_database(trans_type, **kwargs):
 
 
 def run_app():
-    """Main function for this application"""
-    global app
+    """Main function for this application (serving it via the development server)"""
+    # Create the application.  If function failed, return failed-execution indication to the calling function:
+    if create_app() == None:
+        return False
+
+    # Serve the application:
+    app.run(debug=True, port=5003)
 
+
+def run_confirmed_planets_year_refresh(disc_year):
+    """Function (run in a background thread) for refreshing, on demand, the confirmed planets discovered in a given year, recording the outcome (a failed refresh is retried later, with backoff)"""
     try:
-        # Load environmental variables from the ".env" file:
-        load_dotenv()
+        # Refresh the year's confirmed planets, and record the outcome:
+        error_msg, success = get_confirmed_planets(disc_year=disc_year)
+        update_database("update_confirmed_planets_year_refresh", disc_year, success=success)
 
-        # Configure the SQLite database, relative to the app instance folder:
-        app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///space.db"
+    except:  # An error has occurred.
+        update_system_log("run_confirmed_planets_year_refresh", traceback.format_exc())
 
-        # Initialize an instance of Bootstrap5, using the "app" object defined above as a parameter:
-        Bootstrap5(app)
 
-        # Retrieve the secret key to be used for CSRF protection:
-        app.secret_key = os.getenv("SECRET_KEY_FOR_CSRF_PROTECTION")
+def run_contact_outbox_sender():
+    """Function (run in a background thread) for e-mailing, in batches, the messages queued in the contact outbox, over a connection to the e-mail server kept open between batches (failed sends are retried with backoff)"""
+    # Initialize the connection to the e-mail server and when it was last used (kept between batches):
+    sender = {"connection": None, "time_last_used": 0}
 
-        # Configure database tables.  If function failed, update system log and return
-        # failed-execution indication to the calling function::
-        if not config_database():
-            update_system_log("run_app", "Error: Database configuration failed.")
-            return False
+    while True:
+        # Wait until a message is queued, or for the configured interval (to pick up messages due to be retried):
+        contact_outbox_event.wait(timeout=CONTACT_OUTBOX_POLL_SECONDS)
+        contact_outbox_event.clear()
 
-        # Configure web forms.  If function failed, update system log and return
-        # failed-execution indication to the calling function::
-        if not config_web_forms():
-            update_system_log("run_app", "Error: Web forms configuration failed.")
+        # Send the next batch.  If more messages may be waiting, process the next batch without waiting:
+        if send_contact_outbox_batch(sender):
+            contact_outbox_event.set()
+
+
+def run_database_checkpoints():
+    """Function (run in a background thread) for periodically checkpointing the SQLite write-ahead log into the database file"""
+    global app
+
+    while True:
+        # Wait for the configured interval:
+        time.sleep(DATABASE_CHECKPOINT_INTERVAL_SECONDS)
+
+        try:
+            # Checkpoint the write-ahead log without waiting on readers or writers (on a connection outside of any transaction):
+            with app.app_context():
+                connection = db.engine.raw_connection()
+                try:
+                    connection.cursor().execute("PRAGMA wal_checkpoint(PASSIVE)")
+                finally:
+                    connection.close()
+
+        except:  # An error has occurred.
+            update_system_log("run_database_checkpoints", traceback.format_exc())
+
+
+def run_upstream_probes(upstream_name, fetch_function, use_last_known_good):
+    """Function (run in a background thread) for periodically probing an upstream API whose circuit is open, closing the circuit once the upstream responds successfully (and promptly)"""
+    while True:
+        # Wait for the configured interval:
+        time.sleep(CIRCUIT_BREAKER_PROBE_INTERVAL_SECONDS)
+
+        try:
+            # Acquire a rate-limit token.  If none is available, wait for the next probe:
+            if get_rate_limit_token(upstream_name) > 0:
+                continue
+
+            # Probe the upstream, timing the request.  If the payload was obtained, record it as the upstream's last known good
+            # payload (unless the upstream never falls back to it):
+            time_started = time.monotonic()
+            payload = fetch_function()
+            elapsed_seconds = time.monotonic() - time_started
+            if payload != None:
+                if use_last_known_good:
+                    update_database("update_upstream_payload", payload, upstream_name=upstream_name)
+
+                # If the upstream responded promptly, close its circuit and end probing:
+                if elapsed_seconds <= CIRCUIT_BREAKER_SLOW_CALL_SECONDS:
+                    with circuit_breakers_lock:
+                        circuit_breakers[upstream_name].update({"state": "closed", "consecutive_failures": 0})
+                    update_system_log("run_upstream_probes", f"Circuit closed for '{upstream_name}'.")
+                    return
+
+        except:  # An error has occurred.
+            update_system_log("run_upstream_probes", traceback.format_exc())
+
+
+def send_contact_outbox_batch(sender):
+    """Function for e-mailing the next batch of messages due to be sent from the contact outbox, over the connection to the e-mail server held in the sender (re-used if still open); returns True if the whole batch was sent and more messages may be waiting"""
+    try:
+        # If the connection has been idle for longer than allowed, close it:
+        if sender["connection"] != None and time.monotonic() - sender["time_last_used"] > CONTACT_OUTBOX_SMTP_IDLE_SECONDS:
+            close_smtp_connection(sender["connection"])
+            sender["connection"] = None
+
+        # Retrieve the next batch of messages due to be sent.  If there are none (or they could not be retrieved), there is nothing to do:
+        messages = retrieve_from_database("contact_outbox_to_send")
+        if messages == {} or messages == []:
             return False
 
+        # Send each message in the batch over the (re-used or newly opened) connection, recording each as sent.  Each message
+        # is first claimed, so that it is sent only once even if several processes serving this website are sending:
+        for message in messages:
+            if not update_database("update_contact_outbox_claim", message.row_id):
+                continue
+
+            try:
+                sender["connection"] = get_contact_outbox_smtp_connection(sender["connection"])
+                email_message = EmailMessage()
+                email_message["Subject"] = "Eye for Space - E-mail from 'Contact Us' page"
+                email_message["From"] = SENDER_EMAIL_GMAIL
+                email_message["To"] = SENDER_EMAIL_GMAIL
+                email_message.set_content(f"Name: {message.name}\nE-mail address: {message.email}\n\nMessage:\n{message.message}")
+                sender["connection"].send_message(email_message)
+                sender["time_last_used"] = time.monotonic()
+                update_database("update_contact_outbox_item", {}, row_id=message.row_id, status="sent")
+
+            except:  # Message could not be sent.
+                # Update system log, and defer the message for a retry (the delay doubling with each failed attempt), unless
+                # its attempts have been exhausted, in which case deem it failed.  As the connection (or server) may be at
+                # fault, close the connection and leave the rest of the batch for the next retry:
+                update_system_log("send_contact_outbox_batch", f"Error: Message {message.row_id} could not be sent (attempt {message.attempts + 1}).\n{traceback.format_exc()}")
+                status = "failed" if message.attempts + 1 >= CONTACT_OUTBOX_MAX_ATTEMPTS else "pending"
+                retry_seconds = min(CONTACT_OUTBOX_RETRY_MAX_SECONDS, CONTACT_OUTBOX_RETRY_BASE_SECONDS * 2 ** message.attempts)
+                update_database("update_contact_outbox_item", {}, row_id=message.row_id, status=status, attempts=message.attempts + 1, not_before=datetime.now() + timedelta(seconds=retry_seconds), last_error=traceback.format_exc(limit=0).strip()[:250])
+                if sender["connection"] != None:
+                    close_smtp_connection(sender["connection"])
+                    sender["connection"] = None
+                return False
+
+        # The whole batch was sent:
+        return len(messages) == CONTACT_OUTBOX_BATCH_SIZE
+
     except:  # An error has occurred.
-        update_system_log("run_app", traceback.format_exc())
+        update_system_log("send_contact_outbox_batch", traceback.format_exc())
         return False
 
 
+def serialize_database_records(records):
+    """Function to convert records retrieved from the database into JSON-serializable dictionaries"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If the records are already in dictionary form, return them as is (converting any lists of records therein, e.g., a page
+    # of filtered results):
+    if isinstance(records, dict):
+        return {key: serialize_database_records(value) if isinstance(value, list) and value != [] and hasattr(value[0], "__table__") else value for key, value in records.items()}
+
+    # Convert each record into a dictionary of its column values (dates/times in ISO 8601 format) and derived attributes (if any):
+    serialized_records = []
+    for record in records:
+        serialized_record = {}
+        for column in record.__table__.columns:
+            value = getattr(record, column.key)
+            serialized_record[column.key] = value.isoformat() if isinstance(value, date) else value
+        for attribute in getattr(record, "derived_attributes", []):
+            serialized_record[attribute] = getattr(record, attribute)
+        serialized_records.append(serialized_record)
+
+    # Return the converted records to the calling function:
+    return serialized_records
+
+
 def setup_selenium_driver(url, width, height):
     """Function for initiating and configuring a Selenium driver object"""
 
@@ -2649,19 +4488,55 @@ def setup_selenium_driver(url, width, height):
         return None
 
 
+def show_dialog_busy_info(message):
+    """Function to show, on the desktop (if available), a progress message during an administrative update, returning the dialog (which remains shown while referenced)"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If running headless (or the desktop GUI toolkit is not installed), there is no dialog to show:
+    if PBI == None:
+        return None
+
+    # Show the dialog (creating the GUI toolkit's app. object first, if needed) and return it to the calling function:
+    if wx.GetApp() == None:
+        dialogs["app_wx"] = wx.App(redirect=False)
+    return PBI.PyBusyInfo(message, title="Administrative Update")
+
+
+def show_dialog_message(message, caption, ask_yes_no=False):
+    """Function to show, on the desktop (if available), a message (or yes/no question) to the user, returning True if the user answered yes.  If running headless, the message is logged instead and the answer deemed to be no"""
+    # NOTE: Error handling is deferred to the calling function.
+    # If running headless (or the desktop GUI toolkit is not installed), log the message and return the default answer (no):
+    if wx == None:
+        update_system_log("show_dialog_message", f"{caption}: {message}")
+        return False
+
+    # Show the message (creating the GUI toolkit's app. object first, if needed) and return the user's answer to the calling function:
+    if wx.GetApp() == None:
+        dialogs["app_wx"] = wx.App(redirect=False)
+    if ask_yes_no:
+        return wx.MessageBox(message, caption, wx.YES_NO | wx.ICON_QUESTION) == wx.YES
+    wx.MessageBox(message, caption, wx.OK | wx.ICON_INFORMATION)
+    return False
+
+
 def update_database(trans_type, item_to_process, **kwargs):
     """Function to update this application's database based on the type of transaction"""
     try:
+        # Initialize variable to track the number of rows loaded (used to decide whether the database's statistics need refreshing):
+        rows_loaded = 0
+
         with app.app_context():
             if trans_type == "update_approaching_asteroids":
-                # Delete all records from the "approaching_asteroids" database table:
-                db.session.execute(db.delete(ApproachingAsteroids))
-                db.session.commit()
+                # Capture optional argument:
+                days_fetched = kwargs.get("days_fetched", [])
 
-                # Upload, to the "approaching_asteroids" database table, all contents of the "item_to_process" parameter:
-                new_records = []
+                # Delete the records in the "approaching_asteroids" database table for the close-approach dates just fetched
+                # (records for all other dates are retained as history):
+                db.session.execute(db.delete(ApproachingAsteroids).where(ApproachingAsteroids.close_approach_date.in_(days_fetched)))
+
+                # Upsert (by asteroid ID and close-approach date, as an asteroid may approach on several dates), to the
+                # "approaching_asteroids" database table, all contents of the "item_to_process" parameter:
                 for i in range(0, len(item_to_process)):
-                    new_record = ApproachingAsteroids(
+                    db.session.merge(ApproachingAsteroids(
                         id=item_to_process[i]["id"],
                         name=item_to_process[i]["name"],
                         absolute_magnitude_h=item_to_process[i]["absolute_magnitude_h"],
@@ -2674,138 +4549,432 @@ def update_database(trans_type, item_to_process, **kwargs):
                         orbiting_body=item_to_process[i]["orbiting_body"],
                         is_sentry_object=item_to_process[i]["is_sentry_object"],
                         url=item_to_process[i]["url"]
-                    )
-
-                    new_records.append(new_record)
-
-                db.session.add_all(new_records)
+                    ))
+
+                # Upsert, to the "approaching_asteroids_days" database table, the fetch date/time for each close-approach date just fetched:
+                for day in days_fetched:
+                    db.session.merge(ApproachingAsteroidsDays(
+                        close_approach_date=day,
+                        asteroid_count=len([item for item in item_to_process if item["close_approach_date"] == day]),
+                        date_time_fetched=datetime.now()
+                    ))
+
+                # Update the dataset's version (per the close-approach dates replaced, and their records), then commit all of the
+                # above as a single transaction:
+                update_dataset_version("approaching_asteroids", changes=days_fetched + list(item_to_process))
                 db.session.commit()
+                rows_loaded = len(item_to_process)
 
             elif trans_type == "update_confirmed_planets":
-                # Delete all records from the "confirmed_planets" database table:
-                db.session.execute(db.delete(ConfirmedPlanets))
+                # Capture the date/time of this refresh (used to tag the changeset recorded below):
+                date_time_refreshed = datetime.now()
+
+                # Define the columns (other than the "planet_name" key) whose values are compared to detect updated planets:
+                compared_columns = ["host_name", "host_num_stars", "host_num_planets", "discovery_year", "discovery_method", "discovery_facility", "discovery_telescope", "url"]
+
+                # Capture optional argument (scope of the refresh; if no filter is supplied, the full catalog is being refreshed):
+                scope = kwargs.get("scope", {})
+                is_full_refresh = all(value == None for value in scope.values())
+
+                # Determine whether the "confirmed_planets" database table is empty (i.e., this is its initial load, in which case
+                # no changeset is recorded, as every planet would otherwise be deemed newly confirmed).  End the transaction, so
+                # that none is held open while the rows are being received:
+                is_initial_load = db.session.execute(db.select(ConfirmedPlanets.row_id).limit(1)).first() == None
                 db.session.commit()
 
-                # Upload, to the "confirmed_planets" database table, all contents of the "item_to_process" parameter:
-                new_records = []
-                for i in range(0, len(item_to_process)):
-                    new_record = ConfirmedPlanets(
-                        host_name=item_to_process[i]["hostname"],
-                        host_num_stars=item_to_process[i]["sy_snum"],
-                        host_num_planets=item_to_process[i]["sy_pnum"],
-                        planet_name=item_to_process[i]["pl_name"],
-                        discovery_year=item_to_process[i]["disc_year"],
-                        discovery_method=item_to_process[i]["discoverymethod"],
-                        discovery_facility=item_to_process[i]["disc_facility"],
-                        discovery_telescope=item_to_process[i]["disc_telescope"],
-                        url = f"https://exoplanetarchive.ipac.caltech.edu/overview/{item_to_process[i]["pl_name"].replace(" ","%20")}"
-                    )
-
-                    new_records.append(new_record)
-
-                db.session.add_all(new_records)
+                # Apply the diff between the existing records and all contents of the "item_to_process" parameter (an iterable of
+                # rows, received and consumed in chunks), one chunk at a time.  For each chunk, only the existing records for the
+                # chunk's planets are retrieved, and the chunk's inserts, updates, and changeset are committed before the next chunk
+                # is received (so that neither the table nor the catalog is held in memory, nor a transaction held open, meanwhile):
+                changes_hash = hashlib.sha256()
+                changes_count = 0
+                planet_names_received = set()
+                item_to_process = iter(item_to_process)
+                try:
+                    while True:
+                        chunk = list(itertools.islice(item_to_process, CONFIRMED_PLANETS_CHUNK_SIZE))
+                        if chunk == []:
+                            break
+
+                        received_records = []
+                        for i in range(0, len(chunk)):
+                            # Skip any duplicate planet name (only the first occurrence is retained):
+                            if chunk[i]["pl_name"] in planet_names_received:
+                                continue
+                            planet_names_received.add(chunk[i]["pl_name"])
+
+                            received_records.append({
+                                "host_name": chunk[i]["hostname"],
+                                "host_num_stars": chunk[i]["sy_snum"],
+                                "host_num_planets": chunk[i]["sy_pnum"],
+                                "planet_name": chunk[i]["pl_name"],
+                                "discovery_year": chunk[i]["disc_year"],
+                                "discovery_method": chunk[i]["discoverymethod"],
+                                "discovery_facility": chunk[i]["disc_facility"],
+                                "discovery_telescope": chunk[i]["disc_telescope"],
+                                "url": f"https://exoplanetarchive.ipac.caltech.edu/overview/{chunk[i]["pl_name"].replace(" ","%20")}"
+                            })
+
+                        # Retrieve the existing records for the chunk's planets from the "confirmed_planets" database table, keyed by planet name:
+                        existing_records = {}
+                        for record in db.session.execute(db.select(ConfirmedPlanets.row_id, ConfirmedPlanets.planet_name, *[getattr(ConfirmedPlanets, column) for column in compared_columns]).where(ConfirmedPlanets.planet_name.in_([received_record["planet_name"] for received_record in received_records]))).all():
+                            existing_records[record.planet_name] = record
+
+                        # Identify the chunk's new planets, and its existing planets having any compared column changed:
+                        records_to_insert = []
+                        records_to_update = []
+                        changes = []
+                        for received_record in received_records:
+                            if not (received_record["planet_name"] in existing_records):  # Planet is new.
+                                records_to_insert.append(received_record)
+                                changes.append({"planet_name": received_record["planet_name"], "change_type": "insert", "changed_columns": "", "date_time_refreshed": date_time_refreshed, "is_full_refresh": is_full_refresh})
+
+                            else:  # Planet exists.  Check if any of its compared columns has changed.
+                                existing_record = existing_records[received_record["planet_name"]]
+                                changed_columns = [column for column in compared_columns if getattr(existing_record, column) != received_record[column]]
+                                if changed_columns != []:
+                                    received_record["row_id"] = existing_record.row_id
+                                    records_to_update.append(received_record)
+                                    changes.append({"planet_name": received_record["planet_name"], "change_type": "update", "changed_columns": ",".join(changed_columns)[:250], "date_time_refreshed": date_time_refreshed, "is_full_refresh": is_full_refresh})
+
+                        # Apply the chunk's inserts and updates to the "confirmed_planets" database table, record its changeset, and commit:
+                        if records_to_insert != []:
+                            db.session.execute(db.insert(ConfirmedPlanets), records_to_insert)
+                        if records_to_update != []:
+                            db.session.execute(db.update(ConfirmedPlanets), records_to_update)
+                        update_database_confirmed_planets_changes(changes, is_initial_load)
+                        db.session.commit()
+                        changes_hash.update(repr(changes).encode("utf-8"))
+                        changes_count += len(changes)
+                except:  # An error has occurred (e.g., the rows could not be received in full).
+                    # The chunks already committed remain applied.  Synchronize the full-text search index with them, and update the
+                    # dataset's version per their changes (so that caches keyed on the version do not keep serving the prior
+                    # contents as current), commit, and then defer error handling to the calling function:
+                    db.session.rollback()
+                    if changes_count > 0:
+                        update_database_search_index("confirmed_planets")
+                        update_dataset_version("confirmed_planets", changes=[changes_hash.hexdigest()])
+                        db.session.commit()
+                    raise
+
+                # Identify existing planets (within the scope of the refresh) which are no longer present in the received data, and
+                # delete them (in chunks), recording the changeset.  A refresh scoped by modification date cannot reveal deletions,
+                # so none are identified for such a refresh:
+                planet_names_to_delete = []
+                if scope.get("modified_since", None) == None:
+                    query = db.select(ConfirmedPlanets.planet_name)
+                    if scope.get("disc_year", None) != None:
+                        query = query.where(ConfirmedPlanets.discovery_year == scope["disc_year"])
+                    if scope.get("host_name", None) != None:
+                        query = query.where(ConfirmedPlanets.host_name == scope["host_name"])
+                    planet_names_to_delete = [planet_name for planet_name in db.session.execute(query).scalars() if not (planet_name in planet_names_received)]
+
+                changes = [{"planet_name": planet_name, "change_type": "delete", "changed_columns": "", "date_time_refreshed": date_time_refreshed, "is_full_refresh": is_full_refresh} for planet_name in planet_names_to_delete]
+                for i in range(0, len(planet_names_to_delete), CONFIRMED_PLANETS_CHUNK_SIZE):
+                    db.session.execute(db.delete(ConfirmedPlanets).where(ConfirmedPlanets.planet_name.in_(planet_names_to_delete[i:i + CONFIRMED_PLANETS_CHUNK_SIZE])))
+                update_database_confirmed_planets_changes(changes, is_initial_load)
+                changes_hash.update(repr(changes).encode("utf-8"))
+                changes_count += len(changes)
+
+                # Synchronize the full-text search index with the "confirmed_planets" database table, and update the dataset's
+                # version (per a digest of the changes applied above), then commit all of the above as a single transaction:
+                if changes_count > 0:
+                    update_database_search_index("confirmed_planets")
+                update_dataset_version("confirmed_planets", changes=[changes_hash.hexdigest()] if changes_count > 0 else [])
+                db.session.commit()
+                rows_loaded = changes_count
+
+            elif trans_type == "update_confirmed_planets_year_refresh":
+                # Capture optional argument (whether the refresh succeeded):
+                success = kwargs.get("success", False)
+
+                # Record the outcome of the on-demand refresh of the discovery year passed to this function (in this case, via the
+                # "item_to_process" parameter).  A failed refresh is deferred for a retry, the delay doubling with each consecutive
+                # failure:
+                record = db.session.get(ConfirmedPlanetsYearRefreshes, item_to_process)
+                if success:
+                    record.date_time_refreshed = datetime.now()
+                    record.failed_attempts = 0
+                    record.not_before = None
+                else:
+                    record.not_before = datetime.now() + timedelta(seconds=min(CONFIRMED_PLANETS_ON_DEMAND_RETRY_MAX_SECONDS, CONFIRMED_PLANETS_ON_DEMAND_RETRY_BASE_SECONDS * 2 ** record.failed_attempts))
+                    record.failed_attempts += 1
                 db.session.commit()
 
-            elif trans_type == "update_constellations":
-                # Delete all existing records from the "constellations" database table:
-                db.session.query(Constellations).delete()
+            elif trans_type == "update_confirmed_planets_year_refresh_claim":
+                # Claim the on-demand refresh of the discovery year passed to this function (in this case, via the "item_to_process"
+                # parameter), by deferring further refreshes for the duration of the claim, provided the refresh is still due (i.e.,
+                # not already claimed by another request or process serving this website).  If it is not, return failed-execution
+                # indication to the calling function:
+                current_date_time = datetime.now()
+                if db.session.get(ConfirmedPlanetsYearRefreshes, item_to_process) == None:
+                    db.session.add(ConfirmedPlanetsYearRefreshes(discovery_year=item_to_process, date_time_refreshed=None, failed_attempts=0, not_before=None))
+                    db.session.flush()
+                result = db.session.execute(db.update(ConfirmedPlanetsYearRefreshes).where(ConfirmedPlanetsYearRefreshes.discovery_year == item_to_process, or_(ConfirmedPlanetsYearRefreshes.date_time_refreshed == None, ConfirmedPlanetsYearRefreshes.date_time_refreshed < current_date_time - timedelta(hours=CONFIRMED_PLANETS_ON_DEMAND_REFRESH_HOURS)), or_(ConfirmedPlanetsYearRefreshes.not_before == None, ConfirmedPlanetsYearRefreshes.not_before <= current_date_time)).values(not_before=current_date_time + timedelta(seconds=CONFIRMED_PLANETS_ON_DEMAND_CLAIM_SECONDS)))
                 db.session.commit()
+                if result.rowcount == 0:
+                    return False
 
-                # Upload, to the "constellations" database table, all contents of the "item_to_process"
-                # parameter (in this case, the "constellations_data" dictionary from the calling function):
+            elif trans_type == "update_constellations":
+                # Load, into a staging table, all contents of the "item_to_process" parameter (in this case, the "constellations_data"
+                # dictionary from the calling function), then swap the staging table in for the "constellations" database table:
                 new_records = []
                 for key in item_to_process:
-                    new_record = Constellations(
-                        name=key,
-                        abbreviation=item_to_process[key]["abbreviation"],
-                        nickname=item_to_process[key]["nickname"],
-                        url=item_to_process[key]["url"],
-                        area=item_to_process[key]["area"],
-                        myth_assoc=item_to_process[key]["myth_assoc"],
-                        first_appear=item_to_process[key]["first_appear"],
-                        brightest_star_name=item_to_process[key]["brightest_star_name"],
-                        brightest_star_url=item_to_process[key]["brightest_star_url"]
-                    )
-                    new_records.append(new_record)
-
-                db.session.add_all(new_records)
+                    new_records.append({
+                        "name": key,
+                        "abbreviation": item_to_process[key]["abbreviation"],
+                        "nickname": item_to_process[key]["nickname"],
+                        "url": item_to_process[key]["url"],
+                        "area": item_to_process[key]["area"],
+                        "myth_assoc": item_to_process[key]["myth_assoc"],
+                        "first_appear": item_to_process[key]["first_appear"],
+                        "brightest_star_name": item_to_process[key]["brightest_star_name"],
+                        "brightest_star_url": item_to_process[key]["brightest_star_url"]
+                    })
+
+                update_database_swap_table("constellations", new_records)
+
+                # Synchronize the full-text search index with the "constellations" database table, update the dataset's version,
+                # and commit all of the above (including the swap) as a single transaction:
+                update_database_search_index("constellations")
+                update_dataset_version("constellations", changes=new_records, replaces_content=True)
                 db.session.commit()
 
-            elif trans_type == "update_mars_photos_available":
-                # Delete all existing records from the "mars_photos_available" database table:
-                db.session.query(MarsPhotosAvailable).delete()
+            elif trans_type == "update_contact_outbox":
+                # Add the message passed to this function (in this case, via the "item_to_process" parameter) to the
+                # "contact_outbox" database table, to be sent by the background sender:
+                db.session.add(ContactOutbox(
+                    name=item_to_process["name"],
+                    email=item_to_process["email"],
+                    message=item_to_process["message"],
+                    status="pending",
+                    attempts=0,
+                    date_time_queued=datetime.now()
+                ))
                 db.session.commit()
 
-                # Upload, to the "mars_photos_available" database table, all contents of the "item_to_process"
-                # parameter (in this case, the "photos_available" dictionary from the calling function):
+            elif trans_type == "update_contact_outbox_claim":
+                # Claim the message passed to this function (in this case, via the "item_to_process" parameter) for sending, by
+                # deferring it for the duration of the claim, provided it is still due to be sent (i.e., not already claimed by
+                # another process serving this website).  If it is not, return failed-execution indication to the calling function:
+                current_date_time = datetime.now()
+                result = db.session.execute(db.update(ContactOutbox).where(ContactOutbox.row_id == item_to_process, ContactOutbox.status == "pending", or_(ContactOutbox.not_before == None, ContactOutbox.not_before <= current_date_time)).values(not_before=current_date_time + timedelta(seconds=CONTACT_OUTBOX_CLAIM_SECONDS)))
+                db.session.commit()
+                if result.rowcount == 0:
+                    return False
+
+            elif trans_type == "update_contact_outbox_item":
+                # Capture optional arguments (those not supplied are left unchanged):
+                row_id = kwargs.get("row_id", None)
+
+                # Record the status (and, if supplied, attempts, deferral, and error) of the message passed to this function, in
+                # the "contact_outbox" database table:
+                record = db.session.get(ContactOutbox, row_id)
+                record.status = kwargs.get("status", record.status)
+                record.attempts = kwargs.get("attempts", record.attempts)
+                record.not_before = kwargs.get("not_before", None)
+                record.last_error = kwargs.get("last_error", record.last_error)
+                if record.status == "sent":
+                    record.date_time_sent = datetime.now()
+                db.session.commit()
+
+            elif trans_type == "update_mars_photo_counts":
+                # Refresh the photo counts aggregate for the rover / earth year buckets passed to this function (in this case, via the
+                # "item_to_process" parameter), and commit:
+                update_database_mars_photo_counts(item_to_process)
+                db.session.commit()
+
+            elif trans_type == "update_mars_photos_sync_queue":
+                # Capture optional arguments (if "retry_failed" is True, combos which failed are re-attempted afresh):
+                photos_available = kwargs.get("photos_available", {})
+                retry_failed = kwargs.get("retry_failed", False)
+
+                # Merge the rover/earth date combos identified by "get_mars_photos_classify_combos" (in this case, via the
+                # "item_to_process" parameter) into the "mars_photos_sync_queue" database table.  Combos already queued retain
+                # their attempts and deferral.  Combos which failed (after exhausting their attempts) remain so, unless a re-attempt
+                # is requested or their action or expected photo count (per the rover's manifest) has changed, in which case they
+                # are re-attempted afresh.  Combos completed, or no longer needing an update, are removed from the queue:
+                current_date_time = datetime.now()
+                combos_to_queue = {}
+                for combo in item_to_process["removed"]:
+                    combos_to_queue[combo] = {"action": "delete", "total_photos_expected": 0}
+                for combo in item_to_process["new"] + item_to_process["grown"] + item_to_process["shrunk"]:
+                    combos_to_queue[combo] = {"action": "refresh", "total_photos_expected": photos_available[combo]["total_photos"]}
+
+                for record in db.session.execute(db.select(MarsPhotosSyncQueue)).scalars().all():
+                    if record.status == "done" or not (record.rover_earth_date_combo in combos_to_queue):
+                        db.session.delete(record)
+                    else:
+                        combo_to_queue = combos_to_queue[record.rover_earth_date_combo]
+                        if record.status == "failed" and (retry_failed or record.action != combo_to_queue["action"] or record.total_photos_expected != combo_to_queue["total_photos_expected"]):
+                            record.status = "pending"
+                            record.attempts = 0
+                        record.action = combo_to_queue["action"]
+                        record.total_photos_expected = combo_to_queue["total_photos_expected"]
+                        record.date_time_updated = current_date_time
+                        del combos_to_queue[record.rover_earth_date_combo]
+
+                for combo in combos_to_queue:
+                    rover_name, earth_date = combo.split("_")
+                    db.session.add(MarsPhotosSyncQueue(rover_earth_date_combo=combo, rover_name=rover_name, earth_date=earth_date, action=combos_to_queue[combo]["action"], total_photos_expected=combos_to_queue[combo]["total_photos_expected"], status="pending", attempts=0, date_time_queued=current_date_time, date_time_updated=current_date_time))
+                db.session.commit()
+
+            elif trans_type == "update_mars_photos_sync_queue_item":
+                # Capture optional arguments (those not supplied are left unchanged):
+                rover_earth_date_combo = kwargs.get("rover_earth_date_combo", None)
+
+                # Checkpoint the status (and, if supplied, attempts, deferral, and error) of the rover/earth date combo passed to this
+                # function, in the "mars_photos_sync_queue" database table:
+                record = db.session.get(MarsPhotosSyncQueue, rover_earth_date_combo)
+                record.status = kwargs.get("status", record.status)
+                record.attempts = kwargs.get("attempts", record.attempts)
+                record.not_before = kwargs.get("not_before", record.not_before) if record.status == "deferred" else None
+                record.last_error = kwargs.get("last_error", record.last_error)
+                record.date_time_updated = datetime.now()
+                db.session.commit()
+
+            elif trans_type == "update_mars_photos_available":
+                # Capture optional arguments (the rover whose manifest was processed, the combos no longer in its manifest, and
+                # the manifest details to be cached):
+                rover_name = kwargs.get("rover_name", None)
+                removed_combos = kwargs.get("removed_combos", [])
+                manifest = kwargs.get("manifest", None)
+
+                # Replace, in the "mars_photos_available" database table, the records for the combos which are new or have changed
+                # (per the "item_to_process" parameter, in this case a dictionary from the calling function), and delete the records
+                # for the combos which are no longer in the rover's manifest:
+                combos_to_delete = list(item_to_process) + removed_combos
+                if combos_to_delete != []:
+                    db.session.execute(db.delete(MarsPhotosAvailable).where(MarsPhotosAvailable.rover_earth_date_combo.in_(combos_to_delete)))
+
                 new_records = []
                 for key in item_to_process:
-                    new_record = MarsPhotosAvailable(
-                        rover_earth_date_combo=key,
-                        rover_name=item_to_process[key]["rover_name"],
-                        sol=int(item_to_process[key]["sol"]),
-                        earth_date = item_to_process[key]["earth_date"],
-                        cameras=item_to_process[key]["cameras"],
-                        total_photos=item_to_process[key]["total_photos"]
-                    )
-                    new_records.append(new_record)
-
-                db.session.add_all(new_records)
+                    new_records.append({
+                        "rover_earth_date_combo": key,
+                        "rover_name": item_to_process[key]["rover_name"],
+                        "sol": item_to_process[key]["sol"],
+                        "earth_date": item_to_process[key]["earth_date"],
+                        "cameras": item_to_process[key]["cameras"],
+                        "total_photos": item_to_process[key]["total_photos"]
+                    })
+                if new_records != []:
+                    db.session.execute(db.insert(MarsPhotosAvailable), new_records)
+
+                # Cache the rover's manifest details (creating its record in the "mars_rover_manifests" database table if needed):
+                if rover_name != None and manifest != None:
+                    db.session.merge(MarsRoverManifests(rover_name=rover_name, date_time_checked=datetime.now(), **manifest))
+
+                # If the dataset has changed, update its version.  Commit all of the above as a single transaction:
+                if combos_to_delete != []:
+                    update_dataset_version("mars_photos_available", changes=removed_combos + new_records)
                 db.session.commit()
+                rows_loaded = len(new_records)
 
             elif trans_type == "update_mars_photo_details":
-                # Upload, to the "mars_photo_details" database table, all contents of the "item_to_process"
-                # parameter (in this case, the "photo_details_rover_earth_date_combo" list from the calling function):
+                # Capture optional arguments (if a rover name and earth date are supplied, the existing records for that
+                # combination are replaced; if "update_version" is False, the calling function updates the dataset's version):
+                rover_name = kwargs.get("rover_name", None)
+                earth_date = kwargs.get("earth_date", None)
+                update_version = kwargs.get("update_version", True)
+
+                # Delete, from the "mars_photo_details" database table, any existing records being replaced:
+                if rover_name != None and earth_date != None:
+                    db.session.execute(db.delete(MarsPhotoDetails).where(MarsPhotoDetails.rover_id.in_(db.select(MarsRovers.row_id).where(MarsRovers.rover_name == rover_name)), MarsPhotoDetails.earth_date == date.fromisoformat(earth_date)))
+
+                # Look up (creating any missing) the IDs of the rovers and cameras referenced by the "item_to_process" parameter
+                # (in this case, the "photo_details_rover_earth_date_combo" list from the calling function):
+                rover_ids, camera_ids = update_database_mars_rover_and_camera_ids(item_to_process)
+
+                # Upload, to the "mars_photo_details" database table, all contents of the "item_to_process" parameter:
                 new_records = []
                 for i in range(0, len(item_to_process)):
-                    new_record = MarsPhotoDetails(
-                        rover_earth_date_combo=item_to_process[i]["rover_earth_date_combo"],
-                        rover_name=item_to_process[i]["rover_name"],
-                        sol=int(item_to_process[i]["sol"]),
-                        pic_id=item_to_process[i]["pic_id"],
-                        earth_date = item_to_process[i]["earth_date"],
-                        camera_name=item_to_process[i]["camera_name"],
-                        camera_full_name=item_to_process[i]["camera_full_name"],
-                        url=item_to_process[i]["url"]
-                    )
-
-                    new_records.append(new_record)
+                    new_records.append({
+                        "rover_id": rover_ids[item_to_process[i]["rover_name"]],
+                        "sol": int(item_to_process[i]["sol"]),
+                        "pic_id": item_to_process[i]["pic_id"],
+                        "earth_date": date.fromisoformat(item_to_process[i]["earth_date"]),
+                        "camera_id": camera_ids[(item_to_process[i]["rover_name"], item_to_process[i]["camera_name"])],
+                        "url": item_to_process[i]["url"]
+                    })
 
-                db.session.add_all(new_records)
+                if new_records != []:
+                    db.session.execute(db.insert(MarsPhotoDetails), new_records)
+                if update_version:
+                    update_dataset_version("mars_photo_details", changes=[{"rover_name": rover_name, "earth_date": earth_date}] + new_records)
                 db.session.commit()
 
             elif trans_type == "update_mars_photo_details_delete_existing":
-                # Capture optional arguments:
+                # Capture optional arguments (if "update_version" is False, the calling function updates the dataset's version):
                 rover_name = kwargs.get("rover_name", None)
                 earth_date = kwargs.get("earth_date", None)
+                update_version = kwargs.get("update_version", True)
 
                 # Delete, from the "mars_photo_details" database table, all records where the rover name and
                 # earth date collectively match what was passed to this function:
-                db.session.execute(db.delete(MarsPhotoDetails).where(MarsPhotoDetails.rover_earth_date_combo == rover_name + "_" + earth_date))
+                db.session.execute(db.delete(MarsPhotoDetails).where(MarsPhotoDetails.rover_id.in_(db.select(MarsRovers.row_id).where(MarsRovers.rover_name == rover_name)), MarsPhotoDetails.earth_date == date.fromisoformat(earth_date)))
+                if update_version:
+                    update_dataset_version("mars_photo_details", changes=[{"rover_name": rover_name, "earth_date": earth_date, "action": "delete"}])
                 db.session.commit()
 
             elif trans_type == "update_space_news":
-                # Delete all records from the "space_news" database table:
-                db.session.execute(db.delete(SpaceNews))
-                db.session.commit()
-
-                # Import the newly acquired articles (from the "item_to_process" list) into the "space_news" database table:
+                # Load, into a staging table, the newly acquired articles (from the "item_to_process" list), then swap the staging
+                # table in for the "space_news" database table:
                 new_records = []
                 for i in range(0, len(item_to_process)):
-                    new_record = SpaceNews(
-                        article_id=item_to_process[i]["id"],
-                        title=item_to_process[i]["title"],
-                        url=item_to_process[i]["url"],
-                        summary=item_to_process[i]["summary"],
-                        news_site=item_to_process[i]["news_site"],
-                        date_time_published=datetime.strptime(item_to_process[i]["published_at"], "%Y-%m-%dT%H:%M:%SZ"),
-                        date_time_updated=datetime.strptime(item_to_process[i]["updated_at"],"%Y-%m-%dT%H:%M:%S.%fZ")
-                    )
-                    new_records.append(new_record)
-
-                db.session.add_all(new_records)
+                    new_records.append({
+                        "article_id": item_to_process[i]["id"],
+                        "title": item_to_process[i]["title"],
+                        "url": item_to_process[i]["url"],
+                        "summary": item_to_process[i]["summary"],
+                        "news_site": item_to_process[i]["news_site"],
+                        "date_time_published": datetime.strptime(item_to_process[i]["published_at"], "%Y-%m-%dT%H:%M:%SZ"),
+                        "date_time_updated": datetime.strptime(item_to_process[i]["updated_at"],"%Y-%m-%dT%H:%M:%S.%fZ")
+                    })
+
+                update_database_swap_table("space_news", new_records)
+
+                # Synchronize the full-text search index with the "space_news" database table, update the dataset's version,
+                # and commit all of the above (including the swap) as a single transaction:
+                update_database_search_index("space_news")
+                update_dataset_version("space_news", changes=new_records, replaces_content=True)
+                db.session.commit()
+
+            elif trans_type == "update_upstream_payload":
+                # Capture optional argument:
+                upstream_name = kwargs.get("upstream_name", None)
+
+                # Record, in the "upstream_payloads" database table, the payload (in this case, the "item_to_process" parameter)
+                # most recently obtained from the upstream API passed to this function, as its last known good payload:
+                db.session.merge(UpstreamPayloads(upstream_name=upstream_name, payload=item_to_process, date_time_fetched=datetime.now()))
+                db.session.commit()
+
+            elif trans_type == "update_database_statistics":
+                # Refresh the database's statistics (used by the query planner):
+                update_database_statistics()
+
+            elif trans_type == "update_dataset_version":
+                # Capture optional argument (the changes applied to the dataset, if known):
+                changes = kwargs.get("changes", None)
+
+                # Update the version of the dataset passed to this function (in this case, via the "item_to_process" parameter):
+                update_dataset_version(item_to_process, changes=changes)
                 db.session.commit()
 
+            elif trans_type == "update_dataset_spreadsheet_version":
+                # Capture optional argument:
+                version = kwargs.get("version", None)
+
+                # Record, in the "dataset_versions" database table, the dataset version from which the dataset's spreadsheet was exported:
+                db.session.get(DatasetVersions, item_to_process).spreadsheet_version = version
+                db.session.commit()
+
+            # If a large number of rows was loaded above, refresh the database's statistics (used by the query planner):
+            if rows_loaded >= DATABASE_ANALYZE_MIN_ROWS:
+                update_database_statistics()
+
+        # Clear the in-process cache of dataset versions (so that changes committed above are reflected immediately):
+        dataset_versions.clear()
+
         # Return successful-execution indication to the calling function:
         return True
 
@@ -2816,9 +4985,157 @@ def update_database(trans_type, item_to_process, **kwargs):
         return False
 
 
+def update_database_confirmed_planets_changes(changes, is_initial_load):
+    """Function to record a changeset of the "confirmed_planets" database table (unless the table is being loaded initially), within the calling function's transaction"""
+    # NOTE: Error handling (and committing the transaction) is deferred to the calling function.
+    # Record the changeset in the "confirmed_planets_changes" database table (not applicable to the initial load of an empty
+    # table, in which case every planet would otherwise be deemed newly confirmed):
+    if changes != [] and not is_initial_load:
+        db.session.execute(db.insert(ConfirmedPlanetsChanges), changes)
+
+
+def update_database_mars_photo_counts(buckets):
+    """Function to refresh the photo counts aggregate (by rover, earth year, and camera) for the rover / earth year buckets passed (or for all buckets, if None is passed), within the calling function's transaction"""
+    # NOTE: Error handling (and committing the transaction) is deferred to the calling function.
+    # Identify the photo details to aggregate, and delete the existing aggregate records for the buckets involved:
+    photo_counts_query = db.select(MarsRovers.rover_name, extract("year", MarsPhotoDetails.earth_date), MarsRoverCameras.camera_name, func.count(MarsPhotoDetails.row_id), func.min(MarsPhotoDetails.sol), func.max(MarsPhotoDetails.sol)).join(MarsPhotoDetails.rover).join(MarsPhotoDetails.camera)
+    if buckets == None:
+        db.session.execute(db.delete(MarsPhotoCounts))
+    else:
+        if buckets == []:
+            return
+        db.session.execute(db.delete(MarsPhotoCounts).where(or_(*[(MarsPhotoCounts.rover_name == rover_name) & (MarsPhotoCounts.earth_year == earth_year) for rover_name, earth_year in buckets])))
+        photo_counts_query = photo_counts_query.where(or_(*[(MarsRovers.rover_name == rover_name) & MarsPhotoDetails.earth_date.between(date(earth_year, 1, 1), date(earth_year, 12, 31)) for rover_name, earth_year in buckets]))
+
+    # Re-populate the aggregate for the buckets involved, grouping the photo details by rover, earth year, and camera:
+    photo_counts_query = photo_counts_query.group_by(MarsRovers.rover_name, extract("year", MarsPhotoDetails.earth_date), MarsRoverCameras.camera_name)
+    db.session.execute(db.insert(MarsPhotoCounts).from_select(["rover_name", "earth_year", "camera_name", "total_photos", "min_sol", "max_sol"], photo_counts_query))
+
+
+def update_database_mars_rover_and_camera_ids(records):
+    """Function to look up (creating any missing) the IDs of the Mars rovers and cameras referenced by photo detail records, within the calling function's transaction"""
+    # NOTE: Error handling (and committing the transaction) is deferred to the calling function.
+    # Retrieve the IDs of the existing rovers (keyed by rover name) and cameras (keyed by rover name and camera name):
+    rover_ids = {record.rover_name: record.row_id for record in db.session.execute(db.select(MarsRovers.rover_name, MarsRovers.row_id)).all()}
+    camera_ids = {(record.rover_name, record.camera_name): record.row_id for record in db.session.execute(db.select(MarsRoverCameras.rover_name, MarsRoverCameras.camera_name, MarsRoverCameras.row_id)).all()}
+
+    # Create any rover (tagged as inactive, pending review) or camera not yet in the database:
+    for record in records:
+        if not (record["rover_name"] in rover_ids):
+            new_rover = MarsRovers(rover_name=record["rover_name"], active=False)
+            db.session.add(new_rover)
+            db.session.flush()
+            rover_ids[record["rover_name"]] = new_rover.row_id
+
+        if not ((record["rover_name"], record["camera_name"]) in camera_ids):
+            new_camera = MarsRoverCameras(rover_name=record["rover_name"], camera_name=record["camera_name"], camera_full_name=record["camera_full_name"])
+            db.session.add(new_camera)
+            db.session.flush()
+            camera_ids[(record["rover_name"], record["camera_name"])] = new_camera.row_id
+
+    # Return the IDs to the calling function:
+    return rover_ids, camera_ids
+
+
+def update_database_search_index(scope):
+    """Function to rebuild a full-text search index from its source table, within the calling function's transaction"""
+    # NOTE: Error handling (and committing the transaction) is deferred to the calling function.
+    # Full-text search indexes are available on SQLite only; on other databases, there is no index to rebuild:
+    if db.engine.dialect.name != "sqlite":
+        return
+
+    # Delete all entries from the full-text search index:
+    db.session.execute(text(f"DELETE FROM {search_index_attributes[scope]["fts_table"]}"))
+
+    # Re-populate the full-text search index with the current contents of its source table:
+    db.session.execute(text(f"INSERT INTO {search_index_attributes[scope]["fts_table"]} (source_row_id, url, {", ".join(search_index_attributes[scope]["columns"])}) SELECT row_id, url, {", ".join(search_index_attributes[scope]["columns"])} FROM {search_index_attributes[scope]["source_table"]}"))
+
+
+def update_database_statistics():
+    """Function to refresh the database's statistics (used by the query planner), e.g., after a large load"""
+    # NOTE: Error handling is deferred to the calling function.
+    db.session.execute(text("ANALYZE"))
+    db.session.commit()
+
+
+def update_database_swap_table(scope, new_records):
+    """Function to fully refresh a database table by loading the new records into a staging table (committed separately), then swapping the staging table in (via rename) within the calling function's transaction"""
+    # NOTE: Error handling (and committing the swap) is deferred to the calling function.
+    # Outside SQLite, replace the table's contents within the calling function's transaction instead.  Readers continue to see
+    # the existing records until the calling function commits (MVCC), and a renamed staging table would keep its own sequence,
+    # primary key, and unique constraint names (preventing the next refresh from creating the staging table anew):
+    if db.engine.dialect.name != "sqlite":
+        db.session.execute(db.delete(db.metadata.tables[scope]))
+        if new_records != []:
+            db.session.execute(db.insert(db.metadata.tables[scope]), new_records)
+        return
+
+    # Create an empty staging table with the same structure as the table being refreshed (replacing any staging table left
+    # behind by a prior, failed refresh):
+    staging_table = db.metadata.tables[scope].to_metadata(MetaData(), name=scope + "_staging")
+    staging_table.drop(db.session.connection(), checkfirst=True)
+    staging_table.create(db.session.connection())
+
+    # Load the new records into the staging table, and commit.  Readers of the table being refreshed are unaffected:
+    if new_records != []:
+        db.session.execute(db.insert(staging_table), new_records)
+    db.session.commit()
+
+    # Swap the staging table in for the table being refreshed.  Once the calling function commits, readers see the new
+    # records; until then, they continue to see the existing records:
+    db.session.execute(text(f"DROP TABLE {scope}"))
+    db.session.execute(text(f"ALTER TABLE {scope}_staging RENAME TO {scope}"))
+
+
+def update_dataset_version(scope, changes=None, replaces_content=False):
+    """Function to update a dataset's version details (row count, content hash, and date/time refreshed/changed), within the calling function's transaction"""
+    # NOTE: Error handling (and committing the transaction) is deferred to the calling function.
+    # Count the rows of the dataset's table, and retrieve the dataset's existing version details (if any):
+    row_count = db.session.execute(db.select(func.count()).select_from(db.metadata.tables[scope])).scalar()
+    dataset_version = db.session.get(DatasetVersions, scope)
+
+    # Derive the content hash without re-reading the table's content (which, for a large table, would hold up the calling
+    # function's transaction):
+    # - If the calling function replaced the table's whole content, hash that content (in content order, so that reloading
+    #   identical content yields the same hash).
+    # - If the calling function supplied the changes it applied, chain the existing hash with only those changes (no changes
+    #   leave the hash, and hence the version, as is).
+    # - Otherwise (changes unknown, e.g., made outside of this application), hash the table's content in full.  This is
+    #   reserved for small tables; a dataset without a version yet is given an initial hash based on its row count.
+    if replaces_content:
+        content_hash = hashlib.sha256()
+        for record in sorted(repr(sorted(change.items())) for change in changes):
+            content_hash.update(record.encode("utf-8"))
+        content_hash = content_hash.hexdigest()
+    elif changes != None and dataset_version != None:
+        content_hash = dataset_version.content_hash
+        if changes != []:
+            content_hash = hashlib.sha256((content_hash + repr(changes)).encode("utf-8")).hexdigest()
+    elif dataset_version == None:
+        content_hash = hashlib.sha256(f"{scope}:{row_count}".encode("utf-8")).hexdigest()
+    else:
+        content_columns = [column for column in db.metadata.tables[scope].columns if column.name != "row_id"]
+        content_hash = hashlib.sha256()
+        for record in db.session.execute(db.select(*content_columns).order_by(*content_columns)):
+            content_hash.update(repr(tuple(record)).encode("utf-8"))
+        content_hash = content_hash.hexdigest()
+
+    # Update the dataset's record in the "dataset_versions" database table (creating it if needed).  The version is
+    # incremented only if the dataset's content has changed:
+    current_date_time = datetime.now()
+    if dataset_version == None:
+        db.session.add(DatasetVersions(dataset_name=scope, version=1, row_count=row_count, content_hash=content_hash, date_time_refreshed=current_date_time, date_time_changed=current_date_time))
+    else:
+        if dataset_version.content_hash != content_hash:
+            dataset_version.version += 1
+            dataset_version.content_hash = content_hash
+            dataset_version.date_time_changed = current_date_time
+        dataset_version.row_count = row_count
+        dataset_version.date_time_refreshed = current_date_time
+
+
 def update_system_log(activity, log):
     """Function to update the system log, either to log errors encountered or log successful execution of milestone admin. updates"""
-    global dlg
 
     try:
         # Capture current date/time:
@@ -2834,15 +5151,14 @@ def update_system_log(activity, log):
         f.close()
 
     except:
-        dlg = wx.App()
-        dlg = wx.MessageBox(f"Error: System log could not be updated.\n{traceback.format_exc()}", 'Error', wx.OK | wx.ICON_INFORMATION)
-
-
-# Run main function for this application:
-run_app()
+        if wx != None:
+            app_wx = wx.App()
+            wx.MessageBox(f"Error: System log could not be updated.\n{traceback.format_exc()}", 'Error', wx.OK | wx.ICON_INFORMATION)
+        else:
+            print(f"Error: System log could not be updated.\n{traceback.format_exc()}", file=sys.stderr)
 
-# Destroy the object that was created to show user dialog and message boxes:
-dlg.Destroy()
 
+# Run main function for this application (via the development server) if this module is run directly.  In production, the
+# application is created, and served, via "wsgi.py":
 if __name__ == "__main__":
-    app.run(debug=True, port=5003)
\ No newline at end of file
+    run_app()
\ No newline at end of file
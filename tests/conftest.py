@@ -0,0 +1,43 @@
+# Shared set-up for the tests of this website: the app. is created once per test session, headless, against a SQLite
+# database (and working folder, for logs and spreadsheets) in a temporary folder, with background senders left stopped
+# so that each test drives them directly.
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Create a temporary working folder for the test session, and point the app. configuration at it (environmental
+# variables must be set before the app. module, which reads them on import, is imported):
+TEST_FOLDER = tempfile.mkdtemp(prefix="eye_for_space_tests_")
+os.environ.update({
+    "HEADLESS": "true",
+    "DATABASE_URI": f"sqlite:///{os.path.join(TEST_FOLDER, 'test.db')}",
+    "SECRET_KEY_FOR_CSRF_PROTECTION": "test-secret-key",
+    "SENDER_EMAIL_GMAIL": "admin@example.com",
+    "SENDER_PASSWORD_GMAIL": "",
+    "SENDER_HOST": "127.0.0.1",
+    "SENDER_PORT": "0",
+    "SENDER_USE_STARTTLS": "false",
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(TEST_FOLDER)
+
+import main
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create (configure) the app. once for the test session, without starting the background contact-outbox sender"""
+    main.run_contact_outbox_sender = lambda: None
+    configured_app = main.create_app()
+    assert configured_app is not None
+    configured_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    return configured_app
+
+
+@pytest.fixture
+def app_context(app):
+    """Provide an app. context for a test"""
+    with app.app_context():
+        yield app
@@ -0,0 +1,24 @@
+# Tests of the app. factory: the app. is deemed created only once every configuration step has succeeded, so that a failed
+# step is not mistaken for a configured app. by a later call.
+import main
+
+
+def test_configured_app_is_returned_as_is(app):
+    assert main.is_app_configured
+    assert main.create_app() is app
+
+
+def test_failed_configuration_is_not_deemed_configured(app, monkeypatch):
+    monkeypatch.setattr(main, "is_app_configured", False)
+    monkeypatch.setattr(main, "Bootstrap5", lambda app: None)
+    monkeypatch.setattr(main, "config_database", lambda: True)
+
+    # The database is configured, but the web forms are not:
+    monkeypatch.setattr(main, "config_web_forms", lambda: False)
+    assert main.create_app() is None
+    assert not main.is_app_configured
+
+    # A later call, whose configuration succeeds, creates the app.:
+    monkeypatch.setattr(main, "config_web_forms", lambda: True)
+    assert main.create_app() is app
+    assert main.is_app_configured
@@ -0,0 +1,74 @@
+# Tests of the "approaching asteroids" dataset: an asteroid approaching on several dates keeps one record per close
+# approach, and a table still keyed by asteroid ID alone is migrated with its records intact.
+import pytest
+from sqlalchemy import inspect, text
+
+import main
+
+
+def get_asteroid(id, close_approach_date, miss_distance_km=1000000.0):
+    """Return an asteroid close approach, as parsed from the API"""
+    return {
+        "id": id,
+        "name": f"({id})",
+        "absolute_magnitude_h": 20.5,
+        "estimated_diameter_km_min": 0.2,
+        "estimated_diameter_km_max": 0.5,
+        "is_potentially_hazardous": False,
+        "close_approach_date": close_approach_date,
+        "relative_velocity_km_per_s": 12.3,
+        "miss_distance_km": miss_distance_km,
+        "orbiting_body": "Earth",
+        "is_sentry_object": False,
+        "url": f"https://example.com/{id}"
+    }
+
+
+def get_days():
+    """Return the asteroid count recorded for each close-approach date fetched"""
+    main.db.session.expire_all()
+    return {day.close_approach_date: day.asteroid_count for day in main.db.session.execute(main.db.select(main.ApproachingAsteroidsDays)).scalars()}
+
+
+@pytest.fixture(autouse=True)
+def empty_tables(app_context):
+    """Start each test with empty "approaching asteroids" tables"""
+    main.db.session.execute(main.db.delete(main.ApproachingAsteroids))
+    main.db.session.execute(main.db.delete(main.ApproachingAsteroidsDays))
+    main.db.session.commit()
+
+
+def test_asteroid_keeps_each_close_approach():
+    assert main.update_database("update_approaching_asteroids", [get_asteroid(1, "2026-01-01"), get_asteroid(2, "2026-01-01")], days_fetched=["2026-01-01"])
+    assert main.update_database("update_approaching_asteroids", [get_asteroid(1, "2026-06-01")], days_fetched=["2026-06-01"])
+
+    assert [(asteroid.id, asteroid.close_approach_date) for asteroid in main.retrieve_from_database("approaching_asteroids")] == [(1, "2026-01-01"), (2, "2026-01-01"), (1, "2026-06-01")]
+    assert [asteroid.id for asteroid in main.retrieve_from_database("approaching_asteroids_by_close_approach_date", close_approach_date="2026-01-01")] == [1, 2]
+    assert get_days() == {"2026-01-01": 2, "2026-06-01": 1}
+
+
+def test_refetched_date_replaces_its_close_approaches():
+    assert main.update_database("update_approaching_asteroids", [get_asteroid(1, "2026-01-01"), get_asteroid(2, "2026-01-01"), get_asteroid(1, "2026-06-01")], days_fetched=["2026-01-01", "2026-06-01"])
+    assert main.update_database("update_approaching_asteroids", [get_asteroid(1, "2026-01-01", miss_distance_km=5.0)], days_fetched=["2026-01-01"])
+
+    asteroids = main.retrieve_from_database("approaching_asteroids")
+    assert [(asteroid.id, asteroid.close_approach_date, asteroid.miss_distance_km) for asteroid in asteroids] == [(1, "2026-01-01", 5.0), (1, "2026-06-01", 1000000.0)]
+    assert get_days() == {"2026-01-01": 1, "2026-06-01": 1}
+
+
+def test_table_keyed_by_asteroid_id_is_migrated():
+    # Re-create the table in its original structure (keyed by asteroid ID alone), holding one record:
+    main.db.session.execute(text("DROP TABLE approaching_asteroids"))
+    main.db.session.execute(text("CREATE TABLE approaching_asteroids (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR(50) NOT NULL, absolute_magnitude_h FLOAT NOT NULL, estimated_diameter_km_min FLOAT NOT NULL, estimated_diameter_km_max FLOAT NOT NULL, is_potentially_hazardous BOOLEAN NOT NULL, close_approach_date VARCHAR(10) NOT NULL, relative_velocity_km_per_s FLOAT NOT NULL, miss_distance_km FLOAT NOT NULL, orbiting_body VARCHAR(20) NOT NULL, is_sentry_object BOOLEAN NOT NULL, url VARCHAR(500) NOT NULL)"))
+    main.db.session.execute(text("CREATE INDEX ix_approaching_asteroids_close_approach_date ON approaching_asteroids (close_approach_date)"))
+    main.db.session.execute(main.db.insert(main.ApproachingAsteroids), [get_asteroid(1, "2026-01-01")])
+    main.db.session.commit()
+
+    main.config_database_migrate_approaching_asteroids()
+
+    assert inspect(main.db.engine).get_pk_constraint("approaching_asteroids")["constrained_columns"] == ["id", "close_approach_date"]
+    assert [(asteroid.id, asteroid.close_approach_date) for asteroid in main.retrieve_from_database("approaching_asteroids")] == [(1, "2026-01-01")]
+
+    # A further close approach by the same asteroid is now kept alongside the first:
+    assert main.update_database("update_approaching_asteroids", [get_asteroid(1, "2026-06-01")], days_fetched=["2026-06-01"])
+    assert len(main.retrieve_from_database("approaching_asteroids")) == 2
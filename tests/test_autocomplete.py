@@ -0,0 +1,41 @@
+# Tests of the autocomplete endpoint: suggestions can be limited to one type, and each suggestion carries what the
+# "confirmed planets" and "constellations" pages need to select it in their listboxes.
+import pytest
+
+import main
+
+
+def get_row(planet_name, host_name, disc_year):
+    """Return a confirmed-planet row, as parsed from the API"""
+    return {"hostname": host_name, "sy_snum": 1, "sy_pnum": 1, "pl_name": planet_name, "disc_year": disc_year, "discoverymethod": "Transit", "disc_facility": "Kepler", "disc_telescope": "0.95 m Kepler Telescope"}
+
+
+@pytest.fixture(autouse=True)
+def seeded_tables(app_context):
+    """Start each test with one host star (with two planets) and one constellation"""
+    main.db.session.execute(main.db.delete(main.ConfirmedPlanets))
+    main.db.session.execute(main.db.delete(main.ConfirmedPlanetsChanges))
+    main.db.session.execute(main.db.delete(main.Constellations))
+    main.db.session.add(main.Constellations(name="Cygnus", abbreviation="Cyg", nickname="The Swan", url="", area="", myth_assoc="", first_appear="", brightest_star_name="", brightest_star_url=""))
+    main.db.session.commit()
+    assert main.update_database("update_dataset_version", "constellations", changes=["Cygnus"])
+    assert main.update_database("update_confirmed_planets", [get_row("Kepler-22 b", "Kepler-22", 2011), get_row("Kepler-22 c", "Kepler-22", 2014)], scope={"disc_year": None, "host_name": None, "modified_since": None})
+
+
+def test_suggestions_are_filtered_by_type(app):
+    client = app.test_client()
+
+    assert [suggestion["type"] for suggestion in client.get("/autocomplete?q=kepler-22").get_json()] == ["Host Star", "Planet", "Planet"]
+    assert client.get("/autocomplete?type=Planet&q=kepler-22").get_json() == [{"value": "Kepler-22 b", "type": "Planet", "discovery_year": 2011}, {"value": "Kepler-22 c", "type": "Planet", "discovery_year": 2014}]
+    assert client.get("/autocomplete?type=Constellation&q=kepler-22").get_json() == []
+
+
+def test_constellation_suggestions_match_listbox_choices(app):
+    client = app.test_client()
+    choices = main.retrieve_from_database("constellations_names_and_nicknames")
+
+    # Typing either the name or the nickname suggests the value of the constellation's listbox choice:
+    for prefix in ["cyg", "the sw"]:
+        suggestions = client.get(f"/autocomplete?type=Constellation&q={prefix}").get_json()
+        assert [suggestion["value"] for suggestion in suggestions] == ["Cygnus (The Swan)"]
+        assert suggestions[0]["value"] in choices
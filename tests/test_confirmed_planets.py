@@ -0,0 +1,177 @@
+# Tests of the "confirmed planets" dataset: the newly-confirmed view reflects the most recent full refresh (not a later
+# partial one), and on-demand refreshes of a discovery year are claimed, run in the background, and retried with backoff.
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+import main
+
+
+def get_row(planet_name, disc_year, host_name="Host"):
+    """Return a confirmed-planet row, as parsed from the API"""
+    return {"hostname": host_name, "sy_snum": 1, "sy_pnum": 1, "pl_name": planet_name, "disc_year": disc_year, "discoverymethod": "Transit", "disc_facility": "Kepler", "disc_telescope": "0.95 m Kepler Telescope"}
+
+
+def get_year_refresh(disc_year):
+    """Return the on-demand refresh details recorded for a discovery year"""
+    main.db.session.expire_all()
+    return main.db.session.get(main.ConfirmedPlanetsYearRefreshes, disc_year)
+
+
+def make_year_refresh_due(disc_year):
+    """Make the on-demand refresh of a discovery year due to be retried now"""
+    main.db.session.execute(main.db.update(main.ConfirmedPlanetsYearRefreshes).where(main.ConfirmedPlanetsYearRefreshes.discovery_year == disc_year).values(not_before=datetime.now() - timedelta(seconds=1)))
+    main.db.session.commit()
+
+
+def refresh(rows, **scope):
+    """Refresh the confirmed planets (in full, unless a scope is supplied) with the rows passed"""
+    assert main.update_database("update_confirmed_planets", rows, scope={"disc_year": None, "host_name": None, "modified_since": None} | scope)
+
+
+@pytest.fixture(autouse=True)
+def empty_tables(app_context):
+    """Start each test with empty "confirmed planets" tables"""
+    for table in (main.ConfirmedPlanets, main.ConfirmedPlanetsChanges, main.ConfirmedPlanetsYearRefreshes):
+        main.db.session.execute(main.db.delete(table))
+    main.db.session.commit()
+
+
+def test_newly_confirmed_reflects_most_recent_full_refresh():
+    refresh([get_row("Planet A", 2020)])
+    refresh([get_row("Planet A", 2020), get_row("Planet B", 2021)])
+
+    # A later refresh of a single discovery year, inserting another planet, does not replace the full refresh's changeset:
+    refresh([get_row("Planet C", 2022)], disc_year=2022)
+
+    assert [planet.planet_name for planet in main.retrieve_from_database("confirmed_planets_newly_confirmed")] == ["Planet B"]
+    assert [planet.planet_name for planet in main.retrieve_from_database("confirmed_planets")] == ["Planet A", "Planet B", "Planet C"]
+
+    # Nor does a later full refresh which inserts no planets:
+    refresh([get_row("Planet A", 2020), get_row("Planet B", 2021), get_row("Planet C", 2022, host_name="Other Host")])
+    assert [planet.planet_name for planet in main.retrieve_from_database("confirmed_planets_newly_confirmed")] == ["Planet B"]
+
+
+def test_year_refresh_is_claimed_once():
+    assert main.retrieve_from_database("confirmed_planets_year_refresh_due", disc_year=2020) == True
+    assert main.update_database("update_confirmed_planets_year_refresh_claim", 2020)
+
+    # While claimed, the refresh is neither due nor claimable again:
+    assert main.retrieve_from_database("confirmed_planets_year_refresh_due", disc_year=2020) == False
+    assert not main.update_database("update_confirmed_planets_year_refresh_claim", 2020)
+
+    # Other years are unaffected:
+    assert main.retrieve_from_database("confirmed_planets_year_refresh_due", disc_year=2021) == True
+
+
+def test_failed_year_refresh_is_retried_with_backoff(monkeypatch):
+    monkeypatch.setattr(main, "CONFIRMED_PLANETS_ON_DEMAND_RETRY_BASE_SECONDS", 60)
+    outcomes = [("Error: API request failed.", False), ("Error: API request failed.", False), ("", True)]
+    monkeypatch.setattr(main, "get_confirmed_planets", lambda disc_year=None, host_name=None, modified_since=None: outcomes.pop(0))
+
+    # The first refresh fails, and is deferred by the base delay:
+    assert main.update_database("update_confirmed_planets_year_refresh_claim", 2020)
+    main.run_confirmed_planets_year_refresh(2020)
+    year_refresh = get_year_refresh(2020)
+    assert (year_refresh.date_time_refreshed, year_refresh.failed_attempts) == (None, 1)
+    assert timedelta(seconds=55) < year_refresh.not_before - datetime.now() <= timedelta(seconds=60)
+    assert main.retrieve_from_database("confirmed_planets_year_refresh_due", disc_year=2020) == False
+
+    # The second refresh fails, and the delay doubles:
+    make_year_refresh_due(2020)
+    assert main.update_database("update_confirmed_planets_year_refresh_claim", 2020)
+    main.run_confirmed_planets_year_refresh(2020)
+    year_refresh = get_year_refresh(2020)
+    assert year_refresh.failed_attempts == 2
+    assert timedelta(seconds=115) < year_refresh.not_before - datetime.now() <= timedelta(seconds=120)
+
+    # The third refresh succeeds, and the year is not due again until the refresh interval has passed:
+    make_year_refresh_due(2020)
+    assert main.update_database("update_confirmed_planets_year_refresh_claim", 2020)
+    main.run_confirmed_planets_year_refresh(2020)
+    year_refresh = get_year_refresh(2020)
+    assert (year_refresh.failed_attempts, year_refresh.not_before) == (0, None)
+    assert year_refresh.date_time_refreshed != None
+    assert main.retrieve_from_database("confirmed_planets_year_refresh_due", disc_year=2020) == False
+
+
+def test_selecting_year_refreshes_in_background(app, monkeypatch):
+    refresh([get_row("Planet A", 2020)])
+    refreshed_years = []
+    refresh_done = threading.Event()
+
+    def get_confirmed_planets(disc_year=None, host_name=None, modified_since=None):
+        refreshed_years.append(disc_year)
+        refresh_done.set()
+        return "", True
+
+    monkeypatch.setattr(main, "get_confirmed_planets", get_confirmed_planets)
+    client = app.test_client()
+
+    # The page is served from the database, while the year is refreshed in the background:
+    response = client.post("/confirmed_planets", data={"list_discovery_year": "2020"})
+    assert response.status_code == 200 and b"Planet A" in response.data
+    assert refresh_done.wait(timeout=5)
+
+    # Selecting the year again does not refresh it again:
+    response = client.post("/confirmed_planets", data={"list_discovery_year": "2020"})
+    assert response.status_code == 200
+    assert refreshed_years == [2020]
+
+
+def test_changes_table_without_refresh_scope_is_migrated():
+    # Re-create the changes table in its original structure (no record of the refresh scope), holding one insert:
+    main.db.session.execute(text("DROP TABLE confirmed_planets_changes"))
+    main.db.session.execute(text("CREATE TABLE confirmed_planets_changes (row_id INTEGER NOT NULL PRIMARY KEY, planet_name VARCHAR(50) NOT NULL, change_type VARCHAR(10) NOT NULL, changed_columns VARCHAR(250) NOT NULL, date_time_refreshed DATETIME NOT NULL)"))
+    main.db.session.execute(text("INSERT INTO confirmed_planets_changes (planet_name, change_type, changed_columns, date_time_refreshed) VALUES ('Planet A', 'insert', '', '2026-01-01 00:00:00.000000')"))
+    main.db.session.commit()
+    refresh([get_row("Planet A", 2020)], disc_year=2020)
+
+    main.config_database_migrate_confirmed_planets_changes()
+
+    # The existing changeset is deemed to be from a full refresh:
+    assert [planet.planet_name for planet in main.retrieve_from_database("confirmed_planets_newly_confirmed")] == ["Planet A"]
+
+
+def test_refresh_is_applied_chunk_by_chunk(monkeypatch):
+    monkeypatch.setattr(main, "CONFIRMED_PLANETS_CHUNK_SIZE", 2)
+    refresh([get_row("Planet A", 2020), get_row("Planet B", 2020), get_row("Planet C", 2020)])
+    transactions_open = []
+
+    def get_rows():
+        # Record, as each row is received, whether a transaction is held open meanwhile:
+        for row in [get_row("Planet A", 2019), get_row("Planet C", 2020), get_row("Planet D", 2021), get_row("Planet A", 2018), get_row("Planet E", 2021)]:
+            transactions_open.append(main.db.session().in_transaction())
+            yield row
+
+    refresh(get_rows())
+
+    assert transactions_open == [False] * 5
+    assert [(planet.planet_name, planet.discovery_year) for planet in main.retrieve_from_database("confirmed_planets")] == [("Planet A", 2019), ("Planet C", 2020), ("Planet D", 2021), ("Planet E", 2021)]
+    main.db.session.rollback()
+    assert sorted((change.planet_name, change.change_type) for change in main.db.session.execute(main.db.select(main.ConfirmedPlanetsChanges)).scalars()) == [("Planet A", "update"), ("Planet B", "delete"), ("Planet D", "insert"), ("Planet E", "insert")]
+
+
+def test_interrupted_refresh_keeps_version_and_search_index_current(monkeypatch):
+    monkeypatch.setattr(main, "CONFIRMED_PLANETS_CHUNK_SIZE", 2)
+    refresh([get_row("Planet A", 2020)])
+    main.db.session.rollback()
+    version = main.db.session.get(main.DatasetVersions, "confirmed_planets").version
+
+    def get_rows():
+        # The download fails after the first chunk has been received:
+        yield get_row("Planet A", 2019)
+        yield get_row("Planet B", 2020)
+        raise ConnectionError("Download interrupted")
+
+    assert main.update_database("update_confirmed_planets", get_rows(), scope={"disc_year": None, "host_name": None, "modified_since": None}) == False
+
+    # The first chunk remains applied, and both the dataset's version and the full-text search index reflect it:
+    main.db.session.rollback()
+    assert [(planet.planet_name, planet.discovery_year) for planet in main.retrieve_from_database("confirmed_planets")] == [("Planet A", 2019), ("Planet B", 2020)]
+    main.db.session.rollback()
+    assert main.db.session.get(main.DatasetVersions, "confirmed_planets").version == version + 1
+    fts_table = main.search_index_attributes["confirmed_planets"]["fts_table"]
+    assert main.db.session.execute(text(f"SELECT COUNT(*) FROM {fts_table} WHERE {fts_table} MATCH '\"Planet B\"'")).scalar() == 1
@@ -0,0 +1,142 @@
+# Tests of the contact outbox: messages queued from the "Contact Us" page are e-mailed by the outbox sender to a local
+# SMTP stand-in (aiosmtpd), and failed sends are retried with backoff until their attempts are exhausted.
+import socket
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from aiosmtpd.controller import Controller
+
+import main
+
+
+class SMTPStandIn:
+    """Handler for the local SMTP server, recording the messages it accepts and rejecting as many as it is told to"""
+    def __init__(self):
+        self.messages = []
+        self.attempts = 0
+        self.failures_to_give = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.attempts += 1
+        if self.failures_to_give > 0:
+            self.failures_to_give -= 1
+            return "451 Requested action aborted: local error in processing"
+        self.messages.append(envelope.content.decode("utf8", errors="replace"))
+        return "250 Message accepted for delivery"
+
+
+def get_free_port():
+    """Return a free TCP port on the local host"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def get_outbox():
+    """Return all messages in the contact outbox, in the order queued"""
+    main.db.session.expire_all()
+    return main.db.session.execute(main.db.select(main.ContactOutbox).order_by(main.ContactOutbox.row_id)).scalars().all()
+
+
+def make_outbox_due():
+    """Make every message in the contact outbox due to be (re)sent now"""
+    main.db.session.execute(main.db.update(main.ContactOutbox).values(not_before=datetime.now() - timedelta(seconds=1)))
+    main.db.session.commit()
+
+
+def queue_message(name, email, message):
+    """Queue a message in the contact outbox, as submitted from the "Contact Us" page"""
+    form = SimpleNamespace(txt_name=SimpleNamespace(data=name), txt_email=SimpleNamespace(data=email), txt_message=SimpleNamespace(data=message))
+    assert main.email_from_contact_page(form)
+
+
+@pytest.fixture
+def smtp_server(app_context, monkeypatch):
+    """Start a local SMTP stand-in, point the outbox sender at it, and start each test with an empty outbox"""
+    main.db.session.execute(main.db.delete(main.ContactOutbox))
+    main.db.session.commit()
+
+    handler = SMTPStandIn()
+    controller = Controller(handler, hostname="127.0.0.1", port=get_free_port())
+    controller.start()
+    monkeypatch.setattr(main, "SENDER_PORT", str(controller.port))
+    yield handler
+    controller.stop()
+
+
+@pytest.fixture
+def sender():
+    """Provide the outbox sender's connection state, closing any connection left open by the test"""
+    sender = {"connection": None, "time_last_used": 0}
+    yield sender
+    if sender["connection"] != None:
+        main.close_smtp_connection(sender["connection"])
+
+
+def test_queued_messages_are_delivered(smtp_server, sender):
+    queue_message("Ann", "ann@example.com", "Hello from Ann")
+    queue_message("Bob", "bob@example.com", "Hello from Bob")
+
+    # Both messages are sent in one batch (which is not full, so no more are waiting):
+    assert main.send_contact_outbox_batch(sender) is False
+
+    assert len(smtp_server.messages) == 2
+    assert "Name: Ann" in smtp_server.messages[0] and "Hello from Ann" in smtp_server.messages[0]
+    assert "Name: Bob" in smtp_server.messages[1] and "Hello from Bob" in smtp_server.messages[1]
+    assert [(message.status, message.attempts) for message in get_outbox()] == [("sent", 0), ("sent", 0)]
+    assert all(message.date_time_sent != None for message in get_outbox())
+
+    # Nothing is left to send:
+    assert main.send_contact_outbox_batch(sender) is False
+    assert smtp_server.attempts == 2
+
+
+def test_failed_send_is_retried_with_backoff(smtp_server, sender, monkeypatch):
+    monkeypatch.setattr(main, "CONTACT_OUTBOX_RETRY_BASE_SECONDS", 60)
+    smtp_server.failures_to_give = 2
+    queue_message("Ann", "ann@example.com", "Hello from Ann")
+
+    # The first attempt fails, and the message is deferred by the base delay:
+    main.send_contact_outbox_batch(sender)
+    message = get_outbox()[0]
+    assert (message.status, message.attempts) == ("pending", 1)
+    assert "451" in message.last_error
+    assert timedelta(seconds=55) < message.not_before - datetime.now() <= timedelta(seconds=60)
+
+    # Until the delay has passed, the message is not retried:
+    main.send_contact_outbox_batch(sender)
+    assert smtp_server.attempts == 1
+
+    # The second attempt fails, and the delay doubles:
+    make_outbox_due()
+    main.send_contact_outbox_batch(sender)
+    message = get_outbox()[0]
+    assert (message.status, message.attempts) == ("pending", 2)
+    assert timedelta(seconds=115) < message.not_before - datetime.now() <= timedelta(seconds=120)
+
+    # The third attempt succeeds:
+    make_outbox_due()
+    main.send_contact_outbox_batch(sender)
+    message = get_outbox()[0]
+    assert message.status == "sent"
+    assert len(smtp_server.messages) == 1 and "Hello from Ann" in smtp_server.messages[0]
+
+
+def test_message_fails_after_max_attempts(smtp_server, sender, monkeypatch):
+    monkeypatch.setattr(main, "CONTACT_OUTBOX_MAX_ATTEMPTS", 3)
+    smtp_server.failures_to_give = 10
+    queue_message("Ann", "ann@example.com", "Hello from Ann")
+
+    for attempt in range(1, 4):
+        make_outbox_due()
+        main.send_contact_outbox_batch(sender)
+        message = get_outbox()[0]
+        assert message.attempts == attempt
+        assert message.status == ("failed" if attempt == 3 else "pending")
+
+    # A failed message is not retried again:
+    make_outbox_due()
+    main.send_contact_outbox_batch(sender)
+    assert smtp_server.attempts == 3
+    assert smtp_server.messages == []
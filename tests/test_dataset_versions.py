@@ -0,0 +1,86 @@
+# Tests of dataset versions: a refresh increments a dataset's version only if it changed the dataset, deriving the content
+# hash from the changes applied (or the content loaded) rather than by re-reading the dataset's table.
+import pytest
+from sqlalchemy import event
+
+import main
+
+
+def get_dataset_version(scope):
+    """Return the version details recorded for a dataset (as committed since the test's last read)"""
+    main.db.session.rollback()
+    return main.db.session.get(main.DatasetVersions, scope)
+
+
+def get_row(planet_name, disc_year):
+    """Return a confirmed-planet row, as parsed from the API"""
+    return {"hostname": "Host", "sy_snum": 1, "sy_pnum": 1, "pl_name": planet_name, "disc_year": disc_year, "discoverymethod": "Transit", "disc_facility": "Kepler", "disc_telescope": "0.95 m Kepler Telescope"}
+
+
+def refresh_confirmed_planets(rows):
+    """Refresh the confirmed planets in full with the rows passed"""
+    assert main.update_database("update_confirmed_planets", rows, scope={"disc_year": None, "host_name": None, "modified_since": None})
+
+
+@pytest.fixture(autouse=True)
+def empty_tables(app_context):
+    """Start each test with empty "confirmed planets" tables"""
+    main.db.session.execute(main.db.delete(main.ConfirmedPlanets))
+    main.db.session.execute(main.db.delete(main.ConfirmedPlanetsChanges))
+    main.db.session.commit()
+
+
+@pytest.fixture
+def statements(app_context):
+    """Capture the SQL statements executed while the test runs"""
+    statements = []
+    listener = lambda connection, cursor, statement, parameters, context, executemany: statements.append(statement)
+    event.listen(main.db.engine, "before_cursor_execute", listener)
+    yield statements
+    event.remove(main.db.engine, "before_cursor_execute", listener)
+
+
+def test_version_changes_only_with_content():
+    refresh_confirmed_planets([get_row("Planet A", 2020)])
+    version = get_dataset_version("confirmed_planets").version
+
+    # Refreshing identical content leaves the version as is:
+    refresh_confirmed_planets([get_row("Planet A", 2020)])
+    assert get_dataset_version("confirmed_planets").version == version
+
+    # Inserting, updating, and deleting planets each increment it:
+    refresh_confirmed_planets([get_row("Planet A", 2020), get_row("Planet B", 2021)])
+    assert (get_dataset_version("confirmed_planets").version, get_dataset_version("confirmed_planets").row_count) == (version + 1, 2)
+    refresh_confirmed_planets([get_row("Planet A", 2019), get_row("Planet B", 2021)])
+    assert get_dataset_version("confirmed_planets").version == version + 2
+    refresh_confirmed_planets([get_row("Planet B", 2021)])
+    assert (get_dataset_version("confirmed_planets").version, get_dataset_version("confirmed_planets").row_count) == (version + 3, 1)
+
+
+def test_version_is_derived_without_reading_table(statements):
+    refresh_confirmed_planets([get_row("Planet A", 2020)])
+    statements.clear()
+
+    main.update_dataset_version("confirmed_planets", changes=[{"planet_name": "Planet B", "change_type": "insert"}])
+    main.db.session.commit()
+
+    # Only the row count is read from the dataset's table:
+    assert [statement for statement in statements if "FROM confirmed_planets" in statement and not "count(*)" in statement] == []
+
+
+def test_replaced_content_is_hashed_in_content_order():
+    records = [{"name": "Andromeda", "abbreviation": "And"}, {"name": "Aquila", "abbreviation": "Aql"}]
+    main.update_dataset_version("constellations", changes=records, replaces_content=True)
+    main.db.session.commit()
+    dataset_version = get_dataset_version("constellations")
+    version, content_hash = dataset_version.version, dataset_version.content_hash
+
+    # Reloading the same content, in a different order, yields the same hash (and version):
+    main.update_dataset_version("constellations", changes=list(reversed(records)), replaces_content=True)
+    main.db.session.commit()
+    assert (get_dataset_version("constellations").version, get_dataset_version("constellations").content_hash) == (version, content_hash)
+
+    # Different content yields a new version:
+    main.update_dataset_version("constellations", changes=records[:1], replaces_content=True)
+    main.db.session.commit()
+    assert get_dataset_version("constellations").version == version + 1
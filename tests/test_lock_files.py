@@ -0,0 +1,100 @@
+# Tests of lock files (used to coordinate the processes serving this website): a lock file is held by one claim at a time,
+# across threads and processes, and is released when its holding process ends (even without releasing it).
+import os
+import subprocess
+import sys
+import threading
+
+import main
+
+# Code run by each of several processes, incrementing the counter in the file passed (while holding the lock file passed):
+WORKER_INCREMENT = """
+import sys, time
+import main
+for i in range(25):
+    lock_token, has_waited = main.claim_lock_file(sys.argv[1], 60)
+    with open(sys.argv[2]) as f:
+        count = int(f.read())
+    time.sleep(0.001)
+    with open(sys.argv[2], "w") as f:
+        f.write(str(count + 1))
+    main.release_lock_file(lock_token)
+"""
+
+# Code run by a process claiming the lock file passed, then waiting (without releasing it) until ended:
+WORKER_HOLD = """
+import sys, time
+import main
+lock_token, has_waited = main.claim_lock_file(sys.argv[1], 60)
+print("claimed", flush=True)
+time.sleep(120)
+"""
+
+
+def start_worker(code, *args):
+    """Start a process running the code passed (with the arguments passed)"""
+    environment = os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.Popen([sys.executable, "-c", code, *args], env=environment, stdout=subprocess.PIPE, text=True)
+
+
+def test_claim_and_release(tmp_path):
+    lock_file_path = str(tmp_path / "test.lock")
+
+    lock_token, has_waited = main.claim_lock_file(lock_file_path, 60)
+    assert lock_token != None and not has_waited
+    main.release_lock_file(lock_token)
+
+    # Once released, the lock file can be claimed again without waiting:
+    lock_token, has_waited = main.claim_lock_file(lock_file_path, 60)
+    assert lock_token != None and not has_waited
+    main.release_lock_file(lock_token)
+
+
+def test_claim_waits_for_release(tmp_path):
+    lock_file_path = str(tmp_path / "test.lock")
+    lock_token, has_waited = main.claim_lock_file(lock_file_path, 60)
+    threading.Timer(0.3, main.release_lock_file, args=(lock_token,)).start()
+
+    other_lock_token, has_waited = main.claim_lock_file(lock_file_path, 60)
+    assert other_lock_token != None and has_waited
+    main.release_lock_file(other_lock_token)
+
+
+def test_claim_is_abandoned_after_allowance(tmp_path):
+    lock_file_path = str(tmp_path / "test.lock")
+    lock_token, has_waited = main.claim_lock_file(lock_file_path, 60)
+
+    assert main.claim_lock_file(lock_file_path, 0.3) == (None, True)
+    main.release_lock_file(lock_token)
+
+
+def test_claims_exclude_each_other_across_processes(tmp_path):
+    lock_file_path = str(tmp_path / "test.lock")
+    counter_file_path = str(tmp_path / "counter.txt")
+    with open(counter_file_path, "w") as f:
+        f.write("0")
+
+    workers = [start_worker(WORKER_INCREMENT, lock_file_path, counter_file_path) for i in range(4)]
+    for worker in workers:
+        worker.communicate(timeout=120)
+        assert worker.returncode == 0
+
+    # No increment was lost to another process's concurrent one:
+    with open(counter_file_path) as f:
+        assert int(f.read()) == 4 * 25
+
+
+def test_lock_is_released_when_holding_process_ends(tmp_path):
+    lock_file_path = str(tmp_path / "test.lock")
+    worker = start_worker(WORKER_HOLD, lock_file_path)
+    assert worker.stdout.readline().strip() == "claimed"
+
+    # While the process holds the lock file, it cannot be claimed:
+    assert main.claim_lock_file(lock_file_path, 0.3) == (None, True)
+
+    # Once the process ends (without releasing the lock file), it can be claimed without waiting:
+    worker.kill()
+    worker.wait()
+    lock_token, has_waited = main.claim_lock_file(lock_file_path, 60)
+    assert lock_token != None and not has_waited
+    main.release_lock_file(lock_token)
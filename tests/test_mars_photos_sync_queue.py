@@ -0,0 +1,55 @@
+# Tests of the Mars photos sync queue: a rover/earth date combo which failed (after exhausting its attempts) stays failed
+# across runs, unless its manifest details change or an administrator requests a re-attempt.
+import pytest
+
+import main
+
+COMBO = "Curiosity_2024-01-05"
+
+
+def get_photos_available(total_photos):
+    """Return the photos available (per the rover's manifest) for the combo"""
+    return {COMBO: {"rover_name": "Curiosity", "sol": 4, "earth_date": "2024-01-05", "cameras": "NAVCAM", "total_photos": total_photos}}
+
+
+def get_queued_combo():
+    """Return the combo's record in the sync queue"""
+    main.db.session.rollback()
+    return main.db.session.get(main.MarsPhotosSyncQueue, COMBO)
+
+
+def queue_combo(total_photos, **kwargs):
+    """Merge the combo (as new to the photo details) into the sync queue"""
+    assert main.update_database("update_mars_photos_sync_queue", {"new": [COMBO], "grown": [], "shrunk": [], "removed": []}, photos_available=get_photos_available(total_photos), **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def failed_combo(app_context):
+    """Start each test with the combo queued, and failed after exhausting its attempts"""
+    main.db.session.execute(main.db.delete(main.MarsPhotosSyncQueue))
+    main.db.session.commit()
+    queue_combo(10)
+    assert main.update_database("update_mars_photos_sync_queue_item", {}, rover_earth_date_combo=COMBO, status="failed", attempts=main.MARS_PHOTOS_SYNC_MAX_ATTEMPTS, last_error="API request failed (HTTP 500).")
+
+
+def test_failed_combo_is_not_reattempted_by_next_run():
+    queue_combo(10)
+
+    combo = get_queued_combo()
+    assert (combo.status, combo.attempts) == ("failed", main.MARS_PHOTOS_SYNC_MAX_ATTEMPTS)
+    assert main.retrieve_from_database("mars_photos_sync_queue") == []
+
+
+def test_failed_combo_is_reattempted_if_manifest_changed():
+    queue_combo(12)
+
+    combo = get_queued_combo()
+    assert (combo.status, combo.attempts, combo.total_photos_expected) == ("pending", 0, 12)
+    assert [combo.rover_earth_date_combo for combo in main.retrieve_from_database("mars_photos_sync_queue")] == [COMBO]
+
+
+def test_failed_combo_is_reattempted_on_request():
+    queue_combo(10, retry_failed=True)
+
+    combo = get_queued_combo()
+    assert (combo.status, combo.attempts) == ("pending", 0)
@@ -0,0 +1,64 @@
+# Tests of rate limiting: tokens taken from the shared buckets (in the database) by several threads or processes at once
+# never exceed the buckets' capacity, and a client exceeding an inbound limit is throttled (whether the inbound buckets are
+# kept in-process or shared).
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import main
+
+LIMITS = [(30, 3600)]
+
+# Code run by each of several processes, taking tokens from the shared buckets of the "test_api" key and printing the number taken:
+WORKER = """
+import main
+main.create_app()
+print(sum(1 for i in range(20) if main.get_rate_limit_token("test_api", limits=[(30, 3600)]) == 0))
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_tables(app_context):
+    """Start each test with no rate-limit buckets"""
+    main.db.session.execute(main.db.delete(main.RateLimitBuckets))
+    main.db.session.commit()
+    main.rate_limit_buckets.clear()
+
+
+def test_shared_buckets_hold_across_threads():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        wait_seconds = list(executor.map(lambda i: main.get_rate_limit_token("test_api", limits=LIMITS), range(80)))
+
+    assert wait_seconds.count(0) == 30
+    assert all(seconds > 0 for seconds in wait_seconds if seconds != 0)
+
+
+def test_shared_buckets_hold_across_processes():
+    environment = os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)}
+    workers = [subprocess.Popen([sys.executable, "-c", WORKER], env=environment, stdout=subprocess.PIPE, text=True) for i in range(4)]
+    tokens_taken = [int(worker.communicate(timeout=120)[0].split()[-1]) for worker in workers]
+
+    assert sum(tokens_taken) == 30
+
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_inbound_limit_throttles_client(app, monkeypatch, shared):
+    monkeypatch.setattr(main, "INBOUND_RATE_LIMITS_SHARED", shared)
+    client = app.test_client()
+    capacity = main.inbound_rate_limits["contact"][0][0]
+    client_address = "2001:0db8:85a3:0000:0000:8a2e:0370:7334"
+
+    status_codes = [client.post("/contact", data={}, environ_base={"REMOTE_ADDR": client_address}).status_code for i in range(capacity + 1)]
+    assert status_codes == [200] * capacity + [429]
+
+    # Other clients are unaffected:
+    assert client.post("/contact", data={}, environ_base={"REMOTE_ADDR": "192.0.2.1"}).status_code == 200
+
+    # The buckets are keyed within the bucket key column's length, whatever the client address's length:
+    keys = [key for key, period_seconds in main.rate_limit_buckets] if not shared else main.db.session.execute(main.db.select(main.RateLimitBuckets.api_name)).scalars().all()
+    assert len(keys) == 2 * len(main.inbound_rate_limits["contact"])
+    assert all(len(key) <= main.RateLimitBuckets.__table__.c.api_name.type.length for key in keys)
@@ -0,0 +1,25 @@
+# Tests of full-reload refreshes: a table can be refreshed in full repeatedly, whether via a staging table swapped in (SQLite)
+# or via replacing the table's contents in place (other databases).
+import pytest
+from sqlalchemy import inspect
+
+import main
+
+
+def get_constellations_data(nicknames):
+    """Return the constellation details, as parsed from the source, for constellations with the nicknames passed"""
+    return {f"Constellation {i}": {"abbreviation": f"C{i}", "nickname": nickname, "url": "", "area": "", "myth_assoc": "", "first_appear": "", "brightest_star_name": "", "brightest_star_url": ""} for i, nickname in enumerate(nicknames)}
+
+
+@pytest.mark.parametrize("dialect_name", ["sqlite", "postgresql"])
+def test_table_can_be_refreshed_repeatedly(app_context, monkeypatch, dialect_name):
+    # Take the in-place path (as used outside SQLite) if requested:
+    monkeypatch.setattr(main.db.engine.dialect, "name", dialect_name)
+
+    for nicknames in [["The Swan", "The Lyre"], ["The Eagle"], ["The Swan", "The Lyre", "The Eagle"]]:
+        assert main.update_database("update_constellations", get_constellations_data(nicknames))
+        main.db.session.rollback()
+        assert sorted(main.db.session.execute(main.db.select(main.Constellations.nickname)).scalars().all()) == sorted(nicknames)
+
+    # No staging table is left behind:
+    assert not inspect(main.db.engine).has_table("constellations_staging")
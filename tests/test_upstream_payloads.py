@@ -0,0 +1,39 @@
+# Tests of upstream payloads: a successful request is recorded as the upstream's last known good payload (and served when
+# the upstream later fails) only for upstreams which fall back to it.
+import pytest
+
+import main
+
+
+def get_recorded_payload(upstream_name):
+    """Return the last known good payload recorded for an upstream (or None)"""
+    upstream_payload = main.retrieve_from_database("upstream_payload", upstream_name=upstream_name)
+    return None if upstream_payload in [None, {}] else upstream_payload.payload
+
+
+@pytest.fixture(autouse=True)
+def empty_tables(app_context):
+    """Start each test with no recorded payloads, and the upstreams' circuits closed"""
+    main.db.session.execute(main.db.delete(main.UpstreamPayloads))
+    main.db.session.commit()
+    main.circuit_breakers.clear()
+
+
+def test_payload_is_recorded_and_served_as_fallback():
+    assert main.get_upstream_payload("people_in_space_now", lambda: {"number": 7}) == ({"number": 7}, None, "")
+    assert get_recorded_payload("people_in_space_now") == {"number": 7}
+
+    # When the upstream fails, the recorded payload is served, along with the date/time it was fetched:
+    payload, date_time_fetched, error_message = main.get_upstream_payload("people_in_space_now", lambda: None)
+    assert (payload, error_message) == ({"number": 7}, "")
+    assert date_time_fetched != None
+
+
+def test_payload_is_not_recorded_without_fallback():
+    assert main.get_upstream_payload("space_news", lambda: [{"id": 1}], use_last_known_good=False) == ([{"id": 1}], None, "")
+    assert get_recorded_payload("space_news") == None
+
+    # When the upstream fails, there is nothing to fall back to:
+    payload, date_time_fetched, error_message = main.get_upstream_payload("space_news", lambda: None, use_last_known_good=False)
+    assert (payload, date_time_fetched) == (None, None)
+    assert error_message != ""
@@ -0,0 +1,15 @@
+# Production entry point for this website, to be served by a WSGI server with one or more worker processes, e.g.:
+#     gunicorn --workers 4 --bind 0.0.0.0:8000 wsgi:app
+# NOTE: Do not preload the app. (e.g., gunicorn's "--preload" option), as each worker process must create its own database
+# connections and background threads.
+import os
+
+# Run headless (no desktop dialogs), as there is no desktop session under a WSGI server:
+os.environ.setdefault("HEADLESS", "true")
+
+from main import create_app
+
+# Create the Flask app. object to be served.  If its configuration failed, stop (details are in the system log):
+app = create_app()
+if app == None:
+    raise RuntimeError("The application could not be created. Please see the system log for details.")